@@ -0,0 +1,47 @@
+"""
+Compare building ad squads from decoded rows with ``AdSquad.from_json_many``
+(compiled deserializers) against the per-key ``setattr`` loop entity classes
+used before.
+
+Usage: python benchmarks/bench_deserialize.py [rows]
+"""
+import gc
+import os
+import sys
+import time
+import typing
+
+# run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.objects.ad_squads import AdSquad
+from tests.test_deserialize import ROW, legacy_from_json
+
+def best_of(fn: typing.Callable[[], typing.Any], repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        # keep collector pauses from the allocations out of the timings
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return min(timings)
+
+def main() -> None:
+    rows = [dict(ROW, id=str(i)) for i in range(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)]
+    client = SnapchatMarketing(access_token='test_token')
+
+    legacy = best_of(lambda: [legacy_from_json(AdSquad, client, row) for row in rows])
+    compiled = best_of(lambda: AdSquad.from_json_many(client, rows))
+
+    print(f'{len(rows)} ad squads')
+    print(f'{"setattr loop":<26} {legacy * 1000:8.1f} ms')
+    print(f'{"AdSquad.from_json_many":<26} {compiled * 1000:8.1f} ms  ({legacy / compiled:.1f}x)')
+
+if __name__ == '__main__':
+    main()
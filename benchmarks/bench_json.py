@@ -0,0 +1,79 @@
+"""
+Compare decoding a large ad squad listing with ``requests.Response.json()``
+against each available codec in :mod:`pysnapchatads.codec`.
+
+Usage: python benchmarks/bench_json.py [rows]
+"""
+import gc
+import os
+import sys
+import json
+import time
+import typing
+import requests
+
+# run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pysnapchatads import codec as codecs
+
+def make_listing(rows: int) -> bytes:
+    ad_squad = {
+        'id': '00000000-0000-0000-0000-000000000000',
+        'campaign_id': '11111111-1111-1111-1111-111111111111',
+        'name': 'Ad Squad',
+        'status': 'ACTIVE',
+        'type': 'SNAP_ADS',
+        'bid_micro': 1000000,
+        'daily_budget_micro': 50000000,
+        'optimization_goal': 'IMPRESSIONS',
+        'targeting': {
+            'regulated_content': False,
+            'geos': [{'country_code': 'us', 'region_id': [str(i) for i in range(40)]}],
+            'demographics': [{'min_age': '18', 'max_age': '35+', 'languages': ['en', 'es']}],
+            'segments': [{'segment_id': [str(10_000 + i) for i in range(60)], 'operation': 'INCLUDE'}],
+            'devices': [{'os_type': 'iOS', 'os_version_min': '14.0'}]
+        },
+        'placement_v2': {'config': 'AUTOMATIC'},
+        'created_at': '2023-01-01T00:00:00.000Z',
+        'updated_at': '2023-01-01T00:00:00.000Z'
+    }
+    listing = {
+        'request_status': 'SUCCESS',
+        'adsquads': [{'sub_request_status': 'SUCCESS', 'adsquad': dict(ad_squad, id=str(i))} for i in range(rows)]
+    }
+    return json.dumps(listing).encode('utf-8')
+
+def best_of(fn: typing.Callable[[], typing.Any], repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        # keep collector pauses from large allocations out of the decode timings
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return min(timings)
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    body = make_listing(rows)
+
+    response = requests.Response()
+    response._content = body
+    response.encoding = 'utf-8'
+
+    print(f'{rows} ad squads, {len(body) / 1e6:.1f} MB')
+    baseline = best_of(response.json)
+    print(f'{"requests.Response.json()":<26} {baseline * 1000:8.1f} ms')
+
+    for name in sorted(codecs.CODECS):
+        json_codec = codecs.get_codec(name)
+        decode = best_of(lambda: json_codec.loads(body))
+        print(f'{name + ".loads(bytes)":<26} {decode * 1000:8.1f} ms  ({baseline / decode:.1f}x)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Measure the memory retained per entity when a decoded listing is held as
+entity objects: the compact (slotted, interned) entity classes against the
+same fields in a per-instance ``__dict__`` (the previous layout).
+
+Rows are decoded from JSON, like API responses, so every entity starts with
+its own copy of each string value; the decoded rows are then dropped and
+what the entities keep alive is measured.
+
+Usage: python benchmarks/bench_memory.py [rows]
+"""
+import gc
+import os
+import sys
+import json
+import typing
+import tracemalloc
+
+# run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pysnapchatads.snapchat as snap
+from pysnapchatads.objects.ad_squads import AdSquad
+from pysnapchatads.objects.campaigns import Campaign
+
+class DictEntity(object):
+    """Fields in an instance ``__dict__``, as entity classes stored them before."""
+
+    def __init__(self, api_client: typing.Any, **kwargs: typing.Any) -> None:
+        self.api_client = api_client
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+def ad_squad_row(i: int) -> typing.Dict[str, typing.Any]:
+    """A typical API ad squad; optional fields vary between rows as they do in real listings."""
+    row: typing.Dict[str, typing.Any] = {
+        'id': f'{i:08d}-0000-0000-0000-000000000000',
+        'updated_at': f'2023-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}.000Z',
+        'created_at': '2023-01-01T00:00:00.000Z',
+        'name': f'Ad Squad {i}',
+        'status': 'ACTIVE',
+        'campaign_id': f'{i // 50:08d}-1111-1111-1111-111111111111',
+        'adsquad_type': 'SNAP_ADS',
+        'targeting': {},
+        'placement_v2': {'config': 'AUTOMATIC'},
+        'billing_event': 'IMPRESSION',
+        'auto_bid': True,
+        'target_bid': False,
+        'bid_strategy': 'AUTO_BID',
+        'optimization_goal': 'IMPRESSIONS',
+        'delivery_constraint': 'DAILY_BUDGET',
+        'pacing_type': 'STANDARD',
+        'child_ad_type': 'REMOTE_WEBPAGE',
+        'forced_view_setting': 'NONE',
+        'start_time': '2023-01-01T00:00:00.000Z',
+        'delivery_status': ['VALID']
+    }
+    row.pop('auto_bid'), row.pop('target_bid'), row.pop('delivery_status')  # not modeled by AdSquad
+    if i % 2:
+        row['daily_budget_micro'] = 50000000
+    else:
+        row['lifetime_budget_micro'] = 500000000
+    if i % 3 == 0:
+        row['end_time'] = '2023-02-01T00:00:00.000Z'
+    if i % 5 == 0:
+        row['pixel_id'] = '22222222-2222-2222-2222-222222222222'
+    row['bid_micro'] = 1000000
+    return row
+
+def campaign_row(i: int) -> typing.Dict[str, typing.Any]:
+    row: typing.Dict[str, typing.Any] = {
+        'id': f'{i:08d}-0000-0000-0000-000000000000',
+        'updated_at': f'2023-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}.000Z',
+        'created_at': '2023-01-01T00:00:00.000Z',
+        'name': f'Campaign {i}',
+        'ad_account_id': f'{i // 500:08d}-1111-1111-1111-111111111111',
+        'status': 'ACTIVE',
+        'objective': 'BRAND_AWARENESS',
+        'start_time': '2023-01-01T00:00:00.000Z',
+        'buy_model': 'AUCTION'
+    }
+    if i % 2:
+        row['daily_budget_micro'] = 50000000
+    if i % 3 == 0:
+        row['end_time'] = '2023-02-01T00:00:00.000Z'
+    row['delivery_status'] = 'VALID'
+    return row
+
+def bytes_per_entity(build: typing.Callable[[typing.Dict[str, typing.Any]], typing.Any], body: bytes) -> float:
+    gc.collect()
+    tracemalloc.start()
+    rows = json.loads(body)
+    entities = [build(row) for row in rows]
+    del rows
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding the entities is the same size in both layouts
+    return (retained - sys.getsizeof(entities)) / len(entities)
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    api_client = snap.SnapchatMarketing(access_token='benchmark')
+
+    for entity_class, make_row in ((AdSquad, ad_squad_row), (Campaign, campaign_row)):
+        data = [make_row(i) for i in range(rows)]
+        body = json.dumps(data).encode('utf-8')
+        compact = bytes_per_entity(lambda row: entity_class(api_client=api_client, **row), body)
+        # a class per entity type, so instances share dict keys like the old classes did
+        dict_class = type(f'Dict{entity_class.__name__}', (DictEntity,), {})
+        dicts = bytes_per_entity(lambda row: dict_class(api_client, **row), body)
+        print(f'{entity_class.__name__:<10} {rows} entities, {len(data[0])}-{len(data[1])} fields set')
+        print(f'  {"__dict__":<9} {dicts:8.0f} bytes/entity')
+        print(f'  {"compact":<9} {compact:8.0f} bytes/entity  ({dicts / compact:.1f}x smaller)')
+
+if __name__ == '__main__':
+    main()
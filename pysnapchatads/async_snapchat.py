@@ -0,0 +1,444 @@
+from __future__ import absolute_import, annotations, print_function, unicode_literals, with_statement
+import asyncio
+import aiohttp
+import typing
+
+from pysnapchatads.helpers import build_url, build_params, unwrap_page
+import pysnapchatads.codec as codecs
+import pysnapchatads.identity as identity
+import pysnapchatads.coalesce as coalescing
+import pysnapchatads.tokens as tokens
+import pysnapchatads.objects.user as user
+import pysnapchatads.errors as errors
+import pysnapchatads.objects.organizations as orgs
+import pysnapchatads.objects.ad_accounts as ad_accountz
+
+class AsyncSnapchatMarketing(object):
+    """
+    Asyncio client for Snapchat Marketing API Access.
+
+    Mirrors the API patterns of :class:`pysnapchatads.snapchat.SnapchatMarketing` as coroutines,
+    so many requests can be kept in flight from a single process. At most ``max_concurrency``
+    requests are in flight at any time.
+
+    The underlying ``aiohttp.ClientSession`` is created lazily inside the running event loop;
+    use the client as an async context manager or call :meth:`close` when done.
+    """
+
+    def __init__(
+            self,
+            access_token: str,
+            proxy: typing.Optional[str] = None,
+            max_concurrency: int = 100,
+            codec: typing.Optional[codecs.JSONCodec] = None,
+            identity_map: bool = False,
+            coalesce_requests: bool = False,
+            token_manager: typing.Optional[tokens.TokenManager] = None
+        ) -> None:
+
+        self.access_token: str = access_token
+        self.BASE_URL: str = 'https://adsapi.snapchat.com/v1'
+        self.proxy: typing.Optional[str] = proxy
+        self.max_concurrency: int = max_concurrency
+        self.codec: codecs.JSONCodec = codec if codec is not None else codecs.get_codec()
+        self.identity_map: typing.Optional[identity.IdentityMap] = identity.IdentityMap() if identity_map else None
+        """With ``identity_map=True``, one live object per entity: reading an entity again updates the object already held in place."""
+        self.single_flight: typing.Optional[coalescing.AsyncSingleFlight] = coalescing.AsyncSingleFlight() if coalesce_requests else None
+        """With ``coalesce_requests=True``, shares one request among concurrent identical GETs; ``single_flight.stats.coalesced`` counts the calls that joined one."""
+        self.token_manager: typing.Optional[tokens.TokenManager] = token_manager
+        """Optional manager refreshing the access token before it expires; requests rejected with a 401 are sent once more."""
+
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+        self._semaphore: typing.Optional[asyncio.Semaphore] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        The aiohttp session, created on first use so it binds to the running event loop.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={'Authorization': f'Bearer {self.access_token}'},
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the underlying aiohttp session.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> AsyncSnapchatMarketing:
+        return self
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        await self.close()
+
+    async def _request(
+            self,
+            method: str,
+            url: str,
+            params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+            json: typing.Optional[typing.Any] = None
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Send a request and return the decoded JSON body, raising for HTTP errors.
+        """
+        session = self.session
+
+        if params:
+            # aiohttp only accepts str/int/float query values
+            params = {
+                k: (str(v).lower() if isinstance(v, bool) else v)
+                for k, v in params.items()
+            }
+
+        async def send() -> typing.Dict[str, typing.Any]:
+            headers = {'Content-Type': 'application/json'} if json is not None else {}
+            if self.token_manager is not None:
+                headers['Authorization'] = f'Bearer {await self._current_token()}'
+
+            async with typing.cast(asyncio.Semaphore, self._semaphore):
+                async with session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=self.codec.dumps(json) if json is not None else None,
+                    headers=headers or None,
+                    proxy=self.proxy
+                ) as response:
+                    response.raise_for_status()
+                    if method == 'DELETE':
+                        return {}
+                    return self.codec.loads(await response.read())
+
+        if self.token_manager is None:
+            return await send()
+
+        try:
+            return await send()
+        except aiohttp.ClientResponseError as e:
+            if e.status != 401:
+                raise
+            # the token expired or was revoked while the request was in flight; send it once more
+            sent_with = e.request_info.headers.get('Authorization', '')
+            self.token_manager.invalidate(sent_with[len('Bearer '):])
+            return await send()
+
+    async def _current_token(self) -> str:
+        """
+        The token manager's access token, refreshed on a worker thread when it is about to expire.
+        """
+        manager = typing.cast(tokens.TokenManager, self.token_manager)
+        if manager.is_expiring():
+            access_token = await asyncio.get_running_loop().run_in_executor(None, manager.get_token)
+        else:
+            access_token = manager.get_token()
+        self.access_token = access_token
+        return access_token
+
+    async def _coalesced_get(
+            self,
+            url: str,
+            params: typing.Optional[typing.Dict[str, typing.Any]],
+            load: typing.Callable[[], typing.Awaitable[typing.Any]]
+    ) -> typing.Any:
+        """
+        Await ``load``, which GETs ``url`` with ``params`` and decodes it, or wait for the
+        identical GET already in flight on another task and share its result.
+        """
+        if self.single_flight is None:
+            return await load()
+
+        return await self.single_flight.do(
+            key=coalescing.request_key(method='GET', url=url, params=params),
+            fn=load
+        )
+
+    async def get_authenticated_user(self) -> user.User:
+        """
+        This endpoint retrieves information about the Snapchat user that
+        is represented by the access token used, the information includes
+        the snapchat_username.
+
+        More information: https://marketingapi.snapchat.com/docs/#user
+        """
+
+        response_json = await self._request(
+            method='GET',
+            url=build_url(base_url=self.BASE_URL, endpoint='me')
+        )
+
+        return user.User.from_json(
+            api_client=self, # type: ignore
+            json_data=response_json['me']
+        )
+
+    ########################
+    # API Patterns
+    ########################
+
+    async def _get_many_entities(
+            self,
+            plural_parent_entity_name: str,
+            parent_entity_id: str,
+            plural_entity_name: str,
+            **kwargs
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Pattern to retrieve multiple entities from the API.
+
+        More information: https://marketingapi.snapchat.com/docs/#get-many-entities
+        """
+
+        url: str = build_url(
+            base_url=self.BASE_URL,
+            endpoint=plural_parent_entity_name,
+            path=f'{parent_entity_id}/{plural_entity_name}',
+        )
+
+        params = build_params(**kwargs)
+
+        async def load() -> typing.List[typing.Dict[str, typing.Any]]:
+            first_response_json = await self._request(
+                method='GET',
+                url=url,
+                params=params
+            )
+
+            if 'limit' not in kwargs:
+                return unwrap_page(first_response_json[plural_entity_name])
+
+            return await self._paginator(
+                response_json=first_response_json,
+                response_data_key=plural_entity_name
+            )
+
+        return typing.cast(typing.List[typing.Dict[str, typing.Any]], await self._coalesced_get(url=url, params=params, load=load))
+
+    async def _get_single_entity(
+            self,
+            plural_entity_name: str,
+            entity_id: str,
+            **kwargs
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Pattern to retrieve a single entity from the API, as a list holding the unwrapped entity.
+
+        More information: https://marketingapi.snapchat.com/docs/#get-a-single-entity
+        """
+        url: str = build_url(
+                    base_url=self.BASE_URL,
+                    endpoint=plural_entity_name,
+                    path=entity_id
+                )
+
+        async def load() -> typing.List[typing.Dict[str, typing.Any]]:
+            response_json = await self._request(
+                method='GET',
+                url=url
+            )
+
+            return unwrap_page(response_json[plural_entity_name])
+
+        return typing.cast(typing.List[typing.Dict[str, typing.Any]], await self._coalesced_get(url=url, params=None, load=load))
+
+    async def _paginator(
+            self,
+            response_json: typing.Dict[str, typing.Any],
+            response_data_key: str
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Pattern to paginate through an API endpoint.
+
+        More information: https://marketingapi.snapchat.com/docs/#pagination
+        """
+
+        result_bag: typing.List = []
+
+        while True:
+            try:
+                result_bag.extend(unwrap_page(response_json[response_data_key]))
+            except KeyError:
+                break
+            next_link: typing.Optional[str] = response_json.get("paging", {}).get("next_link")
+            if not next_link:
+                break
+            try:
+                response_json = await self._request(
+                    method='GET',
+                    url=next_link
+                )
+            except Exception as e:
+                # keep what was fetched so the caller can resume from e.next_link
+                raise errors.PaginationError.from_error(error=e, next_link=next_link, results=result_bag) from e
+
+        return typing.cast(typing.List[typing.Dict[str, typing.Any]], result_bag)
+
+    async def _create_entities(
+            self,
+            plural_parent_entity_name: str,
+            parent_entity_id: str,
+            plural_entity_name: str,
+            data: typing.List[typing.Dict[str, typing.Any]],
+            **kwargs
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Create one or more entities sharing the same parent in a single POST request.
+
+        More information: https://marketingapi.snapchat.com/docs/#create-one-or-more-entities
+        """
+
+        url: str = build_url(
+            base_url=self.BASE_URL,
+            endpoint=plural_parent_entity_name,
+            path=f'{parent_entity_id}/{plural_entity_name}'
+        )
+
+        response_json = await self._request(
+            method='POST',
+            url=url,
+            json=data
+        )
+
+        return response_json[plural_entity_name]
+
+    async def _update_entities(
+            self,
+            plural_parent_entity_name: str,
+            parent_entity_id: str,
+            plural_entity_name: str,
+            data: typing.List[typing.Dict[str, typing.Any]],
+            **kwargs
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Update one or more entities sharing the same parent in a single PUT request.
+
+        More Information: https://marketingapi.snapchat.com/docs/#update-one-or-more-entities
+        """
+
+        url: str = build_url(
+            base_url=self.BASE_URL,
+            endpoint=plural_parent_entity_name,
+            path=f'{parent_entity_id}/{plural_entity_name}'
+        )
+
+        response_json = await self._request(
+            method='PUT',
+            url=url,
+            json=data
+        )
+
+        return response_json[plural_entity_name]
+
+    async def _delete_entity(
+            self,
+            plural_entity_name: str,
+            entity_id: str
+    ) -> None:
+        """
+        Delete a single entity.
+
+        More information: https://marketingapi.snapchat.com/docs/#delete-a-single-entity
+        """
+
+        url: str = build_url(
+            base_url=self.BASE_URL,
+            endpoint=plural_entity_name,
+            path=entity_id
+        )
+
+        await self._request(
+            method='DELETE',
+            url=url
+        )
+
+    ########################
+    # Organizations
+    ########################
+
+    async def list_organizations(
+            self,
+            with_ad_accounts: bool = False
+    ) -> typing.Union[typing.List[typing.Tuple[orgs.Organization, typing.List[ad_accountz.AdAccount]]], typing.List[orgs.Organization]]:
+        """
+        List all organizations the currently authenticated user has access to.
+        Optionally, can return a tuple of organizations and associated ad accounts.
+
+        More information: https://marketingapi.snapchat.com/docs/#list-organizations
+        """
+
+        response_json = await self._request(
+            method='GET',
+            url=build_url(base_url=self.BASE_URL, endpoint='me', path='organizations'),
+            params={'with_ad_accounts': with_ad_accounts} if with_ad_accounts else None
+        )
+
+        if not with_ad_accounts:
+            return [
+                orgs.Organization.from_json(
+                    api_client=self, # type: ignore
+                    json_data=org
+                )
+                for org in response_json['organizations']
+            ]
+
+        return [
+            (
+                orgs.Organization.from_json(
+                    api_client=self, # type: ignore
+                    json_data=org
+                ),
+                [
+                    ad_accountz.AdAccount.from_json(
+                        api_client=self, # type: ignore
+                        json_data=ad_account
+                    )
+                    for ad_account in org['organization'].get('ad_accounts', [])
+                ]
+            )
+            for org in response_json['organizations']
+        ]
+
+    async def get_organization(
+            self,
+            organization_id: str
+    ) -> orgs.Organization:
+        """
+        Get a single organization.
+
+        More information: https://marketingapi.snapchat.com/docs/#get-a-specific-organization
+        """
+
+        return orgs.Organization.from_json(
+            api_client=self, # type: ignore
+            json_data=(await self._get_single_entity(
+                plural_entity_name='organizations',
+                entity_id=organization_id
+            ))[0]
+        )
+
+    ########################
+    # Ad Accounts
+    ########################
+
+    async def get_single_ad_account(
+            self,
+            ad_account_id: str
+    ) -> ad_accountz.AdAccount:
+        """
+        Get a single ad account.
+        """
+
+        return ad_accountz.AdAccount.from_json(
+            api_client=self, # type: ignore
+            json_data=(await self._get_single_entity(
+                plural_entity_name='adaccounts',
+                entity_id=ad_account_id
+            ))[0]
+        )
@@ -1,15 +1,367 @@
+from __future__ import annotations
+
+import functools
+import sys
 import typing
 
-class SnapchatMarketingBase(object):
+from pysnapchatads.helpers import parse_timestamp
+
+_MISSING = object()
+_CLEAN: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], ())
+"""Shared marker for tracked objects without changes, so clean objects do not each hold an empty dict."""
+
+SHARED_VALUE_FIELDS: typing.FrozenSet[str] = frozenset({
+    'status', 'organization_id', 'ad_account_id', 'campaign_id', 'ad_squad_id', 'creative_id',
+    'currency', 'timezone', 'account_type', 'billing_type', 'advertiser', 'objective', 'buy_model',
+    'billing_event', 'optimization_goal', 'bid_strategy', 'adsquad_type', 'child_ad_type',
+    'forced_view_setting', 'story_ad_creative_type', 'pacing_type', 'delivery_constraint',
+    'reach_and_frequency_status', 'ad_type', 'review_status', 'org_type', 'country', 'member_status'
+})
+"""Fields whose string values repeat across many entities (enums, parent ids). They are interned so
+entities share one copy instead of each holding the one decoded from its JSON."""
+
+TIMESTAMP_FIELDS: typing.FrozenSet[str] = frozenset({'created_at', 'updated_at', 'start_time', 'end_time'})
+"""Fields kept as the API's string until first read, so listings do not parse timestamps nobody looks at."""
+
+class _LazyTimestamp(object):
+    """
+    A timestamp field over a hidden slot: strings stored in it are parsed on first read and the
+    parsed datetime replaces them.
+    """
+    __slots__ = ('name', 'slot')
+
+    def __init__(self, name: str, slot: typing.Any) -> None:
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, obj: typing.Any, owner: typing.Optional[type] = None) -> typing.Any:
+        if obj is None:
+            return self
+        try:
+            value = self.slot.__get__(obj, owner)
+        except AttributeError:
+            raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{self.name}'") from None
+        if type(value) is str:
+            value = parse_timestamp(value)
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: typing.Any, value: typing.Any) -> None:
+        self.slot.__set__(obj, value)
+
+    def __delete__(self, obj: typing.Any) -> None:
+        self.slot.__delete__(obj)
+
+def _slot_name(field: str) -> str:
+    return f'_raw_{field}' if field in TIMESTAMP_FIELDS else field
+
+class _SlottedMeta(type):
+    """
+    Gives every entity class ``__slots__`` built from its field annotations, so instances
+    carry no per-instance ``__dict__``. Timestamp fields get a hidden slot behind a
+    ``_LazyTimestamp``.
+    """
+
+    def __new__(mcls, name: str, bases: typing.Tuple[type, ...], namespace: typing.Dict[str, typing.Any], **kwargs: typing.Any) -> type:
+        lazy: typing.List[str] = []
+        if '__slots__' not in namespace:
+            inherited = {slot for b in bases for c in b.__mro__ for slot in getattr(c, '__slots__', ())}
+            fields = [k for k in namespace.get('__annotations__', {}) if _slot_name(k) not in inherited]
+            namespace['__slots__'] = tuple(_slot_name(k) for k in fields)
+            lazy = [k for k in fields if k in TIMESTAMP_FIELDS]
+        namespace.setdefault('_shared_value_fields', SHARED_VALUE_FIELDS.intersection(namespace.get('__annotations__', {})))
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        for k in lazy:
+            type.__setattr__(cls, k, _LazyTimestamp(k, vars(cls)[_slot_name(k)]))
+        return cls
+
+
+class _Deserializers(typing.NamedTuple):
+    load: typing.Callable[[typing.Any, typing.Mapping[str, typing.Any]], None]
+    one: typing.Callable[[typing.Any, typing.Mapping[str, typing.Any]], typing.Any]
+    many: typing.Callable[[typing.Any, typing.Iterable[typing.Mapping[str, typing.Any]]], typing.List[typing.Any]]
+
+
+def _slot_setter(cls: type, field: str) -> typing.Callable[[typing.Any, typing.Any], None]:
+    """
+    The ``__set__`` of the slot holding ``field``: it stores straight into the slot, without the
+    tracking ``__setattr__`` or the timestamp descriptor in front of it.
+    """
+    slot = _slot_name(field)
+    for klass in cls.__mro__:
+        if slot in vars(klass):
+            return vars(klass)[slot].__set__
+    raise TypeError(f'{cls.__name__} has no slot for {field}') # pragma: no cover
+
+
+def _compile_deserializers(cls: typing.Type[SnapchatMarketingBase]) -> _Deserializers:
+    """
+    Build the constructors of an entity class once.
+
+    JSON objects are unpacked as keyword arguments into a function generated for the class, so
+    matching keys to fields and rejecting unknown ones happens in C. Fields are written through
+    their slot descriptors, so loading is not a change and the object keeps its class throughout,
+    which matters when another thread holds the same live object.
+    """
+    renames: typing.Mapping[str, str] = cls._json_renames or {}
+    keys = list(cls.__annotations__) + [k for k in renames if k not in cls.__annotations__]
+    field_of: typing.Dict[str, str] = {k: renames.get(k, k) for k in keys}
+
+    namespace: typing.Dict[str, typing.Any] = {'_MISSING': _MISSING, '_intern': sys.intern, '_type': type}
+    lines = ['def fill(_obj_, ' + ', '.join(f'{k}=_MISSING' for k in keys) + '):']
+    for k in keys:
+        field = field_of[k]
+        namespace[f'_set_{k}'] = _slot_setter(cls, field)
+        if field in cls._shared_value_fields:
+            lines.append(f'    if {k} is not _MISSING: _set_{k}(_obj_, _intern({k}) if _type({k}) is str else {k})')
+        else:
+            lines.append(f'    if {k} is not _MISSING: _set_{k}(_obj_, {k})')
+    if not keys:
+        lines.append('    pass')
+
+    exec('\n'.join(lines), namespace)
+    fill: typing.Callable[..., None] = namespace['fill']
+
+    new = object.__new__
+    set_api_client = _slot_setter(cls, 'api_client')
+    set_id = _slot_setter(cls, 'id')
+    set_original_values = _slot_setter(cls, '_original_values')
+    valid = frozenset(keys)
+
+    def invalid(data: typing.Mapping[str, typing.Any]) -> AttributeError:
+        unknown = next((k for k in data if k not in valid), None)
+        return AttributeError(f'{unknown} is not a valid attribute for {cls.__name__}')
+
+    def load(obj: typing.Any, data: typing.Mapping[str, typing.Any]) -> None:
+        try:
+            fill(obj, **data)
+        except TypeError:
+            if all(k in valid for k in data):
+                raise
+            raise invalid(data) from None
+
+    def build(api_client: typing.Any, data: typing.Mapping[str, typing.Any]) -> typing.Any:
+        obj = new(cls)
+        set_api_client(obj, api_client)
+        set_id(obj, None)
+        load(obj, data)
+        set_original_values(obj, _CLEAN)
+        return obj
+
+    def merge(obj: typing.Any, data: typing.Mapping[str, typing.Any]) -> typing.Any:
+        # refresh a live object in place; fields with changes not saved yet are left alone
+        dirty = obj._dirty_fields()
+        if dirty:
+            data = {k: v for k, v in data.items() if field_of.get(k, k) not in dirty}
+        load(obj, data)
+        return obj
+
+    def one(api_client: typing.Any, data: typing.Mapping[str, typing.Any]) -> typing.Any:
+        identity_map = getattr(api_client, 'identity_map', None)
+        if identity_map is None:
+            return build(api_client, data)
+
+        live = identity_map.get(cls, data.get('id'))
+        if live is not None:
+            return merge(live, data)
+
+        obj = build(api_client, data)
+        live = identity_map.setdefault(obj)
+        if live is not obj:
+            return merge(live, data)
+        return obj
+
+    def many(api_client: typing.Any, rows: typing.Iterable[typing.Mapping[str, typing.Any]]) -> typing.List[typing.Any]:
+        # same as ``one``, with the construction inlined to save calls per row
+        identity_map = getattr(api_client, 'identity_map', None)
+        results: typing.List[typing.Any] = []
+        append = results.append
+        # rows built here, registered with the identity map in one go at the end
+        built: typing.List[typing.Tuple[int, typing.Mapping[str, typing.Any]]] = []
+        for data in rows:
+            if identity_map is not None:
+                live = identity_map.get(cls, data.get('id'))
+                if live is not None:
+                    append(merge(live, data))
+                    continue
+                built.append((len(results), data))
+
+            obj = new(cls)
+            set_api_client(obj, api_client)
+            set_id(obj, None)
+            try:
+                fill(obj, **data)
+            except TypeError:
+                if all(k in valid for k in data):
+                    raise
+                raise invalid(data) from None
+            set_original_values(obj, _CLEAN)
+            append(obj)
+
+        if built:
+            # the same id twice in one listing, or another thread registering it first
+            live_objects = identity_map.setdefault_many([results[i] for i, _ in built])
+            for (i, data), live in zip(built, live_objects):
+                if live is not results[i]:
+                    results[i] = merge(live, data)
+        return results
+
+    return _Deserializers(load=load, one=one, many=many)
+
+
+class relationship(object):
+    """
+    A related entity, or list of entities, loaded by the decorated method on first access and
+    cached on the object. ``del entity.<name>`` drops the cached value so the next access loads it again.
+    """
+
+    def __init__(self, load: typing.Callable[[typing.Any], typing.Any]) -> None:
+        self.load = load
+        self.name: str = load.__name__
+        self.__doc__ = load.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: typing.Any, owner: typing.Optional[type] = None) -> typing.Any:
+        if obj is None:
+            return self
+        try:
+            relations: typing.Dict[str, typing.Any] = object.__getattribute__(obj, '_relations')
+        except AttributeError:
+            relations = {}
+            object.__setattr__(obj, '_relations', relations)
+
+        if self.name not in relations:
+            relations[self.name] = self.load(obj)
+        return relations[self.name]
+
+    def __delete__(self, obj: typing.Any) -> None:
+        try:
+            object.__getattribute__(obj, '_relations').pop(self.name, None)
+        except AttributeError:
+            pass
+
+
+class SnapchatMarketingBase(object, metaclass=_SlottedMeta):
+    __slots__ = ('id', 'api_client', '_original_values', '_relations', '__weakref__')
+    _shared_value_fields: typing.FrozenSet[str] = frozenset()
+    _json_renames: typing.Optional[typing.Mapping[str, str]] = None
+    """JSON keys stored under a different field name. Classes that set it (even to ``{}``) are built
+    straight from their JSON fields by compiled constructors; the others keep their own from_json."""
+
     def __init__(self) -> None:
         self.id: typing.Union[str, None, int] = None
-    
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        init = vars(cls).get('__init__')
+        if init is None:
+            return
+
+        # start tracking changes once the object is fully built, so loading it is not a change
+        @functools.wraps(init)
+        def tracked_init(self: SnapchatMarketingBase, *args: typing.Any, **kwargs: typing.Any) -> None:
+            init(self, *args, **kwargs)
+            object.__setattr__(self, '_original_values', _CLEAN)
+
+        cls.__init__ = tracked_init # type: ignore
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        if type(value) is str and name in self._shared_value_fields:
+            value = sys.intern(value)
+
+        original_values: typing.Optional[typing.Dict[str, typing.Any]] = getattr(self, '_original_values', None)
+
+        if original_values is not None and name in self.__class__.__annotations__:
+            if original_values is _CLEAN:
+                original_values = {}
+                object.__setattr__(self, '_original_values', original_values)
+            if name not in original_values:
+                original_values[name] = getattr(self, name, _MISSING)
+
+            api_client = getattr(self, 'api_client', None)
+            batch = api_client._active_batch() if hasattr(api_client, '_active_batch') else None
+            if batch is not None:
+                batch.update(self)
+
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def _deserializers(cls) -> _Deserializers:
+        compiled: typing.Optional[_Deserializers] = vars(cls).get('_compiled_deserializers')
+        if compiled is None:
+            compiled = _compile_deserializers(cls)
+            type.__setattr__(cls, '_compiled_deserializers', compiled)
+        return compiled
+
+    def _set_fields(self, data: typing.Mapping[str, typing.Any]) -> None:
+        """
+        Validate and set fields from keyword arguments or JSON, without copying or changing ``data``.
+        """
+        self._deserializers().load(self, data)
+
+    @classmethod
+    def _identify(cls, api_client: typing.Any, entity: typing.Any) -> typing.Any:
+        """
+        The client's live object for ``entity``, refreshed from it in place, or ``entity`` itself.
+        For classes that build objects in their own from_json; compiled constructors do this already.
+        """
+        identity_map = getattr(api_client, 'identity_map', None)
+        if identity_map is None:
+            return entity
+
+        live = identity_map.setdefault(entity)
+        if live is not entity:
+            dirty = live._dirty_fields() or {}
+            for k in cls.__annotations__:
+                value = getattr(entity, k, _MISSING)
+                if value is not _MISSING and k not in dirty:
+                    object.__setattr__(live, k, value)
+        return live
+
+    @classmethod
+    def from_json_many(
+        cls,
+        api_client: typing.Any,
+        json_list: typing.Iterable[typing.Mapping[str, typing.Any]]
+    ) -> typing.List[typing.Any]:
+        """
+        Deserialize a list of JSON objects, e.g. a whole listing, in one pass.
+        """
+        if cls._json_renames is None:
+            return [cls.from_json(api_client, json_data) for json_data in json_list] # type: ignore
+        return cls._deserializers().many(api_client, json_list)
+
     def __hash__(self) -> int:
         class_name = type(self).__name__
         return hash((class_name, self.id))
-    
+
     def __dict__(self) -> typing.Dict[str, typing.Any]: # type: ignore
         return {
             k: getattr(self, k)
             for k in self.__class__.__annotations__.keys()
-        }
\ No newline at end of file
+            if hasattr(self, k)
+        }
+
+    def _dirty_fields(self) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """
+        Fields changed since the object was loaded or last saved, or None when changes are not tracked.
+        Fields set back to their original value are not dirty.
+        """
+        original_values: typing.Optional[typing.Dict[str, typing.Any]] = getattr(self, '_original_values', None)
+        if original_values is None:
+            return None
+        if original_values is _CLEAN:
+            return {}
+
+        return {
+            k: getattr(self, k)
+            for k, original in original_values.items()
+            if getattr(self, k, _MISSING) is not _MISSING and getattr(self, k) != original
+        }
+
+    def _mark_clean(self) -> None:
+        if getattr(self, '_original_values', None) is not None:
+            object.__setattr__(self, '_original_values', _CLEAN)
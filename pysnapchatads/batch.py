@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import concurrent.futures
+import typing
+
+import pysnapchatads.snapchat as snap
+import pysnapchatads.base as base
+
+GroupKey = typing.Tuple[str, str, str]
+"""``(plural_parent_entity_name, parent_entity_id, plural_entity_name)``"""
+
+class Batch(object):
+    """
+    Unit of work collecting creates, updates and deletes, written on exit in as few requests as possible.
+
+    Inside ``with client.batch() as b:`` changes to entity attributes (directly or through ``update()``)
+    are recorded instead of sent, and ``delete()`` is deferred. On a clean exit:
+
+    * creates queued with ``b.create(...)`` are posted in bulk per parent,
+    * updates are grouped by parent and sent as bulk PUTs of ``batch_size`` entities, carrying only
+      the id, the parent id and the fields that actually changed; entities without changes are dropped,
+    * deletes are sent once per entity, concurrently, since the API has no bulk delete.
+
+    Nothing is sent if the block raises.
+    """
+
+    def __init__(
+            self,
+            api_client: snap.SnapchatMarketing,
+            batch_size: int = 500,
+            max_workers: int = 4
+    ) -> None:
+        self.api_client: snap.SnapchatMarketing = api_client
+        self.batch_size: int = batch_size
+        self.max_workers: int = max_workers
+
+        self.created: typing.List[typing.Optional[typing.Dict[str, typing.Any]]] = []
+        """Results of ``create`` calls, by the index ``create`` returned. Filled in on flush."""
+        self.flushing: bool = False
+
+        self._creates: typing.List[typing.Tuple[GroupKey, typing.Dict[str, typing.Any]]] = []
+        # keyed by object identity; entities hash by id, which may be shared by stale copies
+        self._updates: typing.Dict[int, base.SnapchatMarketingBase] = {}
+        self._deletes: typing.Dict[typing.Tuple[str, str], None] = {}
+
+    def __enter__(self) -> Batch:
+        self.api_client._push_batch(self)
+        return self
+
+    def __exit__(self, exc_type: typing.Any, exc: typing.Any, tb: typing.Any) -> None:
+        self.api_client._pop_batch(self)
+        if exc_type is None:
+            self.flush()
+
+    def create(
+            self,
+            plural_parent_entity_name: str,
+            parent_entity_id: str,
+            plural_entity_name: str,
+            data: typing.Dict[str, typing.Any]
+    ) -> int:
+        """
+        Queue an entity to create. Returns its index in ``created``.
+        """
+        self._creates.append(((plural_parent_entity_name, str(parent_entity_id), plural_entity_name), data))
+        self.created.append(None)
+        return len(self._creates) - 1
+
+    def update(self, entity: base.SnapchatMarketingBase) -> None:
+        """
+        Mark an entity as possibly changed; what is sent is decided on flush.
+        """
+        self._updates.setdefault(id(entity), entity)
+
+    def delete(self, plural_entity_name: str, entity_id: str) -> None:
+        self._deletes[(plural_entity_name, str(entity_id))] = None
+
+    def flush(self) -> None:
+        """
+        Send everything recorded so far.
+        """
+        self.flushing = True
+        try:
+            self._flush_creates()
+            self._flush_updates()
+            self._flush_deletes()
+        finally:
+            self.flushing = False
+
+    def _flush_creates(self) -> None:
+        groups: typing.Dict[GroupKey, typing.List[int]] = {}
+        for index, (key, _) in enumerate(self._creates):
+            groups.setdefault(key, []).append(index)
+
+        for (plural_parent_entity_name, parent_entity_id, plural_entity_name), indices in groups.items():
+            results = self.api_client._bulk_create_entities(
+                plural_parent_entity_name=plural_parent_entity_name,
+                plural_entity_name=plural_entity_name,
+                data=[self._creates[i][1] for i in indices],
+                parent_entity_id=parent_entity_id,
+                batch_size=self.batch_size,
+                max_workers=self.max_workers
+            )
+            for index, result in zip(indices, results):
+                self.created[index] = result
+
+        self._creates = []
+
+    def _flush_updates(self) -> None:
+        groups: typing.Dict[GroupKey, typing.List[typing.Tuple[base.SnapchatMarketingBase, typing.Dict[str, typing.Any]]]] = {}
+
+        for entity in self._updates.values():
+            plural_entity_name: str = entity._plural_entity_name # type: ignore
+            if (plural_entity_name, str(entity.id)) in self._deletes:
+                continue
+
+            payload = self._update_payload(entity)
+            if payload is None:
+                continue
+
+            parent_field: str = entity._parent_id_field # type: ignore
+            key = (entity._plural_parent_entity_name, str(getattr(entity, parent_field)), plural_entity_name) # type: ignore
+            groups.setdefault(key, []).append((entity, payload))
+
+        chunks = [
+            (key, items[start:start + self.batch_size])
+            for key, items in groups.items()
+            for start in range(0, len(items), self.batch_size)
+        ]
+
+        def put(chunk: typing.Tuple[GroupKey, typing.List[typing.Tuple[base.SnapchatMarketingBase, typing.Dict[str, typing.Any]]]]) -> None:
+            (plural_parent_entity_name, parent_entity_id, plural_entity_name), items = chunk
+            self.api_client._update_entities(
+                plural_parent_entity_name=plural_parent_entity_name,
+                parent_entity_id=parent_entity_id,
+                plural_entity_name=plural_entity_name,
+                data=[payload for _, payload in items]
+            )
+            for entity, _ in items:
+                entity._mark_clean()
+
+        self._run(put, chunks)
+        self._updates = {}
+
+    def _flush_deletes(self) -> None:
+        self._run(
+            lambda key: self.api_client._delete_entity(plural_entity_name=key[0], entity_id=key[1]),
+            list(self._deletes)
+        )
+        self._deletes = {}
+
+    @staticmethod
+    def _update_payload(entity: base.SnapchatMarketingBase) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """
+        The minimal PUT body for an entity, or None when nothing changed.
+        """
+        dirty = entity._dirty_fields()
+        if dirty is None:
+            # changes are not tracked for this object, send all of it
+            return entity.__dict__() # type: ignore
+        if not dirty:
+            return None
+
+        parent_field: str = entity._parent_id_field # type: ignore
+        return {'id': entity.id, parent_field: getattr(entity, parent_field), **dirty}
+
+    def _run(self, fn: typing.Callable[[typing.Any], None], items: typing.List[typing.Any]) -> None:
+        if not items:
+            return
+        if len(items) == 1:
+            fn(items[0])
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            for future in [executor.submit(fn, item) for item in items]:
+                future.result()
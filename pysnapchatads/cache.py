@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import threading
+import time
+import typing
+
+import pysnapchatads.codec as codecs
+from pysnapchatads.helpers import unwrap
+
+CacheKey = typing.Tuple[str, str]
+"""``(plural_entity_name, entity_id)``"""
+
+class CacheStats(typing.NamedTuple):
+    """
+    Counters of an EntityCache.
+    """
+
+    hits: int
+    """Fresh entries served from memory."""
+    stale_hits: int
+    """Expired entries served while a background refresh runs."""
+    misses: int
+    """Lookups that went to the network."""
+    refreshes: int
+    """Background refreshes started."""
+    evictions: int
+    """Entries dropped to keep the cache within max_size."""
+    invalidations: int
+    """Entries dropped because the entity was created, updated or deleted."""
+    size: int
+
+
+class _Entry(object):
+    __slots__ = ('payload', 'stored_at')
+
+    def __init__(self, payload: bytes, stored_at: float) -> None:
+        self.payload = payload
+        """The value encoded once on insert: immutable, and decoded into a fresh copy on every hit."""
+        self.stored_at = stored_at
+
+
+class EntityCache(object):
+    """
+    In-memory cache of single entity reads with TTL and LRU eviction.
+
+    Entries younger than ``ttl`` seconds are served directly. Entries between ``ttl`` and
+    ``ttl + stale_while_revalidate`` seconds old are still served, but trigger one background
+    refresh. Older entries are reloaded synchronously. At most ``max_size`` entries are kept,
+    evicting the least recently used.
+
+    Values are kept encoded with ``codec`` and decoded on the way out, so callers may mutate
+    what they get; a value loaded on a miss is handed to the caller without any copy.
+    """
+
+    def __init__(
+            self,
+            ttl: float = 300.0,
+            max_size: int = 10_000,
+            stale_while_revalidate: float = 0.0,
+            refresh_workers: int = 2,
+            codec: typing.Optional[codecs.JSONCodec] = None
+    ) -> None:
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        self.stale_while_revalidate: float = stale_while_revalidate
+        self.refresh_workers: int = refresh_workers
+        self.codec: codecs.JSONCodec = codec if codec is not None else codecs.get_codec()
+
+        self._entries: collections.OrderedDict[CacheKey, _Entry] = collections.OrderedDict()
+        # bumped on every invalidation so loads that raced a write are not stored; only keys
+        # that are cached or being loaded have one, so writes to other ids leave nothing behind
+        self._generations: typing.Dict[CacheKey, int] = {}
+        # loads in flight per key
+        self._loading: typing.Dict[CacheKey, int] = {}
+        self._refreshing: typing.Set[CacheKey] = set()
+        self._executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self._hits: int = 0
+        self._stale_hits: int = 0
+        self._misses: int = 0
+        self._refreshes: int = 0
+        self._evictions: int = 0
+        self._invalidations: int = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                refreshes=self._refreshes,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries)
+            )
+
+    def get_or_load(
+            self,
+            key: CacheKey,
+            loader: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        """
+        Return the cached value for ``key``, calling ``loader`` when it is missing or too old.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.monotonic() - entry.stored_at if entry is not None else None
+
+            if entry is not None and typing.cast(float, age) < self.ttl:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                payload: typing.Optional[bytes] = entry.payload
+
+            elif entry is not None and typing.cast(float, age) < self.ttl + self.stale_while_revalidate:
+                self._entries.move_to_end(key)
+                self._stale_hits += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._refreshes += 1
+                    self._refresh_executor().submit(self._refresh, key, loader, self._begin_load(key))
+                payload = entry.payload
+
+            else:
+                self._misses += 1
+                generation = self._begin_load(key)
+                payload = None
+
+        if payload is not None:
+            # decoding outside the lock keeps concurrent hits from queueing behind each other
+            return self.codec.loads(payload)
+
+        return self._load(key, loader, generation)
+
+    def put(self, key: CacheKey, value: typing.Any) -> None:
+        with self._lock:
+            generation = self._begin_load(key)
+        self._load(key, lambda: value, generation)
+
+    def invalidate(self, key: CacheKey) -> None:
+        with self._lock:
+            if key in self._generations:
+                self._generations[key] += 1
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+                self._drop_generation(key)
+
+    def invalidate_many(
+            self,
+            plural_entity_name: str,
+            entity_ids: typing.Iterable[str]
+    ) -> None:
+        for entity_id in entity_ids:
+            self.invalidate((plural_entity_name, str(entity_id)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations = {key: self._generations[key] + 1 for key in self._loading}
+
+    def _begin_load(self, key: CacheKey) -> int:
+        # called under the lock; every call is paired with one ``_load``
+        self._loading[key] = self._loading.get(key, 0) + 1
+        return self._generations.setdefault(key, 0)
+
+    def _drop_generation(self, key: CacheKey) -> None:
+        # called under the lock once ``key`` is neither cached nor being loaded
+        if key not in self._entries and key not in self._loading:
+            self._generations.pop(key, None)
+
+    def _load(
+            self,
+            key: CacheKey,
+            loader: typing.Callable[[], typing.Any],
+            generation: int
+    ) -> typing.Any:
+        payload: typing.Optional[bytes] = None
+        try:
+            value = loader()
+            payload = self.codec.dumps(value)
+        finally:
+            with self._lock:
+                if payload is not None and self._generations[key] == generation:
+                    self._entries[key] = _Entry(payload=payload, stored_at=time.monotonic())
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_size:
+                        evicted, _ = self._entries.popitem(last=False)
+                        self._evictions += 1
+                        self._drop_generation(evicted)
+
+                remaining = self._loading[key] - 1
+                if remaining:
+                    self._loading[key] = remaining
+                else:
+                    del self._loading[key]
+                    self._drop_generation(key)
+        return value
+
+    def _refresh(
+            self,
+            key: CacheKey,
+            loader: typing.Callable[[], typing.Any],
+            generation: int
+    ) -> None:
+        try:
+            self._load(key, loader, generation)
+        except Exception:
+            # keep serving the stale value; the next expired lookup will reload synchronously
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _refresh_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.refresh_workers,
+                thread_name_prefix='pysnapchatads-cache-refresh'
+            )
+        return self._executor
+
+
+def entity_ids(items: typing.Iterable[typing.Any]) -> typing.List[str]:
+    """
+    Collect entity ids from request bodies or responses, unwrapping
+    ``{"sub_request_status": ..., "<entity>": {...}}`` items.
+    """
+    entities = (unwrap(item) for item in items if isinstance(item, typing.Mapping))
+    return [str(entity['id']) for entity in entities if 'id' in entity]
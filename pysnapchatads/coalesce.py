@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+import typing
+
+T = typing.TypeVar('T')
+
+RequestKey = typing.Tuple[str, str, typing.Tuple[typing.Tuple[str, str], ...]]
+"""``(method, url, sorted query parameters)``"""
+
+
+def request_key(
+        method: str,
+        url: str,
+        params: typing.Optional[typing.Mapping[str, typing.Any]] = None
+) -> RequestKey:
+    """
+    The identity of a request: two requests with equal keys fetch the same thing.
+    """
+    return (method.upper(), url, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())))
+
+
+class CoalesceStats(typing.NamedTuple):
+    """
+    Counters of a SingleFlight or AsyncSingleFlight.
+    """
+
+    calls: int
+    """Calls made, coalesced or not."""
+    coalesced: int
+    """Calls that joined a request already in flight instead of sending their own."""
+    in_flight: int
+    """Requests in flight right now."""
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent identical reads across threads.
+
+    The first caller for a key runs the request; callers arriving with the same key while it is
+    in flight wait for it and get the same decoded result, or the same exception. Nothing is
+    kept once the request finishes, so a later call always goes to the network again.
+
+    The result is shared, not copied: treat it as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: typing.Dict[typing.Hashable, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+
+        self._calls: int = 0
+        self._coalesced: int = 0
+
+    @property
+    def stats(self) -> CoalesceStats:
+        with self._lock:
+            return CoalesceStats(calls=self._calls, coalesced=self._coalesced, in_flight=len(self._in_flight))
+
+    def do(self, key: typing.Hashable, fn: typing.Callable[[], T]) -> T:
+        """
+        Return ``fn()``, sharing one call among concurrent callers with the same ``key``.
+        """
+        with self._lock:
+            self._calls += 1
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = concurrent.futures.Future()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            return typing.cast(T, future.result())
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: typing.Hashable) -> None:
+        # callers arriving from now on send a fresh request
+        with self._lock:
+            del self._in_flight[key]
+
+
+class AsyncSingleFlight(object):
+    """
+    Coalesces concurrent identical reads across the tasks of one event loop.
+
+    Like :class:`SingleFlight`, but the shared request runs as its own task: a caller that is
+    cancelled stops waiting without cancelling the request the other callers are waiting on.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: typing.Dict[typing.Hashable, asyncio.Future] = {}
+
+        self._calls: int = 0
+        self._coalesced: int = 0
+
+    @property
+    def stats(self) -> CoalesceStats:
+        return CoalesceStats(calls=self._calls, coalesced=self._coalesced, in_flight=len(self._in_flight))
+
+    async def do(self, key: typing.Hashable, fn: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        """
+        Return ``await fn()``, sharing one call among concurrent callers with the same ``key``.
+        """
+        self._calls += 1
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            task = self._in_flight[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        return typing.cast(T, await asyncio.shield(task))
+
+    def _finish(self, key: typing.Hashable, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # retrieved, so a failure every caller stopped waiting for is not logged as lost
+            task.exception()
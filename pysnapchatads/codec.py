@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import typing
+
+try:
+    import orjson
+except ImportError: # pragma: no cover
+    orjson = None # type: ignore
+
+try:
+    import ujson
+except ImportError: # pragma: no cover
+    ujson = None # type: ignore
+
+def _default(obj: typing.Any) -> typing.Any:
+    """
+    Encode the non-JSON types entity objects carry (timestamps, read-only mappings, sets).
+    """
+    if isinstance(obj, (dt.datetime, dt.date)):
+        return obj.isoformat()
+    if isinstance(obj, typing.Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class JSONCodec(object):
+    """
+    Decodes response bodies straight from bytes and encodes request bodies to bytes.
+    The base class uses the standard library.
+    """
+
+    name: str = 'json'
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        return json.loads(data)
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return json.dumps(obj, default=_default, separators=(',', ':')).encode('utf-8')
+
+
+class UJSONCodec(JSONCodec):
+    name: str = 'ujson'
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        return ujson.loads(data)
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return ujson.dumps(obj, default=_default, ensure_ascii=False).encode('utf-8')
+
+
+class ORJSONCodec(JSONCodec):
+    name: str = 'orjson'
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return orjson.dumps(obj, default=_default)
+
+
+CODECS: typing.Dict[str, typing.Type[JSONCodec]] = {'json': JSONCodec}
+if ujson is not None:
+    CODECS['ujson'] = UJSONCodec
+if orjson is not None:
+    CODECS['orjson'] = ORJSONCodec
+
+def get_codec(name: typing.Optional[str] = None) -> JSONCodec:
+    """
+    Get a codec by name, or orjson when it is installed and the standard library otherwise.
+
+    ujson is only used when asked for by name: decoding large listings it is no faster than
+    the standard library (see ``benchmarks/bench_json.py``).
+    """
+    if name is not None:
+        if name not in CODECS:
+            raise ValueError(f'{name} is not an available JSON codec. Available: {sorted(CODECS)}')
+        return CODECS[name]()
+
+    return CODECS['orjson']() if 'orjson' in CODECS else JSONCodec()
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import datetime as dt
+import typing
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None # type: ignore
+
+from pysnapchatads.base import TIMESTAMP_FIELDS
+from pysnapchatads.helpers import parse_timestamp, unwrap
+
+MICRO = 'micro'
+"""Micro currency amounts: int64, masked where missing."""
+CATEGORY = 'category'
+"""Low-cardinality strings (statuses, types, parent ids): int32 codes into ``Columns.categories``, masked where missing."""
+TIMESTAMP = 'timestamp'
+"""``datetime64[us]`` in UTC (int64 microseconds since the epoch), masked where missing."""
+BOOL = 'bool'
+"""bool, masked where missing."""
+OBJECT = 'object'
+"""Anything else (ids, names, nested objects) as an object array, None where missing."""
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError('Columnar listings require numpy. Install it with `pip install pysnapchatads[columnar]`.')
+
+def schema(entity_class: typing.Any, fields: typing.Optional[typing.Iterable[str]] = None) -> typing.Dict[str, str]:
+    """
+    Column kind of each field of an entity class, derived from its annotations.
+
+    :param fields: Fields to keep, in order. Defaults to every annotated field.
+    """
+    annotations: typing.Mapping[str, typing.Any] = entity_class.__annotations__
+    names = list(annotations) if fields is None else list(fields)
+
+    kinds: typing.Dict[str, str] = {}
+    for name in names:
+        if name not in annotations:
+            raise AttributeError(f'{name} is not a valid attribute for {entity_class.__name__}')
+        annotation = str(annotations[name])
+        if name.endswith('_micro'):
+            kinds[name] = MICRO
+        elif name in TIMESTAMP_FIELDS:
+            kinds[name] = TIMESTAMP
+        elif name in entity_class._shared_value_fields:
+            kinds[name] = CATEGORY
+        elif annotation in ('bool', 'typing.Optional[bool]'):
+            kinds[name] = BOOL
+        else:
+            kinds[name] = OBJECT
+    return kinds
+
+
+class Columns(object):
+    """
+    A listing as a struct of arrays: one array per field, all the same length.
+    """
+
+    columns: typing.Dict[str, typing.Any]
+    """Arrays by field name. Masked arrays for every kind except OBJECT."""
+    categories: typing.Dict[str, typing.List[str]]
+    """Values of each CATEGORY field, indexed by code."""
+
+    def __init__(self, columns: typing.Dict[str, typing.Any], categories: typing.Dict[str, typing.List[str]]) -> None:
+        self.columns = columns
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> typing.Any:
+        return self.columns[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.columns
+
+    def keys(self) -> typing.KeysView[str]:
+        return self.columns.keys()
+
+    def decode(self, name: str) -> typing.Any:
+        """
+        The values of a CATEGORY column as an object array, None where missing.
+        """
+        codes = self.columns[name]
+        values = np.array(self.categories[name] + [None], dtype=object)
+        return values[codes.filled(-1)]
+
+
+class ColumnBuilder(object):
+    """
+    Converts pages of entity JSON into columns, keeping category codes stable across pages.
+
+    Each page is converted as it arrives, so only the current page is ever held as JSON.
+    """
+
+    def __init__(self, entity_class: typing.Any, fields: typing.Optional[typing.Iterable[str]] = None) -> None:
+        _require_numpy()
+        self.kinds: typing.Dict[str, str] = schema(entity_class, fields)
+        renamed = {field: key for key, field in (entity_class._json_renames or {}).items()}
+        self._keys: typing.Dict[str, str] = {name: renamed.get(name, name) for name in self.kinds}
+        self._codes: typing.Dict[str, typing.Dict[str, int]] = {
+            name: {} for name, kind in self.kinds.items() if kind == CATEGORY
+        }
+        self._chunks: typing.Dict[str, typing.List[typing.Any]] = {name: [] for name in self.kinds}
+
+    @property
+    def categories(self) -> typing.Dict[str, typing.List[str]]:
+        return {name: list(codes) for name, codes in self._codes.items()}
+
+    def convert(self, page: typing.Iterable[typing.Mapping[str, typing.Any]]) -> Columns:
+        """
+        Convert one page without keeping it.
+        """
+        rows = [unwrap(row) for row in page]
+        columns = {
+            name: self._column(name, kind, [row.get(self._keys[name]) for row in rows])
+            for name, kind in self.kinds.items()
+        }
+        return Columns(columns, self.categories)
+
+    def add(self, page: typing.Iterable[typing.Mapping[str, typing.Any]]) -> None:
+        """
+        Convert one page and keep its columns for ``finish``.
+        """
+        for name, column in self.convert(page).columns.items():
+            self._chunks[name].append(column)
+
+    def finish(self) -> Columns:
+        columns: typing.Dict[str, typing.Any] = {}
+        for name, kind in self.kinds.items():
+            chunks = self._chunks[name] or [self._column(name, kind, [])]
+            if kind == OBJECT:
+                columns[name] = np.concatenate(chunks)
+            else:
+                columns[name] = np.ma.concatenate(chunks)
+            self._chunks[name] = []
+        return Columns(columns, self.categories)
+
+    def _column(self, name: str, kind: str, values: typing.List[typing.Any]) -> typing.Any:
+        missing = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+
+        if kind == OBJECT:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            return column
+
+        if kind == MICRO:
+            data = np.fromiter((0 if v is None else int(v) for v in values), dtype=np.int64, count=len(values))
+        elif kind == BOOL:
+            data = np.fromiter((bool(v) for v in values), dtype=bool, count=len(values))
+        elif kind == CATEGORY:
+            codes = self._codes[name]
+            data = np.fromiter(
+                (-1 if v is None else codes.setdefault(v, len(codes)) for v in values),
+                dtype=np.int32,
+                count=len(values)
+            )
+        else:
+            data = timestamp_array(values)
+
+        return np.ma.MaskedArray(data, mask=missing)
+
+
+def timestamp_array(values: typing.List[typing.Any]) -> typing.Any:
+    """
+    API timestamps as a ``datetime64[us]`` array in UTC, NaT where missing.
+    """
+    # the API sends UTC 'Z' timestamps, which numpy parses in C once the suffix is dropped
+    if all(v is None or (type(v) is str and v.endswith('Z')) for v in values):
+        return np.array([None if v is None else v[:-1] for v in values], dtype='datetime64[us]')
+
+    micros = []
+    for v in values:
+        parsed = parse_timestamp(v)
+        if parsed is None:
+            micros.append(np.iinfo(np.int64).min) # NaT
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=dt.timezone.utc)
+        micros.append((parsed - _EPOCH) // dt.timedelta(microseconds=1))
+    return np.array(micros, dtype=np.int64).view('datetime64[us]')
+
+
+def iter_columns(
+        pages: typing.Iterable[typing.Iterable[typing.Mapping[str, typing.Any]]],
+        entity_class: typing.Any,
+        fields: typing.Optional[typing.Iterable[str]] = None
+) -> typing.Iterator[Columns]:
+    """
+    Stream a listing as one ``Columns`` per page. Category codes mean the same thing in every page.
+    """
+    builder = ColumnBuilder(entity_class, fields)
+    for page in pages:
+        yield builder.convert(page)
+
+def to_columns(
+        pages: typing.Iterable[typing.Iterable[typing.Mapping[str, typing.Any]]],
+        entity_class: typing.Any,
+        fields: typing.Optional[typing.Iterable[str]] = None
+) -> Columns:
+    """
+    Build the columns of a whole listing, converting it page by page.
+    """
+    builder = ColumnBuilder(entity_class, fields)
+    for page in pages:
+        builder.add(page)
+    return builder.finish()
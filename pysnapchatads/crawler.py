@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+import time
+import typing
+
+import pysnapchatads.snapchat as snap
+import pysnapchatads.objects.organizations as orgs
+import pysnapchatads.objects.ad_accounts as ad_accountz
+import pysnapchatads.objects.campaigns as campaigns
+import pysnapchatads.objects.ad_squads as ad_squads
+import pysnapchatads.objects.ads as ads
+
+ProgressCallback = typing.Callable[[str, int, int], None]
+"""Called as ``on_progress(level, completed, total)`` each time a listing of a level finishes."""
+
+class HierarchySnapshot(object):
+    """
+    A linked, point-in-time snapshot of organizations and everything below them.
+
+    Entities are indexed by id, and parent -> children links are kept as id lists
+    so the tree can be walked in either direction.
+    """
+
+    organizations: typing.Dict[str, orgs.Organization]
+    ad_accounts: typing.Dict[str, ad_accountz.AdAccount]
+    campaigns: typing.Dict[str, campaigns.Campaign]
+    ad_squads: typing.Dict[str, ad_squads.AdSquad]
+    ads: typing.Dict[str, ads.Ad]
+
+    timings: typing.Dict[str, float]
+    """Wall-clock seconds spent on each level."""
+    errors: typing.List[typing.Tuple[str, str, BaseException]]
+    """``(level, parent_id, exception)`` for every listing that failed."""
+
+    def __init__(self) -> None:
+        self.organizations = {}
+        self.ad_accounts = {}
+        self.campaigns = {}
+        self.ad_squads = {}
+        self.ads = {}
+        self.timings = {}
+        self.errors = []
+
+        self._children: typing.Dict[typing.Tuple[str, str], typing.List[str]] = {}
+
+    def _link(self, level: str, parent_id: typing.Optional[str], child_id: str) -> None:
+        if parent_id is not None:
+            self._children.setdefault((level, str(parent_id)), []).append(child_id)
+
+    def ad_accounts_of(self, organization_id: str) -> typing.List[ad_accountz.AdAccount]:
+        return [self.ad_accounts[i] for i in self._children.get(('ad_accounts', organization_id), [])]
+
+    def campaigns_of(self, ad_account_id: str) -> typing.List[campaigns.Campaign]:
+        return [self.campaigns[i] for i in self._children.get(('campaigns', ad_account_id), [])]
+
+    def ad_squads_of(self, campaign_id: str) -> typing.List[ad_squads.AdSquad]:
+        return [self.ad_squads[i] for i in self._children.get(('ad_squads', campaign_id), [])]
+
+    def ads_of(self, ad_squad_id: str) -> typing.List[ads.Ad]:
+        return [self.ads[i] for i in self._children.get(('ads', ad_squad_id), [])]
+
+
+class HierarchyCrawler(object):
+    """
+    Crawls organization -> ad accounts -> campaigns -> ad squads -> ads concurrently.
+
+    The crawler always takes the cheapest listing path the API offers:
+    organizations are listed once together with their ad accounts, and campaigns,
+    ad squads and ads are each listed once per ad account rather than once per parent,
+    fanned out over a bounded pool of ``max_workers`` threads sharing the client's session.
+    """
+
+    LEVELS: typing.Tuple[str, ...] = ('organizations', 'ad_accounts', 'campaigns', 'ad_squads', 'ads')
+
+    def __init__(
+            self,
+            api_client: snap.SnapchatMarketing,
+            max_workers: int = 8,
+            levels: typing.Sequence[str] = LEVELS,
+            on_progress: typing.Optional[ProgressCallback] = None,
+            page_size: int = 1000
+    ) -> None:
+        for level in levels:
+            if level not in self.LEVELS:
+                raise ValueError(f'{level} is not a valid level. Valid levels: {self.LEVELS}')
+
+        self.api_client: snap.SnapchatMarketing = api_client
+        self.max_workers: int = max_workers
+        self.levels: typing.Tuple[str, ...] = tuple(levels)
+        self.on_progress: typing.Optional[ProgressCallback] = on_progress
+        self.page_size: int = page_size
+
+        self._lock = threading.Lock()
+
+    def crawl(
+            self,
+            organization_ids: typing.Optional[typing.Iterable[str]] = None
+    ) -> HierarchySnapshot:
+        """
+        Crawl the hierarchy of every organization the user has access to, or only those in ``organization_ids``.
+        """
+        snapshot = HierarchySnapshot()
+        wanted: typing.Optional[typing.Set[str]] = set(organization_ids) if organization_ids is not None else None
+
+        started = time.perf_counter()
+        listing = typing.cast(
+            typing.List[typing.Tuple[orgs.Organization, typing.List[ad_accountz.AdAccount]]],
+            self.api_client.list_organizations(with_ad_accounts=True)
+        )
+
+        # the accounts drive the fan-out below even when they are not part of the snapshot
+        all_accounts: typing.List[ad_accountz.AdAccount] = []
+        for organization, accounts in listing:
+            if wanted is not None and organization.id not in wanted:
+                continue
+            snapshot.organizations[organization.id] = organization
+            all_accounts.extend(accounts)
+
+            if 'ad_accounts' in self.levels:
+                for account in accounts:
+                    snapshot.ad_accounts[str(account.id)] = account
+                    snapshot._link('ad_accounts', organization.id, str(account.id))
+
+        snapshot.timings['organizations'] = time.perf_counter() - started
+        self._progress('organizations', len(snapshot.organizations), len(snapshot.organizations))
+
+        if 'ad_accounts' in self.levels:
+            snapshot.timings['ad_accounts'] = 0.0  # listed inline with the organizations
+            self._progress('ad_accounts', len(snapshot.ad_accounts), len(snapshot.ad_accounts))
+
+        self._crawl_accounts(snapshot, all_accounts)
+
+        return snapshot
+
+    def _crawl_accounts(
+            self,
+            snapshot: HierarchySnapshot,
+            accounts: typing.List[ad_accountz.AdAccount]
+    ) -> None:
+        """
+        Fan the account-level listings of every requested level out over the worker pool.
+        """
+
+        listers: typing.Dict[str, typing.Callable[[ad_accountz.AdAccount], typing.Iterator[typing.Any]]] = {
+            'campaigns': lambda account: account.iter_campaigns(page_size=self.page_size),
+            'ad_squads': lambda account: account.iter_ad_squads(page_size=self.page_size),
+            'ads': lambda account: account.iter_ads(page_size=self.page_size)
+        }
+        parent_attribute: typing.Dict[str, str] = {
+            'campaigns': 'ad_account_id',
+            'ad_squads': 'campaign_id',
+            'ads': 'ad_squad_id'
+        }
+
+        levels = [level for level in ('campaigns', 'ad_squads', 'ads') if level in self.levels]
+        completed: typing.Dict[str, int] = {level: 0 for level in levels}
+        first_start: typing.Dict[str, float] = {}
+        last_end: typing.Dict[str, float] = {}
+
+        def task(level: str, account: ad_accountz.AdAccount) -> None:
+            start = time.perf_counter()
+            try:
+                entities = list(listers[level](account))
+                error: typing.Optional[BaseException] = None
+            except Exception as e:
+                entities = []
+                error = e
+            end = time.perf_counter()
+
+            with self._lock:
+                first_start[level] = min(first_start.get(level, start), start)
+                last_end[level] = max(last_end.get(level, end), end)
+
+                if error is not None:
+                    snapshot.errors.append((level, str(account.id), error))
+
+                bucket: typing.Dict[str, typing.Any] = getattr(snapshot, level)
+                for entity in entities:
+                    bucket[str(entity.id)] = entity
+                    snapshot._link(level, getattr(entity, parent_attribute[level], None), str(entity.id))
+
+                completed[level] += 1
+                done = completed[level]
+
+            self._progress(level, done, len(accounts))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(task, level, account)
+                for level in levels
+                for account in accounts
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+
+        for level in levels:
+            snapshot.timings[level] = last_end.get(level, 0.0) - first_start.get(level, 0.0)
+
+    def _progress(self, level: str, completed: int, total: int) -> None:
+        if self.on_progress is not None:
+            self.on_progress(level, completed, total)
@@ -1,5 +1,70 @@
+import typing
+
 class PaginationError(Exception):
-    def __init__(self, status_code = None) -> None:
+    def __init__(self, status_code = None, next_link: typing.Optional[str] = None) -> None:
         self.status_code = status_code
+        self.next_link = next_link
+        """The page link that failed; pass it to ``SnapchatMarketing._resume_paginator`` to continue from there."""
+        self.results: typing.List[typing.Dict[str, typing.Any]] = []
+        """Entities fetched before the failure, when the paginator collected them."""
         super(PaginationError, self).__init__(f'Pagination failed. Status code: {self.status_code}')
-        
\ No newline at end of file
+
+    @classmethod
+    def from_error(
+            cls,
+            error: Exception,
+            next_link: str,
+            results: typing.Optional[typing.List[typing.Dict[str, typing.Any]]] = None
+    ) -> 'PaginationError':
+        """
+        Wrap a failed page fetch of the sync or async client, keeping its status code and the link to resume from.
+        """
+        response = getattr(error, 'response', None)
+        # requests errors carry the response, aiohttp ones the status
+        status_code = response.status_code if response is not None else getattr(error, 'status', None)
+
+        pagination_error = cls(status_code=status_code, next_link=next_link)
+        if results is not None:
+            pagination_error.results = results
+        pagination_error.__cause__ = error
+
+        return pagination_error
+        
+
+class BulkItemFailure(typing.NamedTuple):
+    """
+    An item of a bulk create that the API did not accept.
+    """
+
+    index: int
+    """Position of the item in the input list."""
+    item: typing.Dict[str, typing.Any]
+    reason: str
+    """``sub_request_error_reason`` from the API, or the request error when the whole batch failed."""
+
+
+class BulkCreateError(Exception):
+    def __init__(
+            self,
+            failures: typing.List[BulkItemFailure],
+            results: typing.List[typing.Optional[typing.Dict[str, typing.Any]]]
+    ) -> None:
+        self.failures = failures
+        """Items still failing after retries, in input order."""
+        self.results = results
+        """Created entities in input order, with None where the item failed."""
+        super(BulkCreateError, self).__init__(f'Bulk create failed for {len(failures)} of {len(results)} items')
+
+
+class StatsError(Exception):
+    def __init__(
+            self,
+            entity_id: typing.Optional[str],
+            sub_request_status: typing.Optional[str],
+            reason: typing.Optional[str] = None
+    ) -> None:
+        self.entity_id = entity_id
+        self.sub_request_status = sub_request_status
+        self.reason = reason
+        """``sub_request_error_reason`` from the API."""
+        super(StatsError, self).__init__(f'Stats request for {entity_id} failed: {sub_request_status} {reason or ""}'.rstrip())
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import bz2
+import csv
+import gzip
+import io
+import itertools
+import lzma
+import os
+import typing
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None # type: ignore
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError: # pragma: no cover
+    pa = None # type: ignore
+    pq = None # type: ignore
+
+import pysnapchatads.codec as codecs
+import pysnapchatads.columnar as columnar
+import pysnapchatads.snapchat as snap
+from pysnapchatads.helpers import unwrap
+
+if typing.TYPE_CHECKING: # pragma: no cover
+    from pysnapchatads.reporting.analytics import Stats, TimeSeries
+
+FORMATS: typing.Tuple[str, ...] = ('ndjson', 'csv', 'parquet')
+
+_EXTENSIONS: typing.Dict[str, str] = {
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.csv': 'csv',
+    '.parquet': 'parquet'
+}
+
+_COMPRESSED: typing.Dict[str, typing.Callable[..., typing.BinaryIO]] = {
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open
+}
+"""Compression of NDJSON and CSV files. Parquet compresses its pages itself (snappy, zstd, gzip, ...)."""
+
+_COMPRESSED_EXTENSIONS: typing.Dict[str, str] = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+
+Path = typing.Union[str, 'os.PathLike[str]']
+
+
+def _infer(path: Path, format: typing.Optional[str], compression: typing.Optional[str]) -> typing.Tuple[str, typing.Optional[str]]:
+    root, extension = os.path.splitext(os.fspath(path))
+    if extension in _COMPRESSED_EXTENSIONS:
+        compression = compression or _COMPRESSED_EXTENSIONS[extension]
+        extension = os.path.splitext(root)[1]
+
+    format = format or _EXTENSIONS.get(extension)
+    if format not in FORMATS:
+        raise ValueError(f'Cannot export to {os.fspath(path)}: pass format, one of {list(FORMATS)}')
+    if format != 'parquet' and compression is not None and compression not in _COMPRESSED:
+        raise ValueError(f'{compression} is not a valid compression for {format}. Valid: {sorted(_COMPRESSED)}')
+    return format, compression
+
+def _open(path: Path, compression: typing.Optional[str]) -> typing.BinaryIO:
+    if compression is None:
+        return open(path, 'wb')
+    return _COMPRESSED[compression](path, 'wb')
+
+
+class NDJSONWriter(object):
+    """
+    Writes rows as one JSON object per line.
+    """
+
+    def __init__(self, file: typing.BinaryIO, fields: typing.Sequence[str], codec: typing.Optional[codecs.JSONCodec] = None) -> None:
+        self.file = file
+        self.fields = list(fields)
+        self.codec: codecs.JSONCodec = codec if codec is not None else codecs.get_codec()
+
+    def write_rows(self, rows: typing.Iterable[typing.Mapping[str, typing.Any]]) -> None:
+        dumps = self.codec.dumps
+        self.file.write(b''.join(
+            dumps({k: row[k] for k in self.fields if row.get(k) is not None}) + b'\n'
+            for row in rows
+        ))
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class CSVWriter(object):
+    """
+    Writes rows as CSV with a header. Missing values are empty, nested values JSON encoded.
+    """
+
+    def __init__(self, file: typing.BinaryIO, fields: typing.Sequence[str], codec: typing.Optional[codecs.JSONCodec] = None) -> None:
+        self.file = io.TextIOWrapper(file, encoding='utf-8', newline='')
+        self.fields = list(fields)
+        self.codec: codecs.JSONCodec = codec if codec is not None else codecs.get_codec()
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.fields)
+
+    def _cell(self, value: typing.Any) -> typing.Any:
+        if value is None:
+            return ''
+        if isinstance(value, (dict, list)):
+            return self.codec.dumps(value).decode('utf-8')
+        return value
+
+    def write_rows(self, rows: typing.Iterable[typing.Mapping[str, typing.Any]]) -> None:
+        cell = self._cell
+        self.writer.writerows([cell(row.get(k)) for k in self.fields] for row in rows)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ParquetWriter(object):
+    """
+    Writes column chunks as Parquet row groups. Requires pyarrow.
+    """
+
+    def __init__(self, path: Path, schema: typing.Any, compression: typing.Optional[str] = None) -> None:
+        if pq is None:
+            raise ImportError('Parquet export requires pyarrow. Install it with `pip install pysnapchatads[parquet]`.')
+        self.schema = schema
+        self.writer = pq.ParquetWriter(os.fspath(path), schema, compression=compression or 'snappy')
+
+    def write_columns(self, columns: typing.Mapping[str, typing.Any]) -> None:
+        self.writer.write_table(pa.Table.from_arrays([columns[field.name] for field in self.schema], schema=self.schema))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+#################
+# Entities
+#################
+
+_ARROW_TYPES: typing.Dict[str, typing.Callable[[], typing.Any]] = {
+    columnar.MICRO: lambda: pa.int64(),
+    columnar.CATEGORY: lambda: pa.string(),
+    columnar.TIMESTAMP: lambda: pa.timestamp('us', tz='UTC'),
+    columnar.BOOL: lambda: pa.bool_(),
+    columnar.OBJECT: lambda: pa.string()
+}
+
+def _arrow_column(columns: columnar.Columns, name: str, kind: str, codec: codecs.JSONCodec) -> typing.Any:
+    if kind == columnar.CATEGORY:
+        return pa.array(columns.decode(name), type=pa.string())
+    if kind == columnar.OBJECT:
+        return pa.array(
+            [v if v is None or isinstance(v, str) else codec.dumps(v).decode('utf-8') for v in columns[name]],
+            type=pa.string()
+        )
+    column = columns[name]
+    return pa.array(column.data, mask=np.ma.getmaskarray(column), type=_ARROW_TYPES[kind]())
+
+def export_entities(
+        api_client: snap.SnapchatMarketing,
+        plural_parent_entity_name: str,
+        parent_entity_id: str,
+        plural_entity_name: str,
+        path: Path,
+        format: typing.Optional[str] = None,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        compression: typing.Optional[str] = None,
+        chunk_size: int = 10000,
+        page_size: int = 1000,
+        **kwargs
+) -> int:
+    """
+    Stream a listing into a file page by page, without building entity objects.
+
+    Only the current page and one chunk of rows are held in memory, whatever the size of the
+    listing. Columns are the entity's field names (e.g. ``adsquad_type`` for ``type``).
+
+    :param format: ndjson, csv or parquet. Inferred from the file extension when not given.
+    :param fields: Fields to export, in order. Defaults to every field of the entity class.
+    :param compression: gzip, bz2 or xz for NDJSON and CSV (inferred from a .gz, .bz2 or .xz
+        extension); a Parquet codec such as snappy (the default) or zstd for Parquet.
+    :param chunk_size: Rows per write, and per row group in Parquet.
+    :param kwargs: Listing query parameters, e.g. read_deleted_entities.
+
+    :return: Number of rows written.
+    """
+    format, compression = _infer(path, format, compression)
+    entity_class = api_client._entity_classes()[plural_entity_name]
+    pages = api_client._iter_pages(
+        plural_parent_entity_name=plural_parent_entity_name,
+        parent_entity_id=parent_entity_id,
+        plural_entity_name=plural_entity_name,
+        limit=page_size,
+        **kwargs
+    )
+
+    if format == 'parquet':
+        return _export_entities_parquet(api_client, pages, entity_class, fields, path, compression, chunk_size)
+
+    names = list(fields) if fields is not None else list(entity_class.__annotations__)
+    renamed = {field: key for key, field in (entity_class._json_renames or {}).items()}
+    keys = [(name, renamed.get(name, name)) for name in names]
+
+    writer_class = NDJSONWriter if format == 'ndjson' else CSVWriter
+    writer = writer_class(_open(path, compression), names, api_client.codec)
+    written = 0
+    try:
+        rows = ({name: item.get(key) for name, key in keys} for page in pages for item in map(unwrap, page))
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            writer.write_rows(chunk)
+            written += len(chunk)
+    finally:
+        writer.close()
+    return written
+
+def _export_entities_parquet(
+        api_client: snap.SnapchatMarketing,
+        pages: typing.Iterable[typing.List[typing.Dict[str, typing.Any]]],
+        entity_class: typing.Any,
+        fields: typing.Optional[typing.Iterable[str]],
+        path: Path,
+        compression: typing.Optional[str],
+        chunk_size: int
+) -> int:
+    if pa is None:
+        raise ImportError('Parquet export requires pyarrow. Install it with `pip install pysnapchatads[parquet]`.')
+    builder = columnar.ColumnBuilder(entity_class, fields)
+    schema = pa.schema([(name, _ARROW_TYPES[kind]()) for name, kind in builder.kinds.items()])
+    writer = ParquetWriter(path, schema, compression)
+    written = 0
+    pending = 0
+
+    def flush() -> None:
+        columns = builder.finish()
+        writer.write_columns({name: _arrow_column(columns, name, kind, api_client.codec) for name, kind in builder.kinds.items()})
+
+    try:
+        for page in pages:
+            builder.add(page)
+            pending += len(page)
+            if pending >= chunk_size:
+                flush()
+                written, pending = written + pending, 0
+        if pending or not written:
+            flush()
+            written += pending
+    finally:
+        writer.close()
+    return written
+
+
+#################
+# Stats
+#################
+
+def _iter_series(stats: typing.Iterable[typing.Union[Stats, TimeSeries]]) -> typing.Iterator[TimeSeries]:
+    for item in stats:
+        if hasattr(item, 'breakdown'):
+            yield item.series # type: ignore
+            yield from item.breakdown.values() # type: ignore
+        else:
+            yield item # type: ignore
+
+def export_stats(
+        stats: typing.Iterable[typing.Union[Stats, TimeSeries]],
+        path: Path,
+        format: typing.Optional[str] = None,
+        metrics: typing.Optional[typing.Iterable[str]] = None,
+        compression: typing.Optional[str] = None,
+        chunk_size: int = 10000,
+        codec: typing.Optional[codecs.JSONCodec] = None
+) -> int:
+    """
+    Write stats as one row per entity and interval: ``id``, ``start_time``, ``end_time`` and the metrics.
+
+    ``stats`` is consumed lazily, so a generator of ``get_stats`` calls is exported one entity at a
+    time. ``Stats`` are written with the series of their broken down entities.
+
+    :param metrics: Metric columns. Defaults to the metrics of the first series.
+    :param compression: As for ``export_entities``.
+    :param chunk_size: Rows per Parquet row group; text formats are written a series at a time.
+
+    :return: Number of rows written.
+    """
+    format, compression = _infer(path, format, compression)
+    series = _iter_series(stats)
+    first = next(series, None)
+    if first is None:
+        names = list(metrics or ())
+    else:
+        names = list(metrics) if metrics is not None else list(first.metrics)
+        series = itertools.chain([first], series)
+
+    if format == 'parquet':
+        return _export_stats_parquet(series, names, path, compression, chunk_size)
+
+    fields = ['id', 'start_time', 'end_time'] + names
+    writer_class = NDJSONWriter if format == 'ndjson' else CSVWriter
+    writer = writer_class(_open(path, compression), fields, codec)
+    written = 0
+    try:
+        for s in series:
+            columns = [
+                [s.id] * len(s),
+                [t + 'Z' if t != 'NaT' else None for t in np.datetime_as_string(s.start_time, unit='us')],
+                [t + 'Z' if t != 'NaT' else None for t in np.datetime_as_string(s.end_time, unit='us')]
+            ] + [s.metrics[name].tolist() if name in s.metrics else [None] * len(s) for name in names]
+            writer.write_rows(dict(zip(fields, values)) for values in zip(*columns))
+            written += len(s)
+    finally:
+        writer.close()
+    return written
+
+def _export_stats_parquet(
+        series: typing.Iterable[TimeSeries],
+        names: typing.List[str],
+        path: Path,
+        compression: typing.Optional[str],
+        chunk_size: int
+) -> int:
+    if pa is None:
+        raise ImportError('Parquet export requires pyarrow. Install it with `pip install pysnapchatads[parquet]`.')
+
+    # float64 metrics, so series with int and float values of a metric share a schema
+    timestamp = pa.timestamp('us', tz='UTC')
+    schema = pa.schema([('id', pa.string()), ('start_time', timestamp), ('end_time', timestamp)] + [(name, pa.float64()) for name in names])
+    writer = ParquetWriter(path, schema, compression)
+    pending: typing.List[typing.Dict[str, typing.Any]] = []
+    pending_rows = 0
+    written = 0
+
+    def flush() -> None:
+        writer.write_columns({name: pa.concat_arrays([chunk[name] for chunk in pending]) for name in schema.names})
+        pending.clear()
+
+    try:
+        for s in series:
+            columns: typing.Dict[str, typing.Any] = {
+                'id': pa.array([s.id] * len(s), type=pa.string()),
+                'start_time': pa.array(s.start_time, type=timestamp),
+                'end_time': pa.array(s.end_time, type=timestamp)
+            }
+            for name in names:
+                values = s.metrics.get(name)
+                if values is None or values.dtype == object:
+                    columns[name] = pa.nulls(len(s), type=pa.float64())
+                else:
+                    columns[name] = pa.array(np.ma.getdata(values).astype(np.float64), mask=np.ma.getmaskarray(values), type=pa.float64())
+            pending.append(columns)
+            pending_rows += len(s)
+            if pending_rows >= chunk_size:
+                flush()
+                written, pending_rows = written + pending_rows, 0
+        if pending:
+            flush()
+            written += pending_rows
+    finally:
+        writer.close()
+    return written
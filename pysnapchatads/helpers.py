@@ -1,8 +1,17 @@
 from urllib.parse import urljoin
+import datetime as dt
 import typing
 import requests
+from dateutil import parser as dateparser
 def build_url(base_url: str, endpoint: str, path: typing.Optional[str] = None ) -> str:
     
+    # urljoin replaces the last path segment unless the base ends with a slash,
+    # which would drop the API version from the base url
+    if not base_url.endswith('/'):
+        base_url += '/'
+    if endpoint.startswith('/'):
+        endpoint = endpoint[1:]
+
     url_result: str = urljoin(base_url, endpoint)
 
     if path:
@@ -18,13 +27,61 @@ def build_url(base_url: str, endpoint: str, path: typing.Optional[str] = None )
 
     return url_result
 
-def refresh_access_token(
+def build_params(**kwargs) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """
+    Build query parameters for a listing call, dropping unset values
+    and encoding booleans the way the API expects them.
+    """
+
+    params: typing.Dict[str, typing.Any] = {
+        k: (str(v).lower() if isinstance(v, bool) else v)
+        for k, v in kwargs.items()
+        if v is not None
+    }
+
+    return params or None
+
+def unwrap(item: typing.Mapping[str, typing.Any]) -> typing.Mapping[str, typing.Any]:
+    """
+    Return the entity inside a ``{"sub_request_status": ..., "<entity>": {...}}`` item, or the item itself.
+    """
+    if 'id' in item:
+        return item
+    for value in item.values():
+        if isinstance(value, typing.Mapping) and 'id' in value:
+            return value
+    return item
+
+def unwrap_page(items: typing.List[typing.Mapping[str, typing.Any]]) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    The entities of a listing page, out of their ``sub_request_status`` envelopes.
+    """
+    return typing.cast(typing.List[typing.Dict[str, typing.Any]], [unwrap(item) for item in items])
+
+def parse_timestamp(value: typing.Union[str, dt.datetime, None]) -> typing.Optional[dt.datetime]:
+    """
+    Parse an API timestamp. The API sends ISO-8601 (``2023-01-01T00:00:00.000Z``), which
+    ``datetime.fromisoformat`` reads directly; anything else falls back to dateutil.
+    """
+
+    if value is None or isinstance(value, dt.datetime):
+        return value
+
+    # fromisoformat only accepts a trailing 'Z' from Python 3.11
+    iso = value[:-1] + '+00:00' if value.endswith('Z') else value
+    try:
+        return dt.datetime.fromisoformat(iso)
+    except ValueError:
+        return dateparser.parse(value)
+
+def request_access_token(
         client_id: str,
         client_secret: str,
         refresh_token: str
-) -> str:
+) -> typing.Dict[str, typing.Any]:
     """
-    Helper function to refresh an access token.
+    Exchange a refresh token for a new access token. Returns the whole token response:
+    ``access_token``, ``expires_in`` (seconds) and ``refresh_token``.
     """
 
     URL = 'https://accounts.snapchat.com/login/oauth2/access_token'
@@ -36,5 +93,21 @@ def refresh_access_token(
     }
 
     response = requests.post(url=URL, data=data)
+    response.raise_for_status()
+
+    return response.json()
+
+def refresh_access_token(
+        client_id: str,
+        client_secret: str,
+        refresh_token: str
+) -> str:
+    """
+    Helper function to refresh an access token.
+    """
 
-    return response.json()['access_token']
\ No newline at end of file
+    return request_access_token(
+        client_id=client_id,
+        client_secret=client_secret,
+        refresh_token=refresh_token
+    )['access_token']
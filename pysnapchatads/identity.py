@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+import typing
+import weakref
+
+T = typing.TypeVar('T')
+
+
+class IdentityMap(object):
+    """
+    One live object per ``(entity class, id)`` for a client.
+
+    Objects are held weakly, so the map never keeps an entity alive on its own: an entity
+    nobody references any more is dropped, and the next read builds a fresh one.
+    """
+
+    def __init__(self) -> None:
+        # plain references without callbacks are shared per object and cheap to make;
+        # dead ones are pruned whenever the map has doubled since the last sweep
+        self._objects: typing.Dict[typing.Tuple[type, str], weakref.ReferenceType[typing.Any]] = {}
+        self._prune_at = 1024
+        self._lock = threading.Lock()
+
+    def get(self, entity_class: typing.Type[T], entity_id: typing.Any) -> typing.Optional[T]:
+        if entity_id is None:
+            return None
+        ref = self._objects.get((entity_class, str(entity_id)))
+        return ref() if ref is not None else None
+
+    def setdefault(self, entity: T) -> T:
+        """
+        The live object with the entity's identity, registering ``entity`` if there is none.
+        """
+        entity_id = getattr(entity, 'id', None)
+        if entity_id is None:
+            return entity
+        key = (type(entity), str(entity_id))
+        with self._lock:
+            ref = self._objects.get(key)
+            existing = ref() if ref is not None else None
+            if existing is not None:
+                return existing
+            self._objects[key] = weakref.ref(entity)
+            if len(self._objects) >= self._prune_at:
+                self._prune()
+            return entity
+
+    def setdefault_many(self, entities: typing.Iterable[T]) -> typing.List[T]:
+        """
+        ``setdefault`` for each entity, under a single lock acquisition.
+        """
+        objects = self._objects
+        results: typing.List[T] = []
+        with self._lock:
+            for entity in entities:
+                entity_id = getattr(entity, 'id', None)
+                if entity_id is not None:
+                    key = (type(entity), str(entity_id))
+                    ref = objects.get(key)
+                    existing = ref() if ref is not None else None
+                    if existing is not None:
+                        entity = existing
+                    else:
+                        objects[key] = weakref.ref(entity)
+                results.append(entity)
+            if len(self._objects) >= self._prune_at:
+                self._prune()
+        return results
+
+    def _prune(self) -> None:
+        self._objects = {k: ref for k, ref in self._objects.items() if ref() is not None}
+        self._prune_at = max(1024, 2 * len(self._objects))
+
+    def discard(self, entity_class: type, entity_id: typing.Any) -> None:
+        with self._lock:
+            self._objects.pop((entity_class, str(entity_id)), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._objects.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(1 for ref in self._objects.values() if ref() is not None)
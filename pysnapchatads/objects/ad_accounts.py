@@ -4,14 +4,18 @@ import datetime as dt
 from dateutil import parser as dateparser
 import pysnapchatads.base as base
 import pysnapchatads.snapchat as snap
-import pysnapchatads.objects.campaigns as campaigns
+import pysnapchatads.reporting.analytics as analytics
+import pysnapchatads.columnar as columnar
+from pysnapchatads.helpers import unwrap
+import pysnapchatads.objects.campaigns as campaignz
 import pysnapchatads.objects.ad_squads as ad_squads
+import pysnapchatads.objects.ads as ads
 import typing
 import typing_extensions
 import logging
 import types
 
-class AdAccount(base.SnapchatMarketingBase):
+class AdAccount(base.SnapchatMarketingBase, analytics.AnalyticsMixin):
     """
     An Ad Account is owned by an Organization and contains Ad Campaigns.
     Ad Accounts have one or more Funding Sources(Credit card, Paypal, Lines of Credit etc).
@@ -19,6 +23,9 @@ class AdAccount(base.SnapchatMarketingBase):
     More information: https://marketingapi.snapchat.com/docs/#ad-accounts
     """
 
+    id: str
+    updated_at: typing.Optional[dt.datetime]
+    created_at: typing.Optional[dt.datetime]
     advertiser: str
     currency: str
     funding_source_ids: typing.List[str]
@@ -41,6 +48,13 @@ class AdAccount(base.SnapchatMarketingBase):
     client_paying_invoices: typing.Optional[bool]
     agency_client_metadata: typing.Optional[typing.Dict[typing.Any, typing.Any]]
     delivery_status: typing.Optional[typing.Any]
+    billing_center_id: typing.Optional[str]
+
+    # where the entity lives in the API, used to group batched writes (unannotated so they are not fields)
+    _plural_entity_name = 'adaccounts'
+    _plural_parent_entity_name = 'organizations'
+    _parent_id_field = 'organization_id'
+    _json_renames = {'type': 'account_type'}
 
     def __init__(
         self,
@@ -50,12 +64,8 @@ class AdAccount(base.SnapchatMarketingBase):
         super(AdAccount, self).__init__()
         self.api_client: snap.SnapchatMarketing = api_client
         
-        # validate kwargs
-        for k,v in kwargs.items():
-            if k not in self.__class__.__annotations__.keys():
-                raise AttributeError(f'{k} is not a valid attribute for {self.__class__.__name__}')
-            else:
-                setattr(self, k, v)
+        # validate and set kwargs
+        self._set_fields(kwargs)
 
     @classmethod
     def from_json(
@@ -69,13 +79,8 @@ class AdAccount(base.SnapchatMarketingBase):
         :api_client: SnapchatMarketing API object
         :json_data: JSON data
         """
-        json_data['account_type'] = json_data.pop('type')
-
-        # make sure the type key was removed
-        if 'type' in json_data:
-            del json_data['type']
-        
-        return AdAccount(api_client=api_client, **json_data)
+        # 'type' is read into account_type; json_data is left untouched
+        return cls._deserializers().one(api_client, json_data)
     
 
     def update(
@@ -104,12 +109,18 @@ class AdAccount(base.SnapchatMarketingBase):
             else:
                 setattr(self, k, v)
 
+        batch = self.api_client._active_batch()
+        if batch is not None:
+            batch.update(self)
+            return
+
         self.api_client._update_entities(
             plural_parent_entity_name = 'organizations',
             parent_entity_id = self.organization_id,
             plural_entity_name ='adaccounts',
             data = [super(AdAccount, self).__dict__()]
         )
+        self._mark_clean()
 
     
     ###############
@@ -119,7 +130,7 @@ class AdAccount(base.SnapchatMarketingBase):
     def list_campaigns(
             self,
             read_deleted_entities: typing.Optional[bool] = True
-    ) -> typing.List[campaigns.Campaign]:
+    ) -> typing.List[campaignz.Campaign]:
         """
         List all Ad Campaigns for an Ad Account.
         """
@@ -131,8 +142,84 @@ class AdAccount(base.SnapchatMarketingBase):
             read_deleted_entities=read_deleted_entities
         )
 
-        return [campaigns.Campaign.from_json(self.api_client, d) for d in response_data]
-    
+        return campaignz.Campaign.from_json_many(self.api_client, response_data)
+
+    def iter_campaigns(
+            self,
+            read_deleted_entities: typing.Optional[bool] = True,
+            page_size: int = 1000,
+            prefetch: typing.Optional[int] = None
+    ) -> typing.Iterator[campaignz.Campaign]:
+        """
+        Stream the Ad Campaigns of an Ad Account page by page, without materialising the whole listing.
+        """
+
+        for d in self.api_client._iter_many_entities(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='campaigns',
+            limit=page_size,
+            prefetch=prefetch,
+            read_deleted_entities=read_deleted_entities
+        ):
+            yield campaignz.Campaign.from_json(self.api_client, d)
+
+    async def list_campaigns_async(
+            self,
+            read_deleted_entities: typing.Optional[bool] = True
+    ) -> typing.List[campaignz.Campaign]:
+        """
+        List all Ad Campaigns for an Ad Account, using an AsyncSnapchatMarketing client.
+        """
+
+        response_data: typing.List[typing.Dict[str, typing.Any]] = await self.api_client._get_many_entities( # type: ignore
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='campaigns',
+            read_deleted_entities=read_deleted_entities
+        )
+
+        return campaignz.Campaign.from_json_many(self.api_client, response_data)
+
+    def list_campaigns_columnar(
+            self,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            read_deleted_entities: typing.Optional[bool] = True,
+            page_size: int = 1000
+    ) -> columnar.Columns:
+        """
+        The Ad Campaigns of an Ad Account as columns (one NumPy array per field) built page by page,
+        without creating objects. Requires numpy.
+        """
+
+        return self.api_client._get_many_columns(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='campaigns',
+            fields=fields,
+            limit=page_size,
+            read_deleted_entities=read_deleted_entities
+        )
+
+    def iter_campaigns_columnar(
+            self,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            read_deleted_entities: typing.Optional[bool] = True,
+            page_size: int = 1000
+    ) -> typing.Iterator[columnar.Columns]:
+        """
+        Stream the Ad Campaigns of an Ad Account as columns, one page at a time. Requires numpy.
+        """
+
+        yield from self.api_client._iter_many_columns(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='campaigns',
+            fields=fields,
+            limit=page_size,
+            read_deleted_entities=read_deleted_entities
+        )
+
     def create_campaign(
             self,
             name: str,
@@ -140,7 +227,7 @@ class AdAccount(base.SnapchatMarketingBase):
             start_time: typing.Union[dt.datetime, str],
             status: str,
             **kwargs
-    ) -> campaigns.Campaign:
+    ) -> campaignz.Campaign:
         """
         Create a campaign.
         """
@@ -175,7 +262,29 @@ class AdAccount(base.SnapchatMarketingBase):
             data = [campaign_post_body]
         )
 
-        return campaigns.Campaign.from_json(self.api_client, return_data[0])
+        return campaignz.Campaign.from_json(self.api_client, return_data[0])
+
+    def create_campaigns(
+            self,
+            json_lists: typing.List[typing.Dict[str, typing.Any]],
+            batch_size: int = 500,
+            max_workers: int = 4
+    ) -> typing.List[campaignz.Campaign]:
+        """
+        Create any number of campaigns in this ad account, in batches posted concurrently.
+        Raises BulkCreateError with the partial results if some campaigns could not be created.
+        """
+
+        return_data = self.api_client._bulk_create_entities(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='campaigns',
+            data=[{'ad_account_id': str(self.id), **d} for d in json_lists],
+            batch_size=batch_size,
+            max_workers=max_workers
+        )
+
+        return campaignz.Campaign.from_json_many(self.api_client, map(unwrap, return_data))
     
     
     ##############
@@ -199,4 +308,179 @@ class AdAccount(base.SnapchatMarketingBase):
             return_placement_v2=return_placement_v2
         )
 
-        return [ad_squads.AdSquad.from_json(self.api_client, d) for d in response_data]
\ No newline at end of file
+        return ad_squads.AdSquad.from_json_many(self.api_client, response_data)
+
+    def iter_ad_squads(
+            self,
+            return_placement_v2: typing.Optional[bool] = True,
+            read_deleted_entities: typing.Optional[bool] = True,
+            page_size: int = 1000,
+            prefetch: typing.Optional[int] = None
+    ) -> typing.Iterator[ad_squads.AdSquad]:
+        """
+        Stream the Ad Squads of an Ad Account page by page, without materialising the whole listing.
+        """
+
+        for d in self.api_client._iter_many_entities(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='adsquads',
+            limit=page_size,
+            prefetch=prefetch,
+            read_deleted_entities=read_deleted_entities,
+            return_placement_v2=return_placement_v2
+        ):
+            yield ad_squads.AdSquad.from_json(self.api_client, d)
+
+    async def list_ad_squads_async(
+            self,
+            return_placement_v2: typing.Optional[bool] = True,
+            read_deleted_entities: typing.Optional[bool] = True
+    ) -> typing.List[ad_squads.AdSquad]:
+        """
+        List all Ad Squads for an Ad Account, using an AsyncSnapchatMarketing client.
+        """
+
+        response_data: typing.List[typing.Dict[str, typing.Any]] = await self.api_client._get_many_entities( # type: ignore
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='adsquads',
+            read_deleted_entities=read_deleted_entities,
+            return_placement_v2=return_placement_v2
+        )
+
+        return ad_squads.AdSquad.from_json_many(self.api_client, response_data)
+
+    def list_ad_squads_columnar(
+            self,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            return_placement_v2: typing.Optional[bool] = True,
+            read_deleted_entities: typing.Optional[bool] = True,
+            page_size: int = 1000
+    ) -> columnar.Columns:
+        """
+        The Ad Squads of an Ad Account as columns (one NumPy array per field) built page by page,
+        without creating objects. Requires numpy.
+        """
+
+        return self.api_client._get_many_columns(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='adsquads',
+            fields=fields,
+            limit=page_size,
+            read_deleted_entities=read_deleted_entities,
+            return_placement_v2=return_placement_v2
+        )
+
+    def iter_ad_squads_columnar(
+            self,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            return_placement_v2: typing.Optional[bool] = True,
+            read_deleted_entities: typing.Optional[bool] = True,
+            page_size: int = 1000
+    ) -> typing.Iterator[columnar.Columns]:
+        """
+        Stream the Ad Squads of an Ad Account as columns, one page at a time. Requires numpy.
+        """
+
+        yield from self.api_client._iter_many_columns(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='adsquads',
+            fields=fields,
+            limit=page_size,
+            read_deleted_entities=read_deleted_entities,
+            return_placement_v2=return_placement_v2
+        )
+
+    ##############
+    # Relationships
+    ##############
+
+    @base.relationship
+    def campaigns(self) -> typing.List[campaignz.Campaign]:
+        """
+        The Ad Campaigns of this Ad Account, loaded on first access.
+        """
+        return self.list_campaigns()
+
+    ##############
+    # Ads
+    ##############
+
+    def list_ads(
+            self,
+            read_deleted_entities: typing.Optional[bool] = True
+    ) -> typing.List[ads.Ad]:
+        """
+        List all Ads for an Ad Account.
+        """
+
+        response_data: typing.List[typing.Dict[str, typing.Any]] = self.api_client._get_many_entities(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='ads',
+            read_deleted_entities=read_deleted_entities
+        )
+
+        return ads.Ad.from_json_many(self.api_client, response_data)
+
+    def iter_ads(
+            self,
+            read_deleted_entities: typing.Optional[bool] = True,
+            page_size: int = 1000,
+            prefetch: typing.Optional[int] = None
+    ) -> typing.Iterator[ads.Ad]:
+        """
+        Stream the Ads of an Ad Account page by page, without materialising the whole listing.
+        """
+
+        for d in self.api_client._iter_many_entities(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='ads',
+            limit=page_size,
+            prefetch=prefetch,
+            read_deleted_entities=read_deleted_entities
+        ):
+            yield ads.Ad.from_json(self.api_client, d)
+
+    def list_ads_columnar(
+            self,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            read_deleted_entities: typing.Optional[bool] = True,
+            page_size: int = 1000
+    ) -> columnar.Columns:
+        """
+        The Ads of an Ad Account as columns (one NumPy array per field) built page by page,
+        without creating objects. Requires numpy.
+        """
+
+        return self.api_client._get_many_columns(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='ads',
+            fields=fields,
+            limit=page_size,
+            read_deleted_entities=read_deleted_entities
+        )
+
+    def iter_ads_columnar(
+            self,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            read_deleted_entities: typing.Optional[bool] = True,
+            page_size: int = 1000
+    ) -> typing.Iterator[columnar.Columns]:
+        """
+        Stream the Ads of an Ad Account as columns, one page at a time. Requires numpy.
+        """
+
+        yield from self.api_client._iter_many_columns(
+            plural_parent_entity_name='adaccounts',
+            parent_entity_id=str(self.id),
+            plural_entity_name='ads',
+            fields=fields,
+            limit=page_size,
+            read_deleted_entities=read_deleted_entities
+        )
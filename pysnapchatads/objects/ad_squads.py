@@ -4,18 +4,27 @@ import datetime as dt
 from dateutil import parser as dateparser
 import pysnapchatads.base as base
 import pysnapchatads.snapchat as snap
+import pysnapchatads.reporting.analytics as analytics
+import pysnapchatads.columnar as columnar
+import pysnapchatads.objects.ads as adz
 import typing
 import typing_extensions
 import logging
 import types
 
-class AdSquad(base.SnapchatMarketingBase):
+if typing.TYPE_CHECKING: # pragma: no cover
+    import pysnapchatads.objects.campaigns as campaigns
+
+class AdSquad(base.SnapchatMarketingBase, analytics.AnalyticsMixin):
     """
     An Ad Squad is owned by a Campaign and contains one or more Ads.
 
     More info: https://marketingapi.snapchat.com/docs/#ad-squads
     """
 
+    id: str
+    updated_at: typing.Optional[dt.datetime]
+    created_at: typing.Optional[dt.datetime]
     campaign_id: str
     bid_micro: typing.Union[float, int, str]
     billing_event: str
@@ -56,6 +65,8 @@ class AdSquad(base.SnapchatMarketingBase):
     impression_goal: typing.Union[float, int, str]
 
     pacing_type: typing.Optional[str]
+    included_content_types: typing.Optional[typing.List[str]]
+    excluded_content_types: typing.Optional[typing.List[str]]
     event_sources: typing.Optional[typing.List[str]]
     """Required when in SKAdnetwork."""
 
@@ -66,6 +77,12 @@ class AdSquad(base.SnapchatMarketingBase):
     separated_types: typing.Optional[typing.Dict[str, typing.Any]]
     """Read-only."""
 
+    # where the entity lives in the API, used to group batched writes (unannotated so they are not fields)
+    _plural_entity_name = 'adsquads'
+    _plural_parent_entity_name = 'campaigns'
+    _parent_id_field = 'campaign_id'
+    _json_renames = {'type': 'adsquad_type'}
+
     def __init__(
         self,
         api_client: snap.SnapchatMarketing,
@@ -74,11 +91,8 @@ class AdSquad(base.SnapchatMarketingBase):
         super(AdSquad, self).__init__()
         self.api_client: snap.SnapchatMarketing = api_client
         
-        for k, v in kwargs.items():
-            if k not in self.__class__.__annotations__.keys():
-                raise AttributeError(f'{k} is not a valid attribute for {self.__class__.__name__}')
-            else:
-                setattr(self, k, v)
+        # validate and set kwargs
+        self._set_fields(kwargs)
         
     @classmethod
     def from_json(
@@ -89,10 +103,7 @@ class AdSquad(base.SnapchatMarketingBase):
         """
         Deserialize a JSON object into a class instance.
         """
-        return cls(
-                    api_client=api_client,
-                    **json_data
-                )
+        return cls._deserializers().one(api_client, json_data)
     
     def update(
         self,
@@ -159,18 +170,94 @@ class AdSquad(base.SnapchatMarketingBase):
         if pacing_type:
             self.pacing_type = pacing_type
 
+        batch = self.api_client._active_batch()
+        if batch is not None:
+            batch.update(self)
+            return
+
         self.api_client._update_entities(
             plural_parent_entity_name='campaigns',
             parent_entity_id=self.campaign_id,
             plural_entity_name='adsquads',
             data=[self.__dict__()]
         )
+        self._mark_clean()
         
     
+    ##############
+    # Ads
+    ##############
+
+    def list_ads(self) -> typing.List[adz.Ad]:
+        """
+        List all Ads under this Ad Squad.
+        """
+
+        response_data: typing.List[typing.Dict[str, typing.Any]] = self.api_client._get_many_entities(
+            plural_parent_entity_name='adsquads',
+            parent_entity_id=str(self.id),
+            plural_entity_name='ads'
+        )
+
+        return adz.Ad.from_json_many(self.api_client, response_data)
+
+    def list_ads_columnar(
+            self,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            page_size: int = 1000
+    ) -> columnar.Columns:
+        """
+        The Ads under this Ad Squad as columns (one NumPy array per field) built page by page,
+        without creating objects. Requires numpy.
+        """
+
+        return self.api_client._get_many_columns(
+            plural_parent_entity_name='adsquads',
+            parent_entity_id=str(self.id),
+            plural_entity_name='ads',
+            fields=fields,
+            limit=page_size
+        )
+
+    def iter_ads_columnar(
+            self,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            page_size: int = 1000
+    ) -> typing.Iterator[columnar.Columns]:
+        """
+        Stream the Ads under this Ad Squad as columns, one page at a time. Requires numpy.
+        """
+
+        yield from self.api_client._iter_many_columns(
+            plural_parent_entity_name='adsquads',
+            parent_entity_id=str(self.id),
+            plural_entity_name='ads',
+            fields=fields,
+            limit=page_size
+        )
+
     def __dict__(self) -> typing.Dict[str, typing.Any]: # type: ignore
         
         return {
             k: getattr(self, k)
             for k in self.__class__.__annotations__.keys() \
-            if k != 'api_client'
-        }
\ No newline at end of file
+            if k != 'api_client' and hasattr(self, k)
+        }
+
+    ##############
+    # Relationships
+    ##############
+
+    @base.relationship
+    def campaign(self) -> campaigns.Campaign:
+        """
+        The campaign of this Ad Squad, loaded on first access.
+        """
+        return self.api_client._get_entity_object('campaigns', self.campaign_id)
+
+    @base.relationship
+    def ads(self) -> typing.List[adz.Ad]:
+        """
+        The Ads under this Ad Squad, loaded on first access.
+        """
+        return self.list_ads()
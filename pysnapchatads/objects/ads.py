@@ -4,12 +4,16 @@ import datetime as dt
 from dateutil import parser as dateparser
 import pysnapchatads.base as base
 import pysnapchatads.snapchat as snap
+import pysnapchatads.reporting.analytics as analytics
 import typing
 import typing_extensions
 import logging
 import types
 
-class Ad(base.SnapchatMarketingBase):
+if typing.TYPE_CHECKING: # pragma: no cover
+    import pysnapchatads.objects.ad_squads as ad_squads
+
+class Ad(base.SnapchatMarketingBase, analytics.AnalyticsMixin):
     """
     Ad is a light weight entity that contains all the information needed to display the ad. 
     It also contains a third party measurement URL if needed.
@@ -17,6 +21,9 @@ class Ad(base.SnapchatMarketingBase):
     More information: https://marketingapi.snapchat.com/docs/#ads
     """
 
+    id: str
+    updated_at: typing.Optional[dt.datetime]
+    created_at: typing.Optional[dt.datetime]
     ad_squad_id: str
     creative_id: str
     name: str
@@ -34,4 +41,39 @@ class Ad(base.SnapchatMarketingBase):
     delivery_status: typing.Any
     """Read only."""
     deleted: typing.Optional[bool]
-    """Read only."""
\ No newline at end of file
+    """Read only."""
+
+    # where the entity lives in the API, used to group batched writes (unannotated so they are not fields)
+    _plural_entity_name = 'ads'
+    _plural_parent_entity_name = 'adsquads'
+    _parent_id_field = 'ad_squad_id'
+    _json_renames = {'type': 'ad_type'}
+
+    def __init__(
+        self,
+        api_client: snap.SnapchatMarketing,
+        **kwargs
+    ) -> None:
+        super(Ad, self).__init__()
+        self.api_client: snap.SnapchatMarketing = api_client
+
+        # validate and set kwargs
+        self._set_fields(kwargs)
+
+    @classmethod
+    def from_json(
+        cls,
+        api_client: snap.SnapchatMarketing,
+        json_data: typing.Dict[str, typing.Any]
+    ) -> Ad:
+        """
+        Deserialize a JSON object into an Ad.
+        """
+        return cls._deserializers().one(api_client, json_data)
+
+    @base.relationship
+    def ad_squad(self) -> ad_squads.AdSquad:
+        """
+        The Ad Squad of this Ad, loaded on first access.
+        """
+        return self.api_client._get_entity_object('adsquads', self.ad_squad_id)
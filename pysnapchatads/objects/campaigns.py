@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 import datetime as dt
-from dateutil import parser as dateparser
 import pysnapchatads.base as base
 import pysnapchatads.snapchat as snap
-import pysnapchatads.objects.ad_squads as ad_squads
+import pysnapchatads.reporting.analytics as analytics
+import pysnapchatads.columnar as columnar
+from pysnapchatads.helpers import unwrap
+import pysnapchatads.objects.ad_squads as ad_squadz
 import typing
 import typing_extensions
 import logging
 import types
 
-class Campaign(base.SnapchatMarketingBase):
+if typing.TYPE_CHECKING: # pragma: no cover
+    import pysnapchatads.objects.ad_accounts as ad_accounts
+
+class Campaign(base.SnapchatMarketingBase, analytics.AnalyticsMixin):
     """
     A campaign represents a Snap campaign.
     """
     
+    id: str
+    updated_at: typing.Optional[dt.datetime]
+    created_at: typing.Optional[dt.datetime]
     ad_account_id: str
     daily_budget_micro: typing.Optional[typing.Union[int, float]]
     end_time: dt.datetime
@@ -30,6 +38,12 @@ class Campaign(base.SnapchatMarketingBase):
     """Read only."""
     deleted: typing.Optional[bool]
 
+    # where the entity lives in the API, used to group batched writes (unannotated so they are not fields)
+    _plural_entity_name = 'campaigns'
+    _plural_parent_entity_name = 'adaccounts'
+    _parent_id_field = 'ad_account_id'
+    _json_renames = {}
+
     def __init__(
         self,
         api_client: snap.SnapchatMarketing,
@@ -38,12 +52,8 @@ class Campaign(base.SnapchatMarketingBase):
         super(Campaign, self).__init__()
         self.api_client: snap.SnapchatMarketing = api_client
 
-        # validate kwargs
-        for k,v in kwargs.items():
-            if k not in self.__class__.__annotations__.keys():
-                raise AttributeError(f'{k} is not a valid attribute for {self.__class__.__name__}')
-            else:
-                setattr(self, k, v)
+        # validate and set kwargs
+        self._set_fields(kwargs)
 
     @classmethod
     def from_json(
@@ -61,7 +71,7 @@ class Campaign(base.SnapchatMarketingBase):
         :return: Campaign
         """
 
-        return Campaign(api_client=api_client, **json_data)
+        return cls._deserializers().one(api_client, json_data)
     
     def update(
             self,
@@ -83,20 +93,26 @@ class Campaign(base.SnapchatMarketingBase):
         if status:
             self.status = status
         if start_time:
-            self.start_time = dateparser.parse(start_time) if isinstance(start_time, str) else start_time
+            self.start_time = start_time
         if lifetime_spend_cap_micro:
             self.lifetime_spend_cap_micro = float(lifetime_spend_cap_micro)
         if daily_budget_micro:
             self.daily_budget_micro = float(daily_budget_micro)
         if end_time:
-            self.end_time = dateparser.parse(end_time) if isinstance(end_time, str) else end_time
+            self.end_time = end_time
         
+        batch = self.api_client._active_batch()
+        if batch is not None:
+            batch.update(self)
+            return
+
         self.api_client._update_entities(
             plural_parent_entity_name='adaccounts',
             parent_entity_id=self.ad_account_id,
             plural_entity_name='campaigns',
             data=[self.__dict__()]
         )
+        self._mark_clean()
     
     def delete(self) -> None:
         """
@@ -104,7 +120,7 @@ class Campaign(base.SnapchatMarketingBase):
         """
         self.api_client._delete_entity(
             plural_entity_name='campaigns',
-            entity_id=self.ad_account_id
+            entity_id=str(self.id)
         )
 
     #################
@@ -114,7 +130,7 @@ class Campaign(base.SnapchatMarketingBase):
     def list_ad_squads(
             self,
             return_placement_v2: typing.Optional[bool] = True
-    ) -> typing.List[ad_squads.AdSquad]:
+    ) -> typing.List[ad_squadz.AdSquad]:
         """
         List ad squads under this campaign.
         """
@@ -125,7 +141,81 @@ class Campaign(base.SnapchatMarketingBase):
             return_placement_v2=return_placement_v2
         )
 
-        return [ad_squads.AdSquad.from_json(self.api_client, x) for x in data_response]
+        return ad_squadz.AdSquad.from_json_many(self.api_client, data_response)
+
+    def iter_ad_squads(
+            self,
+            return_placement_v2: typing.Optional[bool] = True,
+            page_size: int = 1000,
+            prefetch: typing.Optional[int] = None
+    ) -> typing.Iterator[ad_squadz.AdSquad]:
+        """
+        Stream ad squads under this campaign page by page.
+        """
+        for x in self.api_client._iter_many_entities(
+            plural_parent_entity_name='campaigns',
+            parent_entity_id=str(self.id),
+            plural_entity_name='adsquads',
+            limit=page_size,
+            prefetch=prefetch,
+            return_placement_v2=return_placement_v2
+        ):
+            yield ad_squadz.AdSquad.from_json(self.api_client, x)
+
+    def list_ad_squads_columnar(
+            self,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            return_placement_v2: typing.Optional[bool] = True,
+            page_size: int = 1000
+    ) -> columnar.Columns:
+        """
+        The ad squads under this campaign as columns (one NumPy array per field) built page by page,
+        without creating objects. Requires numpy.
+        """
+
+        return self.api_client._get_many_columns(
+            plural_parent_entity_name='campaigns',
+            parent_entity_id=str(self.id),
+            plural_entity_name='adsquads',
+            fields=fields,
+            limit=page_size,
+            return_placement_v2=return_placement_v2
+        )
+
+    def iter_ad_squads_columnar(
+            self,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            return_placement_v2: typing.Optional[bool] = True,
+            page_size: int = 1000
+    ) -> typing.Iterator[columnar.Columns]:
+        """
+        Stream the ad squads under this campaign as columns, one page at a time. Requires numpy.
+        """
+
+        yield from self.api_client._iter_many_columns(
+            plural_parent_entity_name='campaigns',
+            parent_entity_id=str(self.id),
+            plural_entity_name='adsquads',
+            fields=fields,
+            limit=page_size,
+            return_placement_v2=return_placement_v2
+        )
+
+    async def list_ad_squads_async(
+            self,
+            return_placement_v2: typing.Optional[bool] = True
+    ) -> typing.List[ad_squadz.AdSquad]:
+        """
+        List ad squads under this campaign, using an AsyncSnapchatMarketing client.
+        """
+        data_response: typing.List[typing.Dict[str, typing.Any]] = await self.api_client._get_many_entities( # type: ignore
+            plural_parent_entity_name='campaigns',
+            parent_entity_id=str(self.id),
+            plural_entity_name='adsquads',
+            return_placement_v2=return_placement_v2
+        )
+
+        return ad_squadz.AdSquad.from_json_many(self.api_client, data_response)
     
     def create_ad_squad(
             self,
@@ -144,7 +234,7 @@ class Campaign(base.SnapchatMarketingBase):
             daily_budget_micro: typing.Optional[typing.Union[float, str, int]] = None,
             lifetime_budget_micro: typing.Optional[typing.Union[float, str, int]] = None,
             **kwargs
-    ) -> ad_squads.AdSquad:
+    ) -> ad_squadz.AdSquad:
         """
         Create an ad squad under this campaign.
         """
@@ -195,9 +285,49 @@ class Campaign(base.SnapchatMarketingBase):
             data=[post_data]
         )
 
-        return ad_squads.AdSquad.from_json(self.api_client, response_data[0])
+        return ad_squadz.AdSquad.from_json(self.api_client, response_data[0])
+
+    def create_ad_squads(
+            self,
+            json_lists: typing.List[typing.Dict[str, typing.Any]],
+            batch_size: int = 500,
+            max_workers: int = 4
+    ) -> typing.List[ad_squadz.AdSquad]:
+        """
+        Create any number of ad squads in this campaign, in batches posted concurrently.
+        Raises BulkCreateError with the partial results if some ad squads could not be created.
+        """
+
+        response_data = self.api_client._bulk_create_entities(
+            plural_parent_entity_name='campaigns',
+            parent_entity_id=str(self.id),
+            plural_entity_name='adsquads',
+            data=[{'campaign_id': str(self.id), **d} for d in json_lists],
+            batch_size=batch_size,
+            max_workers=max_workers
+        )
+
+        return ad_squadz.AdSquad.from_json_many(self.api_client, map(unwrap, response_data))
     
 
+    ################
+    # Relationships
+    ################
+
+    @base.relationship
+    def ad_account(self) -> ad_accounts.AdAccount:
+        """
+        The Ad Account of this campaign, loaded on first access.
+        """
+        return self.api_client._get_entity_object('adaccounts', self.ad_account_id)
+
+    @base.relationship
+    def ad_squads(self) -> typing.List[ad_squadz.AdSquad]:
+        """
+        The ad squads under this campaign, loaded on first access.
+        """
+        return self.list_ad_squads()
+
     ################
     # General
     ################
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import datetime as dt
-from dateutil import parser as dateparser
 import pysnapchatads.base as base
 import pysnapchatads.snapchat as snap
 import pysnapchatads.objects.ad_accounts as ad_accounts
+from pysnapchatads.helpers import unwrap
 import typing
 import logging
 
@@ -31,8 +31,8 @@ class Organization(base.SnapchatMarketingBase):
         self,
         api_client: snap.SnapchatMarketing,
         id: str,
-        updated_at: dt.datetime,
-        created_at: dt.datetime,
+        updated_at: typing.Union[str, dt.datetime],
+        created_at: typing.Union[str, dt.datetime],
         name: str,
         address_line_1: str,
         locality: str,
@@ -66,14 +66,14 @@ class Organization(base.SnapchatMarketingBase):
         :api_client: SnapchatMarketing API object
         :json_data: JSON data
         """
-        json_data = json_data['organization']
+        json_data = unwrap(json_data)
         logging.info(json_data)
 
-        return Organization(
+        return cls._identify(api_client, Organization(
             api_client=api_client,
             id=json_data['id'],
-            updated_at=dateparser.parse(json_data['updated_at']),
-            created_at=dateparser.parse(json_data['created_at']),
+            updated_at=json_data['updated_at'],
+            created_at=json_data['created_at'],
             name=json_data['name'],
             address_line_1=json_data['address_line_1'],
             locality=json_data['locality'],
@@ -81,7 +81,7 @@ class Organization(base.SnapchatMarketingBase):
             country=json_data['country'],
             postal_code=json_data['postal_code'],
             org_type=json_data['type']
-        )
+        ))
     
     ################
     # Ad Accounts
@@ -104,6 +104,44 @@ class Organization(base.SnapchatMarketingBase):
             )
             for ad_account in response
         ]
+
+    def iter_ad_accounts(
+            self,
+            page_size: int = 1000,
+            prefetch: typing.Optional[int] = None
+    ) -> typing.Iterator[ad_accounts.AdAccount]:
+        """
+        Stream ad accounts for this organization page by page.
+        """
+        for ad_account in self.api_client._iter_many_entities(
+            plural_parent_entity_name='organizations',
+            parent_entity_id=self.id,
+            plural_entity_name='adaccounts',
+            limit=page_size,
+            prefetch=prefetch
+        ):
+            yield ad_accounts.AdAccount.from_json(
+                api_client=self.api_client,
+                json_data=ad_account
+            )
+
+    async def list_ad_accounts_async(self) -> typing.List[ad_accounts.AdAccount]:
+        """
+        List all ad accounts for this organization, using an AsyncSnapchatMarketing client.
+        """
+        response: typing.List[typing.Dict[str, typing.Any]] = await self.api_client._get_many_entities( # type: ignore
+            plural_parent_entity_name='organizations',
+            parent_entity_id=self.id,
+            plural_entity_name='adaccounts'
+        )
+
+        return [
+            ad_accounts.AdAccount.from_json(
+                api_client=self.api_client,
+                json_data=ad_account
+            )
+            for ad_account in response
+        ]
     
     def create_ad_accounts(
             self,
@@ -121,7 +159,7 @@ class Organization(base.SnapchatMarketingBase):
         
 
         if json_lists is not None:
-            responze = self.api_client._create_entities(
+            responze = self.api_client._bulk_create_entities(
                 plural_parent_entity_name='organizations',
                 parent_entity_id=self.id,
                 plural_entity_name='adaccounts',
@@ -136,9 +174,4 @@ class Organization(base.SnapchatMarketingBase):
                 data=[kwargs]
             )
         
-        return [
-                ad_accounts.AdAccount.from_json(
-                    api_client=self.api_client,
-                    json_data=ad_account
-                ) for ad_account in responze
-            ]
\ No newline at end of file
+        return ad_accounts.AdAccount.from_json_many(self.api_client, map(unwrap, responze))
\ No newline at end of file
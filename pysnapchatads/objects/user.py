@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime as dt
-from dateutil import parser as dateparser
 import pysnapchatads.base as base
 import pysnapchatads.snapchat as snap
 import typing
@@ -40,8 +39,8 @@ class User(base.SnapchatMarketingBase):
             self,
             api_client: snap.SnapchatMarketing,
             id: str,
-            updated_at: dt.datetime,
-            created_at: dt.datetime,
+            updated_at: typing.Union[str, dt.datetime],
+            created_at: typing.Union[str, dt.datetime],
             email: str,
             organization_id: str,
             display_name: str,
@@ -77,8 +76,8 @@ class User(base.SnapchatMarketingBase):
         user = User(
             api_client=api_client,
             id=json_data['id'],
-            updated_at=dateparser.parse(json_data['updated_at']),
-            created_at=dateparser.parse(json_data['created_at']),
+            updated_at=json_data['updated_at'],
+            created_at=json_data['created_at'],
             email=json_data['email'],
             organization_id=json_data['organization_id'],
             display_name=json_data['display_name'],
@@ -1,8 +1,338 @@
+from __future__ import annotations
+
+import concurrent.futures
+import datetime as dt
 import typing
 
+from dateutil import tz as dateutil_tz
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None # type: ignore
+
+import pysnapchatads.errors as errors
+from pysnapchatads.columnar import timestamp_array
+from pysnapchatads.helpers import parse_timestamp
+
+GRANULARITIES: typing.FrozenSet[str] = frozenset({'TOTAL', 'DAY', 'HOUR', 'LIFETIME'})
+
+BREAKDOWNS: typing.Dict[str, typing.Tuple[str, ...]] = {
+    'adaccounts': ('campaign', 'adsquad', 'ad'),
+    'campaigns': ('adsquad', 'ad'),
+    'adsquads': ('ad',),
+    'ads': ()
+}
+"""Breakdowns each entity type can be split by."""
+
+DEFAULT_FIELDS: typing.Tuple[str, ...] = ('impressions', 'swipes', 'spend')
+
+MAX_WINDOWS: typing.Dict[str, dt.timedelta] = {
+    'HOUR': dt.timedelta(days=7),
+    'DAY': dt.timedelta(days=31)
+}
+"""Longest range the API accepts in one request at each granularity. Longer ranges are split."""
+
+_ALIGNMENT: typing.Dict[str, dt.timedelta] = {
+    'HOUR': dt.timedelta(hours=1),
+    'DAY': dt.timedelta(days=1)
+}
+
+_STAT_KEYS: typing.Tuple[typing.Tuple[str, str], ...] = (
+    ('timeseries_stats', 'timeseries_stat'),
+    ('total_stats', 'total_stat'),
+    ('lifetime_stats', 'lifetime_stat')
+)
+
+
+class TimeSeries(object):
+    """
+    Stats of one entity: a timestamp array per interval bound and one array per metric, all the same length.
+    TOTAL and LIFETIME stats are a single interval.
+    """
+    __slots__ = ('id', 'type', 'granularity', 'start_time', 'end_time', 'metrics')
+
+    id: typing.Optional[str]
+    type: typing.Optional[str]
+    granularity: typing.Optional[str]
+    start_time: typing.Any
+    """``datetime64[us]`` start of each interval, in UTC."""
+    end_time: typing.Any
+    """``datetime64[us]`` end of each interval, in UTC."""
+    metrics: typing.Dict[str, typing.Any]
+    """Arrays by metric name: masked int64 or float64 arrays, object arrays for non-numeric metrics."""
+
+    def __init__(
+            self,
+            id: typing.Optional[str],
+            type: typing.Optional[str],
+            granularity: typing.Optional[str],
+            start_time: typing.Any,
+            end_time: typing.Any,
+            metrics: typing.Dict[str, typing.Any]
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.granularity = granularity
+        self.start_time = start_time
+        self.end_time = end_time
+        self.metrics = metrics
+
+    def __len__(self) -> int:
+        return len(self.start_time)
+
+    def __getitem__(self, metric: str) -> typing.Any:
+        return self.metrics[metric]
+
+    def __contains__(self, metric: object) -> bool:
+        return metric in self.metrics
+
+
+class Stats(object):
+    """
+    Stats of an entity and, when a breakdown was requested, of each entity under it.
+    """
+    __slots__ = ('series', 'breakdown')
+
+    series: TimeSeries
+    breakdown: typing.Dict[str, TimeSeries]
+    """Series of the broken down entities by id."""
+
+    def __init__(self, series: TimeSeries, breakdown: typing.Dict[str, TimeSeries]) -> None:
+        self.series = series
+        self.breakdown = breakdown
+
+
+def _metric_array(values: typing.List[typing.Any]) -> typing.Any:
+    missing = [v is None for v in values]
+    if all(v is None or type(v) is int for v in values):
+        return np.ma.MaskedArray([0 if v is None else v for v in values], mask=missing, dtype=np.int64)
+    if all(v is None or type(v) in (int, float) for v in values):
+        return np.ma.MaskedArray([0.0 if v is None else v for v in values], mask=missing, dtype=np.float64)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+def decode_series(stat: typing.Mapping[str, typing.Any]) -> TimeSeries:
+    """
+    Decode one ``timeseries_stat``, ``total_stat`` or ``lifetime_stat`` (or a breakdown entry) into arrays.
+    """
+    rows: typing.List[typing.Mapping[str, typing.Any]] = stat['timeseries'] if 'timeseries' in stat else [stat]
+
+    names: typing.Dict[str, None] = {}
+    for row in rows:
+        names.update(dict.fromkeys(row.get('stats') or ()))
+
+    return TimeSeries(
+        id=stat.get('id'),
+        type=stat.get('type'),
+        granularity=stat.get('granularity'),
+        start_time=timestamp_array([row.get('start_time') for row in rows]),
+        end_time=timestamp_array([row.get('end_time') for row in rows]),
+        metrics={
+            name: _metric_array([(row.get('stats') or {}).get(name) for row in rows])
+            for name in names
+        }
+    )
+
+def decode_stats(response: typing.Mapping[str, typing.Any]) -> typing.List[Stats]:
+    """
+    Decode a stats response into one ``Stats`` per entity it covers. Raises StatsError for failed sub-requests.
+    """
+    if np is None:
+        raise ImportError('Stats decoding requires numpy. Install it with `pip install pysnapchatads[columnar]`.')
+
+    results: typing.List[Stats] = []
+    for outer, inner in _STAT_KEYS:
+        for item in response.get(outer, ()):
+            status = item.get('sub_request_status', 'SUCCESS')
+            stat = item.get(inner)
+            if status != 'SUCCESS' or stat is None:
+                raise errors.StatsError(
+                    entity_id=(stat or {}).get('id'),
+                    sub_request_status=status,
+                    reason=item.get('sub_request_error_reason')
+                )
+
+            breakdown: typing.Dict[str, TimeSeries] = {}
+            for entries in (stat.get('breakdown_stats') or {}).values():
+                for entry in entries:
+                    breakdown[entry['id']] = decode_series(entry)
+
+            results.append(Stats(decode_series(stat), breakdown))
+    return results
+
+def _local_wall_time(value: typing.Union[str, dt.datetime, dt.date], timezone: dt.tzinfo) -> dt.datetime:
+    # naive wall-clock time in the account's timezone; naive inputs are already account time
+    if isinstance(value, str):
+        value = typing.cast(dt.datetime, parse_timestamp(value))
+    elif not isinstance(value, dt.datetime):
+        value = dt.datetime(value.year, value.month, value.day)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone)
+    return value.replace(tzinfo=None)
+
+def _floor(value: dt.datetime, granularity: str) -> dt.datetime:
+    if granularity == 'DAY':
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+def stats_windows(
+        start_time: typing.Union[str, dt.datetime, dt.date],
+        end_time: typing.Union[str, dt.datetime, dt.date],
+        granularity: str,
+        timezone: typing.Union[str, dt.tzinfo, None] = None
+) -> typing.List[typing.Tuple[dt.datetime, dt.datetime]]:
+    """
+    Split a range into consecutive windows the API accepts at a granularity.
+
+    Bounds are aligned to hour or day boundaries of the account's timezone (UTC when not given; an unknown timezone name raises ``ValueError``):
+    the start is rounded down and the end up. Windows are stepped in wall-clock time, so day
+    boundaries stay at local midnight across daylight saving changes.
+    """
+    granularity = granularity.upper()
+    if isinstance(timezone, str):
+        zone = dateutil_tz.gettz(timezone)
+        if zone is None:
+            raise ValueError(f'{timezone} is not a known timezone')
+    else:
+        zone = timezone if timezone is not None else dt.timezone.utc
+
+    start = _floor(_local_wall_time(start_time, zone), granularity)
+    end = _local_wall_time(end_time, zone)
+    if _floor(end, granularity) != end:
+        end = _floor(end, granularity) + _ALIGNMENT[granularity]
+    if end <= start:
+        raise ValueError(f'end_time {end_time} is not after start_time {start_time}')
+
+    windows: typing.List[typing.Tuple[dt.datetime, dt.datetime]] = []
+    step = MAX_WINDOWS[granularity]
+    while start < end:
+        stop = min(start + step, end)
+        windows.append((start.replace(tzinfo=zone), stop.replace(tzinfo=zone)))
+        start = stop
+    return windows
+
+def _concat(arrays: typing.List[typing.Any]) -> typing.Any:
+    if any(array.dtype == object for array in arrays):
+        return np.concatenate([np.asarray(array, dtype=object) for array in arrays])
+    return np.ma.concatenate(arrays)
+
+def concat_series(parts: typing.List[TimeSeries]) -> TimeSeries:
+    """
+    Stitch the series of consecutive windows into one. Metrics missing from a window are masked there.
+    """
+    names: typing.Dict[str, None] = {}
+    for part in parts:
+        names.update(dict.fromkeys(part.metrics))
+
+    def metric(part: TimeSeries, name: str) -> typing.Any:
+        if name in part.metrics:
+            return part.metrics[name]
+        return np.ma.masked_all(len(part), dtype=np.int64)
+
+    first = parts[0]
+    return TimeSeries(
+        id=first.id,
+        type=first.type,
+        granularity=first.granularity,
+        start_time=np.concatenate([part.start_time for part in parts]),
+        end_time=np.concatenate([part.end_time for part in parts]),
+        metrics={name: _concat([metric(part, name) for part in parts]) for name in names}
+    )
+
+def concat_stats(parts: typing.List[Stats]) -> Stats:
+    """
+    Stitch the stats of consecutive windows, including each broken down entity's series.
+    """
+    breakdown: typing.Dict[str, typing.List[TimeSeries]] = {}
+    for part in parts:
+        for entity_id, series in part.breakdown.items():
+            breakdown.setdefault(entity_id, []).append(series)
+
+    return Stats(
+        concat_series([part.series for part in parts]),
+        {entity_id: concat_series(series) for entity_id, series in breakdown.items()}
+    )
+
+def _format_time(value: typing.Union[str, dt.datetime, dt.date, None]) -> typing.Optional[str]:
+    if isinstance(value, (dt.datetime, dt.date)):
+        return value.isoformat()
+    return value
+
+
 class AnalyticsMixin(object):
     """
-    Analytic mixin for objects.
+    Stats retrieval for entities that report them (ad accounts, campaigns, ad squads and ads).
     """
-    
-    
\ No newline at end of file
+    __slots__ = ()
+
+    def get_stats(
+            self,
+            fields: typing.Iterable[str] = DEFAULT_FIELDS,
+            granularity: str = 'TOTAL',
+            start_time: typing.Union[str, dt.datetime, dt.date, None] = None,
+            end_time: typing.Union[str, dt.datetime, dt.date, None] = None,
+            breakdown: typing.Optional[str] = None,
+            timezone: typing.Union[str, dt.tzinfo, None] = None,
+            max_workers: typing.Optional[int] = None,
+            **kwargs
+    ) -> Stats:
+        """
+        Get the stats of this entity as time-series arrays.
+
+        :param fields: Metrics to report, e.g. impressions, swipes, spend.
+        :param granularity: TOTAL, DAY, HOUR or LIFETIME. DAY and HOUR need a start and end time.
+        :param breakdown: Also report the stats of each entity under this one, e.g. ``ad``.
+        :param timezone: Timezone of the ad account, whose hour and day boundaries DAY and HOUR ranges
+            are aligned to. Defaults to the entity's own ``timezone`` (set on ad accounts), else UTC.
+        :param max_workers: Windows fetched at once when a DAY or HOUR range is longer than the API
+            allows in one request. Defaults to the concurrency limit of the client's scheduler, or one
+            window at a time when the client has none. Requests still go through the client's
+            scheduler and retry policy.
+        :param kwargs: Other stats query parameters, e.g. swipe_up_attribution_window.
+
+        More information: https://marketingapi.snapchat.com/docs/#measurement
+        """
+        entity = typing.cast(typing.Any, self)
+        plural_entity_name: str = entity._plural_entity_name
+
+        granularity = granularity.upper()
+        if granularity not in GRANULARITIES:
+            raise ValueError(f'{granularity} is not a valid granularity. Valid: {sorted(GRANULARITIES)}')
+        if breakdown is not None and breakdown not in BREAKDOWNS[plural_entity_name]:
+            raise ValueError(f'{breakdown} is not a valid breakdown for {type(self).__name__}. Valid: {list(BREAKDOWNS[plural_entity_name])}')
+
+        fields = ','.join(fields)
+
+        def fetch(window: typing.Tuple[typing.Any, typing.Any]) -> Stats:
+            response = entity.api_client._get_stats(
+                plural_entity_name=plural_entity_name,
+                entity_id=str(entity.id),
+                granularity=granularity,
+                fields=fields,
+                start_time=_format_time(window[0]),
+                end_time=_format_time(window[1]),
+                breakdown=breakdown,
+                **kwargs
+            )
+            decoded = decode_stats(response)
+            if not decoded:
+                raise errors.StatsError(entity_id=str(entity.id), sub_request_status=None, reason='no stats returned')
+            return decoded[0]
+
+        if granularity not in MAX_WINDOWS or start_time is None or end_time is None:
+            return fetch((start_time, end_time))
+
+        windows = stats_windows(start_time, end_time, granularity, timezone if timezone is not None else getattr(self, 'timezone', None))
+        if len(windows) == 1:
+            return fetch(windows[0])
+
+        if max_workers is None:
+            scheduler = getattr(entity.api_client, 'scheduler', None)
+            max_workers = scheduler.concurrency_limit if scheduler is not None else 1
+        if max_workers <= 1:
+            return concat_stats([fetch(window) for window in windows])
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(windows))) as executor:
+            return concat_stats(list(executor.map(fetch, windows)))
@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import codecs
+import concurrent.futures
+import datetime as dt
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing
+
+import pysnapchatads.errors as errors
+import pysnapchatads.snapchat as snap
+from pysnapchatads.reporting.analytics import (
+    BREAKDOWNS, DEFAULT_FIELDS, GRANULARITIES, Stats, _format_time, _STAT_KEYS, decode_stats
+)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS report_jobs (
+    report_run_id TEXT PRIMARY KEY,
+    ad_account_id TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT,
+    result_url TEXT,
+    submitted_at REAL NOT NULL
+);
+'''
+
+FINISHED: typing.FrozenSet[str] = frozenset({'COMPLETED', 'FAILED'})
+
+
+class ReportJob(object):
+    """
+    A stats report the API builds in the background.
+    """
+
+    report_run_id: str
+    ad_account_id: str
+    """Account the report is polled under."""
+    plural_entity_name: str
+    entity_id: str
+    params: typing.Dict[str, typing.Any]
+    """Stats query parameters the report was submitted with."""
+    status: typing.Optional[str]
+    """``async_status`` from the last poll: STARTED, RUNNING, COMPLETED or FAILED."""
+    result_url: typing.Optional[str]
+    """Download link, once COMPLETED."""
+    submitted_at: float
+    """Epoch seconds, so the age of resumed jobs survives restarts."""
+    next_poll: float
+    """Monotonic time of the next poll."""
+
+    def __init__(
+            self,
+            report_run_id: str,
+            ad_account_id: str,
+            plural_entity_name: str,
+            entity_id: str,
+            params: typing.Dict[str, typing.Any],
+            status: typing.Optional[str] = None,
+            result_url: typing.Optional[str] = None,
+            submitted_at: typing.Optional[float] = None
+    ) -> None:
+        self.report_run_id = report_run_id
+        self.ad_account_id = ad_account_id
+        self.plural_entity_name = plural_entity_name
+        self.entity_id = entity_id
+        self.params = params
+        self.status = status
+        self.result_url = result_url
+        self.submitted_at = submitted_at if submitted_at is not None else time.time()
+        self.next_poll = time.monotonic()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    def __repr__(self) -> str:
+        return f'ReportJob({self.report_run_id!r}, {self.plural_entity_name}/{self.entity_id}, {self.status})'
+
+
+class JobJournal(object):
+    """
+    Jobs submitted and not yet downloaded, kept in memory and optionally in a SQLite file so
+    another process can resume them after a restart.
+    """
+
+    def __init__(
+            self,
+            path: typing.Optional[typing.Union[str, os.PathLike]] = None
+    ) -> None:
+        self.path: typing.Optional[str] = os.fspath(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._connection: typing.Optional[sqlite3.Connection] = None
+
+        if self.path is not None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            with self._connection:
+                self._connection.executescript(_SCHEMA)
+
+    def load(self) -> typing.List[ReportJob]:
+        if self._connection is None:
+            return []
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT report_run_id, ad_account_id, entity_type, entity_id, params, status, result_url, submitted_at FROM report_jobs ORDER BY submitted_at'
+            ).fetchall()
+        return [
+            ReportJob(run_id, account_id, entity_type, entity_id, json.loads(params), status, result_url, submitted_at)
+            for run_id, account_id, entity_type, entity_id, params, status, result_url, submitted_at in rows
+        ]
+
+    def save(self, jobs: typing.Iterable[ReportJob]) -> None:
+        if self._connection is None:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO report_jobs (report_run_id, ad_account_id, entity_type, entity_id, params, status, result_url, submitted_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [
+                    (job.report_run_id, job.ad_account_id, job.plural_entity_name, job.entity_id, json.dumps(job.params), job.status, job.result_url, job.submitted_at)
+                    for job in jobs
+                ]
+            )
+
+    def remove(self, report_run_id: str) -> None:
+        if self._connection is None:
+            return
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM report_jobs WHERE report_run_id = ?', (report_run_id,))
+
+
+def _report(response: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    reports = response.get('async_stats_reports') or [response]
+    report = reports[0]
+    return report.get('async_stats_report', report)
+
+def iter_stat_items(chunks: typing.Iterable[bytes]) -> typing.Iterator[typing.Tuple[str, typing.Dict[str, typing.Any]]]:
+    """
+    Incrementally decode a stats response body, yielding ``(key, item)`` for each item of its
+    ``timeseries_stats``, ``total_stats`` or ``lifetime_stats`` array as soon as it has arrived.
+    Only the item being decoded is buffered, however large the body.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    source = iter(chunks)
+    buffer = ''
+
+    def more() -> bool:
+        nonlocal buffer
+        for chunk in source:
+            if chunk:
+                buffer += text.decode(chunk)
+                return True
+        buffer += text.decode(b'', final=True)
+        return False
+
+    key: typing.Optional[str] = None
+    position = 0
+    while key is None:
+        found = [(buffer.find(f'"{outer}"'), outer) for outer, _ in _STAT_KEYS]
+        found = [(i, outer) for i, outer in found if i >= 0]
+        if found:
+            start, outer = min(found)
+            bracket = buffer.find('[', start)
+            if bracket >= 0:
+                key, position = outer, bracket + 1
+                continue
+        if not more():
+            return
+
+    while True:
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if position < len(buffer):
+                break
+            if not more():
+                raise ValueError(f'Stats response ended inside {key}')
+        if buffer[position] == ']':
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if not more():
+                raise
+            continue
+
+        yield key, item
+        buffer, position = buffer[end:], 0
+
+
+class ReportJobManager(object):
+    """
+    Submits stats as asynchronous report jobs, polls them from one loop and streams their results.
+
+    Jobs are polled on a shared schedule rather than by a sleeper per job: each is due again
+    after a delay proportional to its age (``backoff_ratio``, between ``min_interval`` and
+    ``max_interval`` seconds), so young jobs are checked often and long ones rarely. Polls go
+    through the client, under its scheduler and retry policy. Submitted jobs are written to the
+    journal until their results are read, so a new manager on the same journal resumes them.
+    """
+
+    def __init__(
+            self,
+            api_client: snap.SnapchatMarketing,
+            journal: typing.Union[JobJournal, str, os.PathLike, None] = None,
+            min_interval: float = 1.0,
+            max_interval: float = 60.0,
+            backoff_ratio: float = 0.25,
+            max_workers: int = 4
+    ) -> None:
+        self.api_client = api_client
+        self.journal: JobJournal = journal if isinstance(journal, JobJournal) else JobJournal(journal)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_ratio = backoff_ratio
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._jobs: typing.Dict[str, ReportJob] = {job.report_run_id: job for job in self.journal.load()}
+        """Jobs not yet read, resumed from the journal first. Resumed jobs are due for a poll at once."""
+
+    @property
+    def jobs(self) -> typing.List[ReportJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def submit(
+            self,
+            entity: typing.Any,
+            fields: typing.Iterable[str] = DEFAULT_FIELDS,
+            granularity: str = 'DAY',
+            start_time: typing.Union[str, dt.datetime, dt.date, None] = None,
+            end_time: typing.Union[str, dt.datetime, dt.date, None] = None,
+            breakdown: typing.Optional[str] = None,
+            ad_account_id: typing.Optional[str] = None,
+            **kwargs
+    ) -> ReportJob:
+        """
+        Submit a stats report for an ad account, campaign, ad squad or ad.
+
+        :param ad_account_id: Account the job is polled under. Taken from the entity when it is an
+            ad account or a campaign; required for ad squads and ads.
+        :param kwargs: Other stats query parameters, as for ``get_stats``.
+        """
+        plural_entity_name: str = entity._plural_entity_name
+        if ad_account_id is None:
+            ad_account_id = str(entity.id) if plural_entity_name == 'adaccounts' else getattr(entity, 'ad_account_id', None)
+        if ad_account_id is None:
+            raise ValueError(f'ad_account_id is required to submit a report for {type(entity).__name__}')
+
+        granularity = granularity.upper()
+        if granularity not in GRANULARITIES:
+            raise ValueError(f'{granularity} is not a valid granularity. Valid: {sorted(GRANULARITIES)}')
+        if breakdown is not None and breakdown not in BREAKDOWNS[plural_entity_name]:
+            raise ValueError(f'{breakdown} is not a valid breakdown for {type(entity).__name__}. Valid: {list(BREAKDOWNS[plural_entity_name])}')
+
+        params = {
+            k: v for k, v in {
+                'granularity': granularity,
+                'fields': ','.join(fields),
+                'start_time': _format_time(start_time),
+                'end_time': _format_time(end_time),
+                'breakdown': breakdown,
+                **kwargs
+            }.items() if v is not None
+        }
+        report = _report(self.api_client._get_stats(
+            plural_entity_name=plural_entity_name,
+            entity_id=str(entity.id),
+            **{'async': True, 'async_format': 'json'},
+            **params
+        ))
+
+        job = ReportJob(
+            report_run_id=report['report_run_id'],
+            ad_account_id=str(ad_account_id),
+            plural_entity_name=plural_entity_name,
+            entity_id=str(entity.id),
+            params=params,
+            status=report.get('async_status')
+        )
+        self._schedule(job)
+        self.journal.save([job])
+        with self._lock:
+            self._jobs[job.report_run_id] = job
+        return job
+
+    def _schedule(self, job: ReportJob) -> None:
+        age = max(0.0, time.time() - job.submitted_at)
+        delay = min(self.max_interval, max(self.min_interval, age * self.backoff_ratio))
+        job.next_poll = time.monotonic() + delay
+
+    def _poll_one(self, job: ReportJob) -> ReportJob:
+        report = _report(self.api_client._get_stats_report(ad_account_id=job.ad_account_id, report_run_id=job.report_run_id))
+        job.status = report.get('async_status', job.status)
+        job.result_url = report.get('result') or job.result_url
+        if not job.finished:
+            self._schedule(job)
+        return job
+
+    def poll(self) -> typing.List[ReportJob]:
+        """
+        Poll every job that is due. Returns the jobs found finished (COMPLETED or FAILED).
+        """
+        now = time.monotonic()
+        due = [job for job in self.jobs if not job.finished and job.next_poll <= now]
+        if not due:
+            return []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(due))) as executor:
+            polled = list(executor.map(self._poll_one, due))
+
+        self.journal.save(polled)
+        return [job for job in polled if job.finished]
+
+    def wait(self, timeout: typing.Optional[float] = None) -> typing.Iterator[ReportJob]:
+        """
+        Yield jobs as they finish, including jobs already finished, until none are left running.
+        Raises TimeoutError if some are still running after ``timeout`` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        yield from [job for job in self.jobs if job.finished]
+
+        while True:
+            yield from self.poll()
+
+            running = [job.next_poll for job in self.jobs if not job.finished]
+            if not running:
+                return
+
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                raise TimeoutError(f'{len(running)} report jobs still running')
+            wake = min(running)
+            if deadline is not None:
+                wake = min(wake, deadline)
+            time.sleep(max(0.0, wake - now))
+
+    def iter_results(self, job: ReportJob, chunk_size: int = 1 << 16) -> typing.Iterator[Stats]:
+        """
+        Download a finished job and decode it as it streams in, one ``Stats`` per entity.
+        The job is dropped from the manager and the journal once its results are fully read.
+        """
+        if job.status == 'FAILED':
+            self.forget(job)
+            raise errors.StatsError(entity_id=job.entity_id, sub_request_status=job.status)
+        if job.result_url is None:
+            raise ValueError(f'{job.report_run_id} has no results yet (status {job.status})')
+
+        # the result link is signed; the API's bearer token is not sent along
+        response = self.api_client.session.get(job.result_url, stream=True, headers={'Authorization': None})
+        try:
+            response.raise_for_status()
+            for key, item in iter_stat_items(response.iter_content(chunk_size=chunk_size)):
+                yield from decode_stats({key: [item]})
+        finally:
+            response.close()
+
+        self.forget(job)
+
+    def forget(self, job: ReportJob) -> None:
+        with self._lock:
+            self._jobs.pop(job.report_run_id, None)
+        self.journal.remove(job.report_run_id)
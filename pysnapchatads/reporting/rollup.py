@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import typing
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None # type: ignore
+
+from pysnapchatads.reporting.analytics import TimeSeries
+
+LEVELS: typing.Tuple[str, ...] = ('ad', 'adsquad', 'campaign', 'adaccount')
+"""Roll-up levels from the bottom up, named like stats breakdowns."""
+
+PARENT_ID_FIELDS: typing.Dict[str, str] = {
+    'ad': 'ad_squad_id',
+    'adsquad': 'campaign_id',
+    'campaign': 'ad_account_id'
+}
+"""Attribute linking an entity of each level to its parent on the level above."""
+
+
+def _ratio(numerator: typing.Any, denominator: typing.Any, scale: float = 1.0) -> typing.Any:
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    result = np.full(np.broadcast(numerator, denominator).shape, np.nan)
+    np.divide(numerator * scale, denominator, out=result, where=denominator != 0)
+    return result
+
+
+class LevelStats(object):
+    """
+    Summed stats of every entity of one level: a ``(entities, intervals)`` array per metric.
+    """
+    __slots__ = ('level', 'ids', 'start_time', 'metrics', '_positions')
+
+    level: str
+    ids: typing.List[str]
+    """Entity ids, in row order."""
+    start_time: typing.Any
+    """``datetime64[us]`` start of each interval (column), shared by every level."""
+    metrics: typing.Dict[str, typing.Any]
+
+    def __init__(self, level: str, ids: typing.List[str], start_time: typing.Any, metrics: typing.Dict[str, typing.Any]) -> None:
+        self.level = level
+        self.ids = ids
+        self.start_time = start_time
+        self.metrics = metrics
+        self._positions: typing.Optional[typing.Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, metric: str) -> typing.Any:
+        return self.metrics[metric]
+
+    def __contains__(self, metric: object) -> bool:
+        return metric in self.metrics
+
+    def row(self, entity_id: str) -> int:
+        """
+        Row of an entity in the metric arrays.
+        """
+        if self._positions is None:
+            self._positions = {entity_id: i for i, entity_id in enumerate(self.ids)}
+        return self._positions[entity_id]
+
+    def total(self, metric: str) -> typing.Any:
+        """
+        A metric summed over all intervals, one value per entity.
+        """
+        return self.metrics[metric].sum(axis=1)
+
+    def _pair(self, numerator: str, denominator: str, total: bool) -> typing.Tuple[typing.Any, typing.Any]:
+        if total:
+            return self.total(numerator), self.total(denominator)
+        return self.metrics[numerator], self.metrics[denominator]
+
+    def cpm(self, total: bool = False) -> typing.Any:
+        """
+        Cost per thousand impressions, in the micro currency of ``spend``. NaN without impressions.
+
+        :param total: Over the whole range (one value per entity) instead of per interval.
+        """
+        return _ratio(*self._pair('spend', 'impressions', total), scale=1000.0)
+
+    def ctr(self, total: bool = False) -> typing.Any:
+        """
+        Swipe-through rate: swipes per impression. NaN without impressions.
+        """
+        return _ratio(*self._pair('swipes', 'impressions', total))
+
+    def ecpa(self, conversions: str = 'conversion_purchases', total: bool = False) -> typing.Any:
+        """
+        Effective cost per action, in the micro currency of ``spend``. NaN without actions.
+
+        :param conversions: Metric counting the actions, e.g. conversion_sign_ups.
+        """
+        return _ratio(*self._pair('spend', conversions, total))
+
+
+class Rollup(object):
+    """
+    Stats of every level of the hierarchy, from ads up to ad accounts.
+    """
+    __slots__ = ('levels',)
+
+    levels: typing.Dict[str, LevelStats]
+
+    def __init__(self, levels: typing.Dict[str, LevelStats]) -> None:
+        self.levels = levels
+
+    def __getitem__(self, level: str) -> LevelStats:
+        return self.levels[level]
+
+
+def _ad_matrices(
+        ad_ids: typing.List[str],
+        series: typing.Mapping[str, TimeSeries],
+        metrics: typing.Optional[typing.Iterable[str]]
+) -> typing.Tuple[typing.Any, typing.Dict[str, typing.Any]]:
+    positions = {ad_id: i for i, ad_id in enumerate(ad_ids)}
+    unknown = [ad_id for ad_id in series if ad_id not in positions]
+    if unknown:
+        raise ValueError(f'{len(unknown)} series have no ad to link them to a parent, e.g. {unknown[0]}')
+
+    parts = [(positions[ad_id], s) for ad_id, s in series.items() if len(s)]
+    if metrics is None:
+        names: typing.Dict[str, None] = {}
+        for _, s in parts:
+            names.update((name, None) for name, values in s.metrics.items() if values.dtype != object)
+        metrics = names
+
+    if not parts:
+        start_time = np.array([], dtype='datetime64[us]')
+        return start_time, {name: np.zeros((len(ad_ids), 0), dtype=np.int64) for name in metrics}
+
+    # every (ad, interval) cell filled in one assignment per metric
+    starts = np.concatenate([s.start_time for _, s in parts])
+    start_time = np.unique(starts)
+    rows = np.repeat([i for i, _ in parts], [len(s) for _, s in parts])
+    columns = np.searchsorted(start_time, starts)
+
+    matrices: typing.Dict[str, typing.Any] = {}
+    for name in metrics:
+        values = [s.metrics[name] if name in s.metrics else np.ma.masked_all(len(s), dtype=np.int64) for _, s in parts]
+        flat = np.ma.concatenate(values).filled(0)
+        matrix = np.zeros((len(ad_ids), len(start_time)), dtype=np.int64 if flat.dtype.kind in 'iub' else np.float64)
+        matrix[rows, columns] = flat
+        matrices[name] = matrix
+    return start_time, matrices
+
+def _roll(
+        child_ids: typing.List[str],
+        links: typing.Mapping[str, typing.Any],
+        level: str,
+        matrices: typing.Dict[str, typing.Any]
+) -> typing.Tuple[typing.List[str], typing.Dict[str, typing.Any]]:
+    missing = [child_id for child_id in child_ids if child_id not in links]
+    if missing:
+        raise ValueError(f'No {level} entity given for {missing[0]}, so its {PARENT_ID_FIELDS[level]} is unknown')
+
+    parent_ids = list(dict.fromkeys(str(links[child_id]) for child_id in child_ids))
+    positions = {parent_id: i for i, parent_id in enumerate(parent_ids)}
+    index = np.fromiter((positions[str(links[child_id])] for child_id in child_ids), dtype=np.intp, count=len(child_ids))
+
+    rolled: typing.Dict[str, typing.Any] = {}
+    for name, matrix in matrices.items():
+        parent = np.zeros((len(parent_ids), matrix.shape[1]), dtype=matrix.dtype)
+        np.add.at(parent, index, matrix)
+        rolled[name] = parent
+    return parent_ids, rolled
+
+def rollup(
+        series: typing.Mapping[str, TimeSeries],
+        ads: typing.Iterable[typing.Any],
+        ad_squads: typing.Iterable[typing.Any],
+        campaigns: typing.Iterable[typing.Any],
+        metrics: typing.Optional[typing.Iterable[str]] = None
+) -> Rollup:
+    """
+    Sum ad-level stats up to ad squads, campaigns and ad accounts.
+
+    Parents are found through ``Ad.ad_squad_id``, ``AdSquad.campaign_id`` and
+    ``Campaign.ad_account_id``, so no stats are requested above the ad level. Each level is
+    one scatter-add over a ``(entities, intervals)`` array per metric. Intervals are the union
+    of the series' intervals; an ad without stats in an interval counts as zero.
+
+    :param series: Ad-level series by ad id, e.g. ``account.get_stats(breakdown='ad').breakdown``.
+    :param ads: Ads to roll up. Ads without a series are kept with zero stats.
+    :param metrics: Metrics to roll up. Defaults to every numeric metric in the series.
+    """
+    if np is None:
+        raise ImportError('Stats roll-ups require numpy. Install it with `pip install pysnapchatads[columnar]`.')
+
+    objects = {
+        'ad': {str(ad.id): ad for ad in ads},
+        'adsquad': {str(ad_squad.id): ad_squad for ad_squad in ad_squads},
+        'campaign': {str(campaign.id): campaign for campaign in campaigns}
+    }
+
+    ids = list(objects['ad'])
+    start_time, matrices = _ad_matrices(ids, series, metrics)
+    levels: typing.Dict[str, LevelStats] = {'ad': LevelStats('ad', ids, start_time, matrices)}
+
+    for child, parent in zip(LEVELS, LEVELS[1:]):
+        field = PARENT_ID_FIELDS[child]
+        links = {entity_id: getattr(entity, field) for entity_id, entity in objects[child].items()}
+        ids, matrices = _roll(ids, links, child, matrices)
+        levels[parent] = LevelStats(parent, ids, start_time, matrices)
+
+    return Rollup(levels)
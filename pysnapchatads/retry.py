@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+import typing
+import requests
+
+class RetryStats(typing.NamedTuple):
+    """
+    Counters describing what retrying has cost so far.
+    """
+
+    requests: int
+    """Logical requests sent through the policy."""
+    retries: int
+    """Extra attempts made after a transient failure."""
+    exhausted: int
+    """Requests that still failed after the last allowed attempt."""
+    budget_denied: int
+    """Retries skipped because the retry budget was empty."""
+    backoff_seconds: float
+    """Total time spent sleeping between attempts."""
+
+
+class RetryPolicy(object):
+    """
+    Retries transient failures with exponential backoff, full jitter and a retry budget.
+
+    GET, PUT and DELETE are idempotent and retried automatically. POST is only retried
+    when ``retry_post`` is set, since re-sending a create can duplicate entities.
+
+    The retry budget holds at most ``budget_max`` retries and is refilled by ``budget_ratio``
+    per request, so during an outage retries stay at roughly that fraction of the traffic
+    instead of multiplying the load.
+    """
+
+    IDEMPOTENT_METHODS: typing.FrozenSet[str] = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+    TRANSIENT_ERRORS: typing.Tuple[typing.Type[Exception], ...] = (
+        requests.ConnectionError,
+        requests.Timeout,
+        # the connection dropped or the body arrived corrupted while the response was being read
+        requests.exceptions.ChunkedEncodingError,
+        requests.exceptions.ContentDecodingError
+    )
+
+    def __init__(
+            self,
+            max_attempts: int = 4,
+            backoff_base: float = 0.5,
+            backoff_max: float = 30.0,
+            jitter: bool = True,
+            retry_statuses: typing.Iterable[int] = (500, 502, 503, 504),
+            retry_post: bool = False,
+            budget_ratio: float = 0.2,
+            budget_max: float = 10.0
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+
+        self.max_attempts: int = max_attempts
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.jitter: bool = jitter
+        self.retry_statuses: typing.FrozenSet[int] = frozenset(retry_statuses)
+        self.retry_post: bool = retry_post
+        self.budget_ratio: float = budget_ratio
+        self.budget_max: float = budget_max
+
+        self._budget: float = budget_max
+        self._requests: int = 0
+        self._retries: int = 0
+        self._exhausted: int = 0
+        self._budget_denied: int = 0
+        self._backoff_seconds: float = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> RetryStats:
+        with self._lock:
+            return RetryStats(
+                requests=self._requests,
+                retries=self._retries,
+                exhausted=self._exhausted,
+                budget_denied=self._budget_denied,
+                backoff_seconds=self._backoff_seconds
+            )
+
+    def is_retryable_method(self, method: str) -> bool:
+        method = method.upper()
+        return method in self.IDEMPOTENT_METHODS or (method == 'POST' and self.retry_post)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Seconds to wait before retry number ``attempt`` (starting at 1).
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+    def execute(
+            self,
+            method: str,
+            send: typing.Callable[[], requests.Response]
+    ) -> requests.Response:
+        """
+        Call ``send``, retrying transient errors and retryable status codes as the policy allows.
+        The last response is returned, or the last exception raised, once attempts run out.
+        """
+        retryable = self.is_retryable_method(method)
+
+        with self._lock:
+            self._requests += 1
+            self._budget = min(self._budget + self.budget_ratio, self.budget_max)
+
+        attempt = 1
+        while True:
+            try:
+                response = send()
+                error: typing.Optional[Exception] = None
+            except self.TRANSIENT_ERRORS as e:
+                error = e
+
+            if error is None and response.status_code not in self.retry_statuses:
+                return response
+
+            if not retryable or not self._can_retry(attempt):
+                if error is not None:
+                    raise error
+                return response
+
+            if error is None:
+                response.close()
+
+            delay = self.backoff(attempt)
+            with self._lock:
+                self._retries += 1
+                self._backoff_seconds += delay
+            time.sleep(delay)
+            attempt += 1
+
+    def _can_retry(self, attempt: int) -> bool:
+        with self._lock:
+            if attempt >= self.max_attempts:
+                self._exhausted += 1
+                return False
+            if self._budget < 1:
+                self._budget_denied += 1
+                return False
+            self._budget -= 1
+            return True
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import email.utils
+import datetime as dt
+import threading
+import time
+import typing
+import requests
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket. Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            capacity: typing.Optional[float] = None
+    ) -> None:
+        self.rate: float = rate
+        self.capacity: float = capacity if capacity is not None else rate
+        self._tokens: float = self.capacity
+        self._updated: float = time.monotonic()
+        self._paused_until: float = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """
+        Take one token, blocking until one is available. Returns the seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hand out no tokens for the next ``seconds``, and drain the bucket so traffic resumes gradually.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+class SchedulerStats(typing.NamedTuple):
+    """
+    Point-in-time view of a RequestScheduler.
+    """
+
+    queue_depth: int
+    """Requests waiting for a concurrency slot or a rate limit token."""
+    in_flight: int
+    concurrency_limit: int
+    requests: int
+    throttle_events: int
+    """Responses with HTTP 429."""
+    throttle_wait: float
+    """Total seconds spent backing off after throttling."""
+
+
+class RequestScheduler(object):
+    """
+    Rate limit aware scheduler for API requests.
+
+    Every request takes a token from a bucket kept per access token, and at most
+    ``concurrency_limit`` requests are in flight at once. The concurrency limit follows
+    AIMD: it grows by ``additive_increase`` for every window of successful requests and is
+    multiplied by ``multiplicative_decrease`` when the API throttles or answers with a 5xx.
+    Throttled requests honour ``Retry-After`` and are re-sent up to ``max_throttle_retries``
+    times, after which the 429 response is returned to the caller.
+    """
+
+    def __init__(
+            self,
+            requests_per_second: float = 20.0,
+            burst: typing.Optional[float] = None,
+            initial_concurrency: int = 8,
+            min_concurrency: int = 1,
+            max_concurrency: int = 64,
+            additive_increase: float = 1.0,
+            multiplicative_decrease: float = 0.5,
+            max_throttle_retries: int = 5,
+            default_retry_after: float = 1.0,
+            decrease_cooldown: float = 1.0
+    ) -> None:
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError('multiplicative_decrease must be between 0 and 1')
+
+        self.requests_per_second: float = requests_per_second
+        self.burst: typing.Optional[float] = burst
+        self.min_concurrency: int = min_concurrency
+        self.max_concurrency: int = max_concurrency
+        self.additive_increase: float = additive_increase
+        self.multiplicative_decrease: float = multiplicative_decrease
+        self.max_throttle_retries: int = max_throttle_retries
+        self.default_retry_after: float = default_retry_after
+        self.decrease_cooldown: float = decrease_cooldown
+
+        self._limit: float = float(max(min_concurrency, min(initial_concurrency, max_concurrency)))
+        self._in_flight: int = 0
+        self._waiting: int = 0
+        self._requests: int = 0
+        self._throttle_events: int = 0
+        self._throttle_wait: float = 0.0
+        self._last_decrease: float = 0.0
+
+        self._buckets: typing.Dict[str, TokenBucket] = {}
+        self._condition = threading.Condition()
+
+    @property
+    def concurrency_limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def stats(self) -> SchedulerStats:
+        with self._condition:
+            return SchedulerStats(
+                queue_depth=self._waiting,
+                in_flight=self._in_flight,
+                concurrency_limit=int(self._limit),
+                requests=self._requests,
+                throttle_events=self._throttle_events,
+                throttle_wait=self._throttle_wait
+            )
+
+    def bucket(self, key: str) -> TokenBucket:
+        """
+        The token bucket for an access token, created on first use.
+        """
+        with self._condition:
+            if key not in self._buckets:
+                self._buckets[key] = TokenBucket(
+                    rate=self.requests_per_second,
+                    capacity=self.burst
+                )
+            return self._buckets[key]
+
+    def execute(
+            self,
+            key: str,
+            send: typing.Callable[[], requests.Response]
+    ) -> requests.Response:
+        """
+        Run ``send`` under the rate and concurrency limits for ``key``, re-sending it when throttled.
+        """
+        bucket = self.bucket(key)
+        attempt = 0
+
+        while True:
+            self._enter(bucket)
+            try:
+                response = send()
+            finally:
+                self._exit()
+
+            if response.status_code >= 500:
+                # an overloaded or failing server is a congestion signal too; re-sending is up to the retry policy
+                self._decrease()
+                return response
+
+            if response.status_code != 429:
+                self._on_success()
+                return response
+
+            delay = self._retry_after(response)
+            self._on_throttle(delay)
+            bucket.pause(delay)
+
+            attempt += 1
+            if attempt > self.max_throttle_retries:
+                return response
+
+            response.close()
+
+    def _enter(self, bucket: TokenBucket) -> None:
+        with self._condition:
+            self._waiting += 1
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+        try:
+            bucket.acquire()
+        except BaseException:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify()
+            raise
+        finally:
+            with self._condition:
+                self._waiting -= 1
+
+    def _exit(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._requests += 1
+            self._condition.notify()
+
+    def _on_success(self) -> None:
+        with self._condition:
+            previous = int(self._limit)
+            # one full window of successes grows the limit by additive_increase
+            self._limit = min(float(self.max_concurrency), self._limit + self.additive_increase / self._limit)
+            if int(self._limit) > previous:
+                self._condition.notify_all()
+
+    def _on_throttle(self, delay: float) -> None:
+        with self._condition:
+            self._throttle_events += 1
+            self._throttle_wait += delay
+        self._decrease()
+
+    def _decrease(self) -> None:
+        with self._condition:
+            # a burst of 429s or 5xx from one window counts as a single congestion signal
+            now = time.monotonic()
+            if now - self._last_decrease >= self.decrease_cooldown:
+                self._limit = max(float(self.min_concurrency), self._limit * self.multiplicative_decrease)
+                self._last_decrease = now
+
+    def _retry_after(self, response: requests.Response) -> float:
+        """
+        Seconds to wait according to the Retry-After header, which may be a delay or an HTTP date.
+        """
+        header = response.headers.get('Retry-After')
+        if not header:
+            return self.default_retry_after
+
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = email.utils.parsedate_to_datetime(header)
+        except (TypeError, ValueError):
+            return self.default_retry_after
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=dt.timezone.utc)
+        return max(0.0, (retry_at - dt.datetime.now(dt.timezone.utc)).total_seconds())
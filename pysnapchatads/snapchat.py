@@ -2,10 +2,24 @@ from __future__ import absolute_import, annotations, print_function, unicode_lit
 import requests
 import typing
 import collections
+import concurrent.futures
+import queue
+import threading
 
-from pysnapchatads.helpers import build_url
+from pysnapchatads.helpers import build_url, build_params, unwrap, unwrap_page
 import pysnapchatads.objects.user as user
 import pysnapchatads.errors as errors
+import pysnapchatads.scheduler as scheduling
+import pysnapchatads.retry as retrying
+import pysnapchatads.transport as transport_
+import pysnapchatads.codec as codecs
+import pysnapchatads.cache as caching
+import pysnapchatads.store as storage
+import pysnapchatads.batch as batching
+import pysnapchatads.columnar as columnar
+import pysnapchatads.identity as identity
+import pysnapchatads.coalesce as coalescing
+import pysnapchatads.tokens as tokens
 import pysnapchatads.objects.organizations as orgs
 import pysnapchatads.objects.ad_accounts as ad_accountz
 
@@ -15,17 +29,120 @@ class SnapchatMarketing(object):
     def __init__(
             self, 
             access_token: str, 
-            proxies: typing.Optional[collections.MutableMapping[str, str]] = None
+            proxies: typing.Optional[collections.MutableMapping[str, str]] = None,
+            prefetch_pages: int = 0,
+            scheduler: typing.Optional[scheduling.RequestScheduler] = None,
+            retry_policy: typing.Optional[retrying.RetryPolicy] = None,
+            transport: typing.Optional[transport_.TransportAdapter] = None,
+            codec: typing.Optional[codecs.JSONCodec] = None,
+            cache: typing.Optional[caching.EntityCache] = None,
+            store: typing.Optional[storage.SQLiteEntityStore] = None,
+            identity_map: bool = False,
+            coalesce_requests: bool = False,
+            token_manager: typing.Optional[tokens.TokenManager] = None
         ) -> None:
         
         self.access_token: str = access_token
+        self.prefetch_pages: int = prefetch_pages
+        """Default number of pages to read ahead while streaming listings. 0 disables prefetching."""
         self.BASE_URL: str = 'https://adsapi.snapchat.com/v1'
+        self.codec: codecs.JSONCodec = codec if codec is not None else codecs.get_codec()
+        """JSON codec used to decode responses from bytes and encode request bodies."""
         self.session = requests.Session()
+
+        self.transport: transport_.TransportAdapter = transport if transport is not None else transport_.TransportAdapter()
+        """HTTP adapter holding pool sizing, default timeouts, keep-alive and pool metrics."""
+        self.session.mount('https://', self.transport)
+        self.session.mount('http://', self.transport)
         self.session.headers.update({'Authorization': f'Bearer {self.access_token}'})
 
         if proxies:
             self.session.proxies.update(proxies)
 
+        self.scheduler: typing.Optional[scheduling.RequestScheduler] = scheduler
+        """Optional rate limit aware scheduler every request goes through."""
+        self.retry_policy: typing.Optional[retrying.RetryPolicy] = retry_policy
+        """Optional policy for retrying transient failures. POST is only retried if the policy allows it."""
+        self.cache: typing.Optional[caching.EntityCache] = cache
+        """Optional cache for single entity reads, invalidated by creates, updates and deletes."""
+        self.store: typing.Optional[storage.SQLiteEntityStore] = store
+        """Optional persistent store that fresh reads are served from and every fetched entity is written to."""
+        self.identity_map: typing.Optional[identity.IdentityMap] = identity.IdentityMap() if identity_map else None
+        """With ``identity_map=True``, one live object per entity: reading an entity again updates the object already held in place."""
+        self.single_flight: typing.Optional[coalescing.SingleFlight] = coalescing.SingleFlight() if coalesce_requests else None
+        """With ``coalesce_requests=True``, shares one request among concurrent identical GETs; ``single_flight.stats.coalesced`` counts the calls that joined one."""
+        self.token_manager: typing.Optional[tokens.TokenManager] = token_manager
+        """Optional manager refreshing the access token before it expires; requests rejected with a 401 are sent once more."""
+        self._batches = threading.local()
+
+    def _request(
+            self,
+            method: str,
+            url: str,
+            **kwargs
+    ) -> requests.Response:
+        """
+        Send a request through the session, under the client's scheduler and
+        retry policy when they are configured.
+        """
+
+        def send() -> requests.Response:
+            self._authorize()
+            if self.scheduler is None:
+                return self.session.request(method=method, url=url, **kwargs)
+
+            return self.scheduler.execute(
+                key=self.access_token,
+                send=lambda: self.session.request(method=method, url=url, **kwargs)
+            )
+
+        def dispatch() -> requests.Response:
+            if self.retry_policy is None:
+                return send()
+
+            return self.retry_policy.execute(method=method, send=send)
+
+        response = dispatch()
+        if self.token_manager is None or response.status_code != 401:
+            return response
+
+        # the token expired or was revoked while the request was in flight: a 401 means the
+        # request was not processed, so it is safe to send it again, once, with a new token
+        sent_with = response.request.headers.get('Authorization', '')
+        self.token_manager.invalidate(sent_with[len('Bearer '):])
+        response.close()
+        return dispatch()
+
+    def _authorize(self) -> None:
+        """
+        Put the token manager's current access token on the session, refreshing it first when it is about to expire.
+        """
+        if self.token_manager is None:
+            return
+
+        access_token = self.token_manager.get_token()
+        if access_token != self.access_token:
+            # a single item assignment, so concurrent requests send either the old or the new header
+            self.session.headers['Authorization'] = f'Bearer {access_token}'
+            self.access_token = access_token
+
+    def _coalesced_get(
+            self,
+            url: str,
+            params: typing.Optional[typing.Dict[str, typing.Any]],
+            load: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        """
+        Run ``load``, which GETs ``url`` with ``params`` and decodes it, or wait for the
+        identical GET already in flight on another thread and share its result.
+        """
+        if self.single_flight is None:
+            return load()
+
+        return self.single_flight.do(
+            key=coalescing.request_key(method='GET', url=url, params=params),
+            fn=load
+        )
 
     def get_authenticated_user(self) -> user.User:
         """
@@ -36,11 +153,14 @@ class SnapchatMarketing(object):
         More information: https://marketingapi.snapchat.com/docs/#user
         """
 
+        response: requests.Response = self._request(
+            method='GET',
+            url=build_url(base_url=self.BASE_URL, endpoint='me')
+        )
+
         return user.User.from_json(
             api_client=self,
-            json_data=self.session.get(
-                url='https://adsapi.snapchat.com/v1/me'
-            ).json()['me']
+            json_data=self.codec.loads(response.content)['me']
         )
     
     ########################
@@ -60,43 +180,171 @@ class SnapchatMarketing(object):
         More information: https://marketingapi.snapchat.com/docs/#get-many-entities
         """
 
+        if self.store is not None:
+            # page size does not change what a listing contains
+            listing_params = build_params(**{k: v for k, v in kwargs.items() if k != 'limit'}) or {}
+            params_key = '&'.join(f'{k}={v}' for k, v in sorted(listing_params.items()))
+
+            stored = self.store.get_listing(
+                parent_type=plural_parent_entity_name,
+                parent_id=parent_entity_id,
+                entity_type=plural_entity_name,
+                params=params_key
+            )
+            if stored is not None:
+                return stored
+
         url: str = build_url(
             base_url=self.BASE_URL,
             endpoint=plural_parent_entity_name,
             path=f'{parent_entity_id}/{plural_entity_name}',
         )
+        params = build_params(**kwargs)
 
-        if 'limit' in kwargs:
-            params: typing.Dict[str, int] = {'limit': typing.cast(int, kwargs['limit'])}
-            first_response = self.session.get(
+        def load() -> typing.List[typing.Dict[str, typing.Any]]:
+            first_response: requests.Response = self._request(
+                method='GET',
                 url=url,
                 params=params
             )
 
-        else:
-            first_response: requests.Response = self.session.get( # type: ignore
-                url=url
-            )
+            first_response.raise_for_status()
+
+            if 'limit' not in kwargs:
+                results: typing.List[typing.Dict[str, typing.Any]] = unwrap_page(self.codec.loads(first_response.content)[plural_entity_name])
+            else:
+                results = self._paginator(
+                    response_json=self.codec.loads(first_response.content),
+                    response_data_key=plural_entity_name
+                )
+
+            if self.store is not None:
+                self.store.put_listing(
+                    parent_type=plural_parent_entity_name,
+                    parent_id=parent_entity_id,
+                    entity_type=plural_entity_name,
+                    items=results,
+                    params=params_key
+                )
+
+            return results
+
+        return typing.cast(typing.List[typing.Dict[str, typing.Any]], self._coalesced_get(url=url, params=params, load=load))
+
+    def _iter_pages(
+            self,
+            plural_parent_entity_name: str,
+            parent_entity_id: str,
+            plural_entity_name: str,
+            limit: int = 1000,
+            prefetch: typing.Optional[int] = None,
+            **kwargs
+    ) -> typing.Iterator[typing.List[typing.Dict[str, typing.Any]]]:
+        """
+        Pattern to stream pages of entities from the API as they arrive.
+
+        Only the page currently being consumed is held in memory, plus up to
+        ``prefetch`` pages read ahead on a background worker (defaults to the
+        client's ``prefetch_pages``). Raises PaginationError mid-stream if a
+        later page cannot be fetched.
+
+        More information: https://marketingapi.snapchat.com/docs/#pagination
+        """
+
+        url: str = build_url(
+            base_url=self.BASE_URL,
+            endpoint=plural_parent_entity_name,
+            path=f'{parent_entity_id}/{plural_entity_name}',
+        )
+
+        first_response: requests.Response = self._request(
+            method='GET',
+            url=url,
+            params=build_params(limit=limit, **kwargs)
+        )
 
         first_response.raise_for_status()
 
-        if 'limit' not in kwargs:
-            return first_response.json()[plural_entity_name]
-        
-        results: typing.List[typing.Dict[str, typing.Any]] = self._paginator(
-            response_json=first_response.json(),
-            response_data_key=plural_entity_name
+        yield from self._iter_paginator(
+            response_json=self.codec.loads(first_response.content),
+            response_data_key=plural_entity_name,
+            prefetch=self.prefetch_pages if prefetch is None else prefetch
         )
-        return results
+
+    def _iter_many_entities(
+            self,
+            plural_parent_entity_name: str,
+            parent_entity_id: str,
+            plural_entity_name: str,
+            **kwargs
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        Pattern to stream multiple entities from the API, one at a time, page by page.
+        """
+
+        for page in self._iter_pages(
+            plural_parent_entity_name=plural_parent_entity_name,
+            parent_entity_id=parent_entity_id,
+            plural_entity_name=plural_entity_name,
+            **kwargs
+        ):
+            yield from page
         
+    def _get_many_columns(
+            self,
+            plural_parent_entity_name: str,
+            parent_entity_id: str,
+            plural_entity_name: str,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            **kwargs
+    ) -> columnar.Columns:
+        """
+        Pattern to read a whole listing straight into columns, converting it page by page
+        without building entity objects. Requires numpy.
+        """
+
+        return columnar.to_columns(
+            self._iter_pages(
+                plural_parent_entity_name=plural_parent_entity_name,
+                parent_entity_id=parent_entity_id,
+                plural_entity_name=plural_entity_name,
+                **kwargs
+            ),
+            self._entity_classes()[plural_entity_name],
+            fields
+        )
+
+    def _iter_many_columns(
+            self,
+            plural_parent_entity_name: str,
+            parent_entity_id: str,
+            plural_entity_name: str,
+            fields: typing.Optional[typing.Iterable[str]] = None,
+            **kwargs
+    ) -> typing.Iterator[columnar.Columns]:
+        """
+        Pattern to stream a listing as columns, one page at a time. Requires numpy.
+        """
+
+        yield from columnar.iter_columns(
+            self._iter_pages(
+                plural_parent_entity_name=plural_parent_entity_name,
+                parent_entity_id=parent_entity_id,
+                plural_entity_name=plural_entity_name,
+                **kwargs
+            ),
+            self._entity_classes()[plural_entity_name],
+            fields
+        )
+
     def _get_single_entity(
             self,
             plural_entity_name: str,
             entity_id: str,
             **kwargs 
-    ) -> typing.Dict[str, typing.Any]:
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
         """
-        Pattern to retrieve a single entity from the API.
+        Pattern to retrieve a single entity from the API, as a list holding the unwrapped entity.
         
         More information: https://marketingapi.snapchat.com/docs/#get-a-single-entity
         """
@@ -105,16 +353,37 @@ class SnapchatMarketing(object):
                     endpoint=plural_entity_name,
                     path=entity_id
                 )
-        
-        result = self.session.get(
-            url=url
+
+        def fetch() -> typing.List[typing.Dict[str, typing.Any]]:
+            if self.store is not None:
+                stored = self.store.get(entity_type=plural_entity_name, entity_id=entity_id)
+                if stored is not None:
+                    return [stored]
+
+            def load() -> typing.List[typing.Dict[str, typing.Any]]:
+                result = self._request(
+                    method='GET',
+                    url=url
+                )
+                result.raise_for_status()
+
+                entity = unwrap_page(self.codec.loads(result.content)[plural_entity_name])
+                if self.store is not None:
+                    self.store.put_many(entity_type=plural_entity_name, items=entity)
+
+                return entity
+
+            return typing.cast(typing.List[typing.Dict[str, typing.Any]], self._coalesced_get(url=url, params=None, load=load))
+
+        if self.cache is None:
+            return fetch()
+
+        return self.cache.get_or_load(
+            key=(plural_entity_name, str(entity_id)),
+            loader=fetch
         )
 
-        return result.json()[plural_entity_name]
-        
-            
 
-    
     def _paginator(
             self,
             response_json: typing.Dict[str, typing.Any],
@@ -128,23 +397,155 @@ class SnapchatMarketing(object):
         
         result_bag: typing.List = []
 
+        try:
+            for page in self._iter_paginator(
+                response_json=response_json,
+                response_data_key=response_data_key
+            ):
+                result_bag.extend(page)
+        except errors.PaginationError as e:
+            # keep what was fetched so the caller can resume from e.next_link
+            e.results = result_bag
+            raise
+            
+        return typing.cast(typing.List[typing.Dict[str, typing.Any]], result_bag)
+
+    def _iter_paginator(
+            self,
+            response_json: typing.Dict[str, typing.Any],
+            response_data_key: str,
+            prefetch: int = 0
+    ) -> typing.Iterator[typing.List[typing.Dict[str, typing.Any]]]:
+        """
+        Generator form of the paginator, yielding one page at a time.
+        With ``prefetch`` > 0 the following pages are fetched ahead of the consumer.
+        """
+
+        if prefetch > 0:
+            yield from self._prefetching_paginator(
+                response_json=response_json,
+                response_data_key=response_data_key,
+                prefetch=prefetch
+            )
+            return
+
         while True:
             try:
-                result_bag.extend(response_json[response_data_key])
+                page: typing.List[typing.Dict[str, typing.Any]] = unwrap_page(response_json[response_data_key])
             except KeyError:
                 break
-            if "next_link" not in response_json["paging"]:
+            next_link: typing.Optional[str] = response_json.get("paging", {}).get("next_link")
+
+            # drop our reference to the raw page before handing it out
+            del response_json
+            yield page
+            del page
+
+            if not next_link:
                 break
             try:
-                response = self.session.get(
-                    url=response_json["paging"]["next_link"]
-                )
-                response.raise_for_status()
-                response_json = response.json()
+                response_json = self._fetch_page(url=next_link)
             except Exception as e:
-                raise errors.PaginationError() from e
-            
-        return typing.cast(typing.List[typing.Dict[str, typing.Any]], result_bag)
+                raise errors.PaginationError.from_error(error=e, next_link=next_link) from e
+
+    def _prefetching_paginator(
+            self,
+            response_json: typing.Dict[str, typing.Any],
+            response_data_key: str,
+            prefetch: int
+    ) -> typing.Iterator[typing.List[typing.Dict[str, typing.Any]]]:
+        """
+        Paginator that requests and decodes the next pages on a background worker while
+        the caller consumes the current one. At most ``prefetch`` decoded pages are
+        buffered, so memory stays bounded however long the listing is.
+        """
+
+        done = object()
+        stop = threading.Event()
+        buffer: queue.Queue = queue.Queue(maxsize=prefetch)
+
+        def put(item: typing.Any) -> bool:
+            # give up as soon as the consumer goes away so the worker never blocks forever
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def worker(response_json: typing.Dict[str, typing.Any]) -> None:
+            next_link: typing.Optional[str] = None
+            try:
+                while not stop.is_set():
+                    if response_data_key not in response_json:
+                        break
+                    next_link = response_json.get("paging", {}).get("next_link")
+                    if not put(unwrap_page(response_json[response_data_key])) or not next_link:
+                        break
+                    response_json = self._fetch_page(url=next_link)
+            except Exception as e:
+                put(errors.PaginationError.from_error(error=e, next_link=typing.cast(str, next_link)))
+            finally:
+                put(done)
+
+        thread = threading.Thread(
+            target=worker,
+            args=(response_json,),
+            name=f'pysnapchatads-prefetch-{response_data_key}',
+            daemon=True
+        )
+        del response_json
+        thread.start()
+
+        try:
+            while True:
+                item = buffer.get()
+                if item is done:
+                    break
+                if isinstance(item, errors.PaginationError):
+                    raise item
+                yield item
+                del item
+        finally:
+            stop.set()
+
+    def _resume_paginator(
+            self,
+            next_link: str,
+            response_data_key: str,
+            prefetch: int = 0
+    ) -> typing.Iterator[typing.List[typing.Dict[str, typing.Any]]]:
+        """
+        Continue a listing from the page link carried by a PaginationError, instead of starting over.
+        """
+
+        try:
+            response_json = self._fetch_page(url=next_link)
+        except Exception as e:
+            raise errors.PaginationError.from_error(error=e, next_link=next_link) from e
+
+        yield from self._iter_paginator(
+            response_json=response_json,
+            response_data_key=response_data_key,
+            prefetch=prefetch
+        )
+
+    def _fetch_page(
+            self,
+            url: str
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Fetch and decode a single page of a paginated listing.
+        """
+
+        response = self._request(
+            method='GET',
+            url=url
+        )
+        response.raise_for_status()
+
+        return self.codec.loads(response.content)
     
 
     def _create_entities(
@@ -169,16 +570,156 @@ class SnapchatMarketing(object):
             path=f'{parent_entity_id}/{plural_entity_name}'
         )
 
-        results = self.session.post(
+        results = self._request(
+            method='POST',
             url=url,
-            json=data
+            data=self.codec.dumps(data),
+            headers={'Content-Type': 'application/json'}
         )
         
         results.raise_for_status()
 
-        
-        return results.json()[plural_entity_name]
-    
+        created: typing.List[typing.Dict[str, typing.Any]] = self.codec.loads(results.content)[plural_entity_name]
+        if self.cache is not None:
+            self.cache.invalidate_many(plural_entity_name, caching.entity_ids(created))
+        if self.store is not None:
+            self.store.put_many(entity_type=plural_entity_name, items=created)
+
+        return created
+
+    def _bulk_create_entities(
+            self,
+            plural_parent_entity_name: str,
+            plural_entity_name: str,
+            data: typing.Iterable[typing.Dict[str, typing.Any]],
+            parent_entity_id: typing.Optional[str] = None,
+            batch_size: int = 500,
+            max_workers: int = 4,
+            retry_failed: int = 1
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Create any number of entities, split into batches of ``batch_size`` per parent and posted concurrently.
+
+        Without ``parent_entity_id`` items are grouped by their parent id field (``ad_account_id``,
+        ``campaign_id``, ...). Each item's ``sub_request_status`` is checked, and only the items that failed
+        are posted again, up to ``retry_failed`` more times.
+
+        Returns the created entities in input order. Raises BulkCreateError, carrying the partial results,
+        when some items still fail.
+        """
+        data = list(data)
+        results: typing.List[typing.Optional[typing.Dict[str, typing.Any]]] = [None] * len(data)
+        failures: typing.Dict[int, errors.BulkItemFailure] = {}
+        pending: typing.List[int] = list(range(len(data)))
+
+        for _ in range(retry_failed + 1):
+            if not pending:
+                break
+
+            batches: typing.List[typing.Tuple[str, typing.List[int]]] = []
+            for parent_id, indices in self._group_by_parent(plural_parent_entity_name, data, pending, parent_entity_id).items():
+                for start in range(0, len(indices), batch_size):
+                    batches.append((parent_id, indices[start:start + batch_size]))
+
+            def post(batch: typing.Tuple[str, typing.List[int]]) -> typing.List[typing.Tuple[typing.Optional[typing.Dict[str, typing.Any]], typing.Optional[str]]]:
+                parent_id, indices = batch
+                return self._create_batch(plural_parent_entity_name, parent_id, plural_entity_name, [data[i] for i in indices])
+
+            failures = {}
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+                for (_, indices), outcomes in zip(batches, executor.map(post, batches)):
+                    for index, (created, reason) in zip(indices, outcomes):
+                        if created is not None:
+                            results[index] = created
+                        else:
+                            failures[index] = errors.BulkItemFailure(index=index, item=data[index], reason=typing.cast(str, reason))
+
+            pending = sorted(failures)
+
+        if failures:
+            raise errors.BulkCreateError(failures=[failures[i] for i in pending], results=results)
+
+        return typing.cast(typing.List[typing.Dict[str, typing.Any]], results)
+
+    PARENT_ID_FIELDS: typing.Dict[str, str] = {
+        'organizations': 'organization_id',
+        'adaccounts': 'ad_account_id',
+        'campaigns': 'campaign_id',
+        'adsquads': 'ad_squad_id'
+    }
+    """Field of a child entity holding its parent's id, by plural parent entity name."""
+
+    def _group_by_parent(
+            self,
+            plural_parent_entity_name: str,
+            data: typing.List[typing.Dict[str, typing.Any]],
+            indices: typing.List[int],
+            parent_entity_id: typing.Optional[str] = None
+    ) -> typing.Dict[str, typing.List[int]]:
+        if parent_entity_id is not None:
+            return {str(parent_entity_id): indices}
+
+        field = self.PARENT_ID_FIELDS[plural_parent_entity_name]
+        groups: typing.Dict[str, typing.List[int]] = {}
+        for i in indices:
+            if field not in data[i]:
+                raise ValueError(f'Item {i} has no {field}; pass parent_entity_id or set it on every item')
+            groups.setdefault(str(data[i][field]), []).append(i)
+        return groups
+
+    def _create_batch(
+            self,
+            plural_parent_entity_name: str,
+            parent_entity_id: str,
+            plural_entity_name: str,
+            data: typing.List[typing.Dict[str, typing.Any]]
+    ) -> typing.List[typing.Tuple[typing.Optional[typing.Dict[str, typing.Any]], typing.Optional[str]]]:
+        """
+        POST one batch and return ``(created, error_reason)`` per item, in order.
+        """
+        url: str = build_url(
+            base_url=self.BASE_URL,
+            endpoint=plural_parent_entity_name,
+            path=f'{parent_entity_id}/{plural_entity_name}'
+        )
+
+        try:
+            response = self._request(
+                method='POST',
+                url=url,
+                data=self.codec.dumps(data),
+                headers={'Content-Type': 'application/json'}
+            )
+        except requests.RequestException as e:
+            return [(None, str(e))] * len(data)
+
+        # partial failures come back as an error status with the per-item results in the body
+        try:
+            body = self.codec.loads(response.content)
+            listed = body[plural_entity_name]
+        except (ValueError, KeyError, TypeError):
+            body, listed = None, None
+
+        if not isinstance(listed, list) or len(listed) != len(data):
+            reason = (body or {}).get('debug_message') if isinstance(body, dict) else None
+            return [(None, reason or f'{response.status_code} {response.reason}')] * len(data)
+
+        outcomes: typing.List[typing.Tuple[typing.Optional[typing.Dict[str, typing.Any]], typing.Optional[str]]] = []
+        for item in listed:
+            status = str(item.get('sub_request_status', 'SUCCESS' if response.ok else 'ERROR'))
+            if status.upper() == 'SUCCESS':
+                outcomes.append((item, None))
+            else:
+                outcomes.append((None, item.get('sub_request_error_reason') or status))
+
+        created = [item for item, _ in outcomes if item is not None]
+        if self.cache is not None:
+            self.cache.invalidate_many(plural_entity_name, caching.entity_ids(created))
+        if self.store is not None:
+            self.store.put_many(entity_type=plural_entity_name, items=created)
+
+        return outcomes
+
 
     def _update_entities(
             self,
@@ -202,14 +743,25 @@ class SnapchatMarketing(object):
             path=f'{parent_entity_id}/{plural_entity_name}'
         )
 
-        results = self.session.put(
-            url=url,
-            json=data
-        )
+        try:
+            results = self._request(
+                method='PUT',
+                url=url,
+                data=self.codec.dumps(data),
+                headers={'Content-Type': 'application/json'}
+            )
+        finally:
+            # even a failed bulk update may have applied some items
+            if self.cache is not None:
+                self.cache.invalidate_many(plural_entity_name, caching.entity_ids(data))
 
         results.raise_for_status()
 
-        return results.json()[plural_entity_name]
+        updated: typing.List[typing.Dict[str, typing.Any]] = self.codec.loads(results.content)[plural_entity_name]
+        if self.store is not None:
+            self.store.put_many(entity_type=plural_entity_name, items=updated)
+
+        return updated
     
     def _delete_entity(
             self,
@@ -222,16 +774,173 @@ class SnapchatMarketing(object):
         More information: https://marketingapi.snapchat.com/docs/#delete-a-single-entity
         """
 
+        batch = self._active_batch()
+        if batch is not None:
+            batch.delete(plural_entity_name=plural_entity_name, entity_id=entity_id)
+            return
+
         url: str = build_url(
             base_url=self.BASE_URL,
             endpoint=plural_entity_name,
             path=entity_id
         )
 
-        self.session.delete(
-            url=url
+        try:
+            self._request(
+                method='DELETE',
+                url=url
+            )
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate((plural_entity_name, str(entity_id)))
+            if self.store is not None:
+                self.store.delete(entity_type=plural_entity_name, entity_ids=[entity_id])
+
+    def _get_stats(
+            self,
+            plural_entity_name: str,
+            entity_id: str,
+            **kwargs
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Pattern to retrieve the stats of an entity. Keyword arguments are sent as query parameters.
+
+        More information: https://marketingapi.snapchat.com/docs/#measurement
+        """
+        response: requests.Response = self._request(
+            method='GET',
+            url=build_url(
+                base_url=self.BASE_URL,
+                endpoint=plural_entity_name,
+                path=f'{entity_id}/stats'
+            ),
+            params=build_params(**kwargs)
         )
-    
+        response.raise_for_status()
+
+        return self.codec.loads(response.content)
+
+    def _get_stats_report(
+            self,
+            ad_account_id: str,
+            report_run_id: str
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Pattern to check on an asynchronous stats report submitted with ``async=true``.
+        """
+        response: requests.Response = self._request(
+            method='GET',
+            url=build_url(
+                base_url=self.BASE_URL,
+                endpoint='adaccounts',
+                path=f'{ad_account_id}/stats_report'
+            ),
+            params={'report_run_id': report_run_id}
+        )
+        response.raise_for_status()
+
+        return self.codec.loads(response.content)
+
+    ########################
+    # Unit of work
+    ########################
+
+    def batch(
+            self,
+            batch_size: int = 500,
+            max_workers: int = 4
+    ) -> batching.Batch:
+        """
+        Collect entity changes made in a ``with client.batch() as b:`` block and write them on exit
+        as grouped bulk requests. See Batch.
+        """
+        return batching.Batch(api_client=self, batch_size=batch_size, max_workers=max_workers)
+
+    def _active_batch(self) -> typing.Optional[batching.Batch]:
+        """
+        The innermost batch open on this thread, unless it is being flushed.
+        """
+        stack: typing.List[batching.Batch] = getattr(self._batches, 'stack', [])
+        if not stack or stack[-1].flushing:
+            return None
+        return stack[-1]
+
+    def _push_batch(self, batch: batching.Batch) -> None:
+        if not hasattr(self._batches, 'stack'):
+            self._batches.stack = []
+        self._batches.stack.append(batch)
+
+    def _pop_batch(self, batch: batching.Batch) -> None:
+        self._batches.stack.remove(batch)
+
+    ########################
+    # Persistent store
+    ########################
+
+    def load_stored(
+            self,
+            plural_entity_name: str,
+            plural_parent_entity_name: typing.Optional[str] = None,
+            parent_entity_id: typing.Optional[str] = None
+    ) -> typing.List[typing.Any]:
+        """
+        Rehydrate every stored entity of a type, or those of one stored listing, without the network.
+
+        :param plural_entity_name: One of organizations, adaccounts, campaigns, adsquads or ads.
+        """
+
+        if self.store is None:
+            raise ValueError('load_stored requires a client created with a store')
+
+        entity_class = self._entity_classes()[plural_entity_name]
+
+        # stores written by earlier versions kept the API's envelopes
+        return entity_class.from_json_many(
+            self,
+            map(unwrap, self.store.load(
+                entity_type=plural_entity_name,
+                parent_type=plural_parent_entity_name,
+                parent_id=parent_entity_id
+            ))
+        )
+
+    def _get_entity_object(
+            self,
+            plural_entity_name: str,
+            entity_id: str
+    ) -> typing.Any:
+        """
+        The live object of an ad account, campaign, ad squad or ad, fetched only if the client holds none.
+        """
+        entity_class = self._entity_classes()[plural_entity_name]
+
+        if self.identity_map is not None:
+            live = self.identity_map.get(entity_class, entity_id)
+            if live is not None:
+                return live
+
+        return entity_class.from_json(
+            self,
+            self._get_single_entity(plural_entity_name=plural_entity_name, entity_id=str(entity_id))[0]
+        )
+
+    @staticmethod
+    def _entity_classes() -> typing.Dict[str, typing.Any]:
+        """
+        Entity classes by plural entity name. Built lazily since the object modules import this one.
+        """
+        import pysnapchatads.objects.campaigns as campaigns
+        import pysnapchatads.objects.ad_squads as ad_squads
+        import pysnapchatads.objects.ads as ads
+
+        return {
+            'organizations': orgs.Organization,
+            'adaccounts': ad_accountz.AdAccount,
+            'campaigns': campaigns.Campaign,
+            'adsquads': ad_squads.AdSquad,
+            'ads': ads.Ad
+        }
+
     ########################
     # Organizations
     ########################
@@ -247,9 +956,10 @@ class SnapchatMarketing(object):
         More information: https://marketingapi.snapchat.com/docs/#list-organizations
         """
 
-        response_data: requests.Response = self.session.get(
-            url=f'{self.BASE_URL}/me/organizations',
-            params={'with_ad_accounts': with_ad_accounts} if with_ad_accounts else None
+        response_data: requests.Response = self._request(
+            method='GET',
+            url=build_url(base_url=self.BASE_URL, endpoint='me', path='organizations'),
+            params=build_params(with_ad_accounts=True) if with_ad_accounts else None
         )
 
         response_data.raise_for_status()
@@ -260,33 +970,26 @@ class SnapchatMarketing(object):
                     api_client=self,
                     json_data=org
                 )
-                for org in response_data.json()['organizations']
+                for org in self.codec.loads(response_data.content)['organizations']
             ]
-        
-        with typing.cast(typing.Dict[str, typing.Union[str, typing.Any, typing.Dict[str, typing.Any]]], response_data.json()) as data:
-
-                ad_accounts = data['organizations']['ad_accounts']
-                org = data['organizations']
-
-                # remove the ad_accounts key from the org
-                typing.cast(typing.Dict[str, typing.Any],org).pop('ad_accounts')
-
-                return [
-                    (
-                        orgs.Organization.from_json(
-                            api_client=self,
-                            json_data=org
-                        ),
-                        [
-                            ad_accountz.AdAccount.from_json(
-                                api_client=self,
-                                json_data=ad_account
-                            )
-                            for ad_account in ad_accounts
-                        ]
+
+        # each organization carries its ad accounts inline; Organization.from_json ignores the extra key
+        return [
+            (
+                orgs.Organization.from_json(
+                    api_client=self,
+                    json_data=org
+                ),
+                [
+                    ad_accountz.AdAccount.from_json(
+                        api_client=self,
+                        json_data=ad_account
                     )
-                for org in data['organizations']
+                    for ad_account in org['organization'].get('ad_accounts', [])
                 ]
+            )
+            for org in self.codec.loads(response_data.content)['organizations']
+        ]
         
 
     def get_organization(
@@ -304,7 +1007,7 @@ class SnapchatMarketing(object):
             json_data=self._get_single_entity(
                 plural_entity_name='organizations',
                 entity_id=organization_id
-            )
+            )[0]
         )
     
     ########################
@@ -324,5 +1027,5 @@ class SnapchatMarketing(object):
             json_data=self._get_single_entity(
                 plural_entity_name='adaccounts',
                 entity_id=ad_account_id
-            )
+            )[0]
         )
\ No newline at end of file
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+import typing
+
+import pysnapchatads.codec as codecs
+from pysnapchatads.helpers import unwrap
+
+MaxAge = typing.Union[None, float, typing.Mapping[str, typing.Optional[float]]]
+"""Seconds an entity stays fresh, either for every entity type or per plural entity name. None means forever."""
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS entities (
+    entity_type TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    updated_at TEXT,
+    fetched_at REAL NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (entity_type, entity_id)
+);
+CREATE TABLE IF NOT EXISTS listings (
+    parent_type TEXT NOT NULL,
+    parent_id TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    params TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (parent_type, parent_id, entity_type, params)
+);
+CREATE TABLE IF NOT EXISTS listing_members (
+    parent_type TEXT NOT NULL,
+    parent_id TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    params TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (parent_type, parent_id, entity_type, params, entity_id)
+);
+'''
+
+class SQLiteEntityStore(object):
+    """
+    Persistent store of entity JSON in a local SQLite file, shareable between processes.
+
+    Entities are keyed by ``(entity_type, entity_id)`` using the API's plural entity names
+    and keep their ``updated_at``, so a write never replaces a newer version stored by another
+    process. Complete listings are recorded per parent (and listing parameters) so they can be
+    served without the network while fresh according to ``max_age``.
+
+    The database runs in WAL mode so readers in other processes are not blocked by a writer.
+    Each thread gets its own connection.
+    """
+
+    def __init__(
+            self,
+            path: typing.Union[str, os.PathLike],
+            max_age: MaxAge = 3600.0,
+            timeout: float = 30.0,
+            codec: typing.Optional[codecs.JSONCodec] = None
+    ) -> None:
+        self.path: str = os.fspath(path)
+        self.max_age: MaxAge = max_age
+        self.timeout: float = timeout
+        self.codec: codecs.JSONCodec = codec if codec is not None else codecs.get_codec()
+
+        self._local = threading.local()
+
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: typing.Optional[sqlite3.Connection] = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """
+        Close this thread's connection.
+        """
+        connection: typing.Optional[sqlite3.Connection] = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _oldest_fresh(self, entity_type: str, max_age: MaxAge) -> float:
+        """
+        The oldest ``fetched_at`` still considered fresh for ``entity_type``.
+        """
+        if isinstance(max_age, typing.Mapping):
+            max_age = max_age.get(entity_type)
+        if max_age is None:
+            return float('-inf')
+        return time.time() - max_age
+
+    ########################
+    # Writes
+    ########################
+
+    def put_many(
+            self,
+            entity_type: str,
+            items: typing.Iterable[typing.Mapping[str, typing.Any]]
+    ) -> typing.List[str]:
+        """
+        Store entity JSON as returned by the API, out of its ``sub_request_status`` envelope. Returns the ids written.
+        """
+        now = time.time()
+        rows = []
+        for item in items:
+            entity = unwrap(item)
+            if 'id' not in entity:
+                continue
+            rows.append((
+                entity_type,
+                str(entity['id']),
+                entity.get('updated_at'),
+                now,
+                self.codec.dumps(entity)
+            ))
+
+        with self._connection() as connection:
+            connection.executemany(
+                '''
+                INSERT INTO entities (entity_type, entity_id, updated_at, fetched_at, body)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (entity_type, entity_id) DO UPDATE SET
+                    updated_at = excluded.updated_at,
+                    fetched_at = excluded.fetched_at,
+                    body = excluded.body
+                WHERE entities.updated_at IS NULL
+                    OR excluded.updated_at IS NULL
+                    OR excluded.updated_at >= entities.updated_at
+                ''',
+                rows
+            )
+
+        return [row[1] for row in rows]
+
+    def put_listing(
+            self,
+            parent_type: str,
+            parent_id: str,
+            entity_type: str,
+            items: typing.Iterable[typing.Mapping[str, typing.Any]],
+            params: str = ''
+    ) -> None:
+        """
+        Store a complete listing of ``entity_type`` under a parent, replacing its previous members.
+        """
+        entity_ids = self.put_many(entity_type, items)
+
+        with self._connection() as connection:
+            connection.execute(
+                'DELETE FROM listing_members WHERE parent_type = ? AND parent_id = ? AND entity_type = ? AND params = ?',
+                (parent_type, str(parent_id), entity_type, params)
+            )
+            connection.executemany(
+                'INSERT OR IGNORE INTO listing_members (parent_type, parent_id, entity_type, params, entity_id, position) VALUES (?, ?, ?, ?, ?, ?)',
+                [
+                    (parent_type, str(parent_id), entity_type, params, entity_id, position)
+                    for position, entity_id in enumerate(entity_ids)
+                ]
+            )
+            connection.execute(
+                'INSERT OR REPLACE INTO listings (parent_type, parent_id, entity_type, params, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                (parent_type, str(parent_id), entity_type, params, time.time())
+            )
+
+    def delete(self, entity_type: str, entity_ids: typing.Iterable[str]) -> None:
+        keys = [(entity_type, str(entity_id)) for entity_id in entity_ids]
+
+        with self._connection() as connection:
+            connection.executemany('DELETE FROM entities WHERE entity_type = ? AND entity_id = ?', keys)
+            connection.executemany('DELETE FROM listing_members WHERE entity_type = ? AND entity_id = ?', keys)
+
+    ########################
+    # Reads
+    ########################
+
+    def get(
+            self,
+            entity_type: str,
+            entity_id: str,
+            max_age: MaxAge = ...  # type: ignore
+    ) -> typing.Optional[typing.Any]:
+        """
+        The stored JSON of one entity, or None when it is missing or stale.
+        """
+        oldest = self._oldest_fresh(entity_type, self.max_age if max_age is ... else max_age)
+
+        row = self._connection().execute(
+            'SELECT body FROM entities WHERE entity_type = ? AND entity_id = ? AND fetched_at >= ?',
+            (entity_type, str(entity_id), oldest)
+        ).fetchone()
+
+        return self.codec.loads(row[0]) if row is not None else None
+
+    def get_listing(
+            self,
+            parent_type: str,
+            parent_id: str,
+            entity_type: str,
+            params: str = '',
+            max_age: MaxAge = ...  # type: ignore
+    ) -> typing.Optional[typing.List[typing.Any]]:
+        """
+        The stored listing of ``entity_type`` under a parent, or None when it was never stored or is stale.
+        """
+        oldest = self._oldest_fresh(entity_type, self.max_age if max_age is ... else max_age)
+
+        listed = self._connection().execute(
+            'SELECT 1 FROM listings WHERE parent_type = ? AND parent_id = ? AND entity_type = ? AND params = ? AND fetched_at >= ?',
+            (parent_type, str(parent_id), entity_type, params, oldest)
+        ).fetchone()
+
+        if listed is None:
+            return None
+
+        return list(self.load(entity_type, parent_type=parent_type, parent_id=parent_id, params=params))
+
+    def load(
+            self,
+            entity_type: str,
+            parent_type: typing.Optional[str] = None,
+            parent_id: typing.Optional[str] = None,
+            params: typing.Optional[str] = None,
+            batch_size: int = 1000
+    ) -> typing.Iterator[typing.Any]:
+        """
+        Stream every stored entity of a type, or the members of the stored listings of one parent,
+        regardless of age. ``params`` narrows a parent to the listing made with those parameters.
+        """
+        if parent_type is None:
+            cursor = self._connection().execute(
+                'SELECT body FROM entities WHERE entity_type = ? ORDER BY rowid',
+                (entity_type,)
+            )
+        else:
+            cursor = self._connection().execute(
+                '''
+                SELECT e.body FROM listing_members m
+                JOIN entities e ON e.entity_type = m.entity_type AND e.entity_id = m.entity_id
+                WHERE m.parent_type = ? AND m.parent_id = ? AND m.entity_type = ? AND (? IS NULL OR m.params = ?)
+                GROUP BY e.entity_id
+                ORDER BY MIN(m.position)
+                ''',
+                (parent_type, str(parent_id), entity_type, params, params)
+            )
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield self.codec.loads(row[0])
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import typing
+
+import pysnapchatads.snapchat as snap
+from pysnapchatads.helpers import unwrap
+
+SyncKey = typing.Tuple[str, str, str]
+"""``(plural_parent_entity_name, parent_entity_id, plural_entity_name)``"""
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS sync_entities (
+    parent_type TEXT NOT NULL,
+    parent_id TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    updated_at TEXT,
+    PRIMARY KEY (parent_type, parent_id, entity_type, entity_id)
+);
+CREATE TABLE IF NOT EXISTS sync_watermarks (
+    parent_type TEXT NOT NULL,
+    parent_id TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    watermark TEXT,
+    PRIMARY KEY (parent_type, parent_id, entity_type)
+);
+'''
+
+class SyncDelta(object):
+    """
+    What changed under one parent since the previous sync.
+    """
+
+    created: typing.List[typing.Any]
+    """Entities not seen before."""
+    updated: typing.List[typing.Any]
+    """Entities whose ``updated_at`` moved past the last seen value."""
+    deleted: typing.List[str]
+    """Ids of entities flagged ``deleted`` or no longer listed."""
+    watermark: typing.Optional[str]
+    """Newest ``updated_at`` seen under the parent."""
+    scanned: int
+    """Entities read from the listing."""
+
+    def __init__(self) -> None:
+        self.created = []
+        self.updated = []
+        self.deleted = []
+        self.watermark = None
+        self.scanned = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.created or self.updated or self.deleted)
+
+    def __len__(self) -> int:
+        return len(self.created) + len(self.updated) + len(self.deleted)
+
+
+class SyncState(object):
+    """
+    Last seen ``updated_at`` per entity and a watermark per parent, kept in memory and
+    optionally persisted to a SQLite file. Applying a delta only writes the changed rows.
+    """
+
+    def __init__(
+            self,
+            path: typing.Optional[typing.Union[str, os.PathLike]] = None
+    ) -> None:
+        self.path: typing.Optional[str] = os.fspath(path) if path is not None else None
+
+        self._known: typing.Dict[SyncKey, typing.Dict[str, typing.Optional[str]]] = {}
+        self._watermarks: typing.Dict[SyncKey, typing.Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._connection: typing.Optional[sqlite3.Connection] = None
+
+        if self.path is not None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            with self._connection:
+                self._connection.executescript(_SCHEMA)
+
+    def known(self, key: SyncKey) -> typing.Dict[str, typing.Optional[str]]:
+        """
+        ``entity_id -> updated_at`` for the entities last seen under a parent.
+        """
+        with self._lock:
+            if key not in self._known:
+                self._known[key] = self._read_known(key)
+            return self._known[key]
+
+    def watermark(self, key: SyncKey) -> typing.Optional[str]:
+        with self._lock:
+            if key not in self._watermarks:
+                self._watermarks[key] = self._read_watermark(key)
+            return self._watermarks[key]
+
+    def apply(
+            self,
+            key: SyncKey,
+            changed: typing.Mapping[str, typing.Optional[str]],
+            deleted: typing.Iterable[str],
+            watermark: typing.Optional[str]
+    ) -> None:
+        """
+        Record changed entities, forget deleted ones and move the watermark.
+        """
+        deleted = list(deleted)
+        known = self.known(key)
+
+        with self._lock:
+            known.update(changed)
+            for entity_id in deleted:
+                known.pop(entity_id, None)
+            self._watermarks[key] = watermark
+
+            if self._connection is None:
+                return
+
+            with self._connection:
+                self._connection.executemany(
+                    'INSERT OR REPLACE INTO sync_entities (parent_type, parent_id, entity_type, entity_id, updated_at) VALUES (?, ?, ?, ?, ?)',
+                    [(*key, entity_id, updated_at) for entity_id, updated_at in changed.items()]
+                )
+                self._connection.executemany(
+                    'DELETE FROM sync_entities WHERE parent_type = ? AND parent_id = ? AND entity_type = ? AND entity_id = ?',
+                    [(*key, entity_id) for entity_id in deleted]
+                )
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO sync_watermarks (parent_type, parent_id, entity_type, watermark) VALUES (?, ?, ?, ?)',
+                    (*key, watermark)
+                )
+
+    def _read_known(self, key: SyncKey) -> typing.Dict[str, typing.Optional[str]]:
+        if self._connection is None:
+            return {}
+        return dict(self._connection.execute(
+            'SELECT entity_id, updated_at FROM sync_entities WHERE parent_type = ? AND parent_id = ? AND entity_type = ?',
+            key
+        ).fetchall())
+
+    def _read_watermark(self, key: SyncKey) -> typing.Optional[str]:
+        if self._connection is None:
+            return None
+        row = self._connection.execute(
+            'SELECT watermark FROM sync_watermarks WHERE parent_type = ? AND parent_id = ? AND entity_type = ?',
+            key
+        ).fetchone()
+        return row[0] if row is not None else None
+
+
+class IncrementalSync(object):
+    """
+    Incremental sync of entity listings driven by ``updated_at``.
+
+    Each sync streams the parent's listing (including deleted entities) page by page and only
+    compares raw ``id``/``updated_at`` pairs against the state: entities at or below the parent's
+    watermark that are already known are skipped without further work. Objects are built, stored
+    and recorded only for created, updated and deleted entities, so applying a sync is
+    proportional to the number of changes rather than the size of the account.
+
+    When the client has a persistent store, changed entities are written to it as well.
+    """
+
+    def __init__(
+            self,
+            api_client: snap.SnapchatMarketing,
+            state: typing.Optional[SyncState] = None,
+            page_size: int = 1000
+    ) -> None:
+        self.api_client: snap.SnapchatMarketing = api_client
+        self.state: SyncState = state if state is not None else SyncState()
+        self.page_size: int = page_size
+
+    def sync(
+            self,
+            plural_parent_entity_name: str,
+            parent_entity_id: str,
+            plural_entity_name: str
+    ) -> SyncDelta:
+        """
+        Sync one listing, e.g. ``sync('adaccounts', account_id, 'campaigns')``, and return what changed.
+        """
+        key: SyncKey = (plural_parent_entity_name, str(parent_entity_id), plural_entity_name)
+        known = self.state.known(key)
+        watermark = self.state.watermark(key)
+        entity_class = self.api_client._entity_classes()[plural_entity_name]
+
+        delta = SyncDelta()
+        delta.watermark = watermark
+        seen: typing.Set[str] = set()
+        changed_items: typing.List[typing.Any] = []
+        changed: typing.Dict[str, typing.Optional[str]] = {}
+
+        for item in self.api_client._iter_many_entities(
+            plural_parent_entity_name=plural_parent_entity_name,
+            parent_entity_id=str(parent_entity_id),
+            plural_entity_name=plural_entity_name,
+            limit=self.page_size,
+            read_deleted_entities=True
+        ):
+            delta.scanned += 1
+            entity = unwrap(item)
+            entity_id = str(entity['id'])
+            updated_at: typing.Optional[str] = entity.get('updated_at')
+            seen.add(entity_id)
+
+            if updated_at is not None and (delta.watermark is None or updated_at > delta.watermark):
+                delta.watermark = updated_at
+
+            is_known = entity_id in known
+
+            # fast path: nothing newer than the watermark can have changed
+            if is_known and updated_at is not None and watermark is not None and updated_at <= watermark:
+                continue
+
+            if entity.get('deleted'):
+                if is_known:
+                    delta.deleted.append(entity_id)
+                continue
+
+            if not is_known:
+                delta.created.append(entity_class.from_json(self.api_client, entity))
+            elif updated_at != known[entity_id]:
+                delta.updated.append(entity_class.from_json(self.api_client, entity))
+            else:
+                continue
+
+            changed[entity_id] = updated_at
+            changed_items.append(entity)
+
+        # entities that disappeared from the listing were removed outright
+        delta.deleted.extend(entity_id for entity_id in known if entity_id not in seen)
+
+        if self.api_client.store is not None:
+            self.api_client.store.put_many(entity_type=plural_entity_name, items=changed_items)
+            self.api_client.store.delete(entity_type=plural_entity_name, entity_ids=delta.deleted)
+
+        self.state.apply(key, changed=changed, deleted=delta.deleted, watermark=delta.watermark)
+
+        return delta
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+import time
+import typing
+
+try:
+    import fcntl
+except ImportError: # pragma: no cover
+    fcntl = None # type: ignore
+
+import pysnapchatads.helpers as helpers
+
+class TokenStats(typing.NamedTuple):
+    """
+    Counters of a TokenManager.
+    """
+
+    refreshes: int
+    """Access tokens fetched from the OAuth endpoint by this manager."""
+    shared: int
+    """Fresh access tokens picked up from the token file instead of refreshing."""
+    rejected: int
+    """Access tokens the API answered 401 for."""
+
+
+class TokenManager(object):
+    """
+    Keeps an OAuth access token fresh for the clients it is given to.
+
+    The token is refreshed ``refresh_margin`` seconds before it expires, by one thread while
+    the others keep using the current token until it actually expires; only then, or when
+    there is no token yet, do callers wait for the refresh. A token the API rejects with a
+    401 is refreshed right away, and the client sends the rejected request once more with
+    the new token.
+
+    With ``token_file``, processes using the same file share one token: refreshes happen under
+    an exclusive lock on ``<token_file>.lock``, and a process that finds a fresh token in the
+    file adopts it instead of refreshing again. The lock needs ``fcntl``; where that is missing
+    only threads of one process are coordinated.
+    """
+
+    def __init__(
+            self,
+            client_id: str,
+            client_secret: str,
+            refresh_token: str,
+            access_token: typing.Optional[str] = None,
+            expires_at: typing.Optional[float] = None,
+            refresh_margin: float = 300.0,
+            token_file: typing.Optional[str] = None
+    ) -> None:
+        self.client_id: str = client_id
+        self.client_secret: str = client_secret
+        self.refresh_margin: float = refresh_margin
+        """Seconds before expiry at which the token is refreshed."""
+        self.token_file: typing.Optional[str] = token_file
+        """JSON file the token is shared through. It holds credentials and is created readable by the owner only."""
+
+        self._refresh_token: str = refresh_token
+        # (access token, expiry as a unix timestamp), replaced as a whole so readers never see half an update
+        self._current: typing.Optional[typing.Tuple[str, float]] = None
+        if access_token is not None:
+            # without a known expiry the token is used until the API rejects it
+            self._current = (access_token, expires_at if expires_at is not None else float('inf'))
+        self._rejected_token: typing.Optional[str] = None
+        self._lock = threading.Lock()
+        # counters have their own lock so reading stats never waits on a refresh
+        self._stats_lock = threading.Lock()
+
+        self._refreshes: int = 0
+        self._shared: int = 0
+        self._rejected: int = 0
+
+    @property
+    def stats(self) -> TokenStats:
+        with self._stats_lock:
+            return TokenStats(refreshes=self._refreshes, shared=self._shared, rejected=self._rejected)
+
+    @property
+    def expires_at(self) -> typing.Optional[float]:
+        current = self._current
+        return current[1] if current is not None else None
+
+    def is_expiring(self) -> bool:
+        """
+        Whether the token is due for a refresh. ``get_token`` only waits for the OAuth endpoint once it has also expired.
+        """
+        current = self._current
+        return current is None or not self._is_fresh(current[1])
+
+    def get_token(self) -> str:
+        """
+        The current access token, refreshed first if it expires within ``refresh_margin`` seconds.
+        """
+        current = self._current
+        if current is not None and self._is_fresh(current[1]):
+            return current[0]
+
+        if current is not None and time.time() < current[1]:
+            # still valid: if another thread is already refreshing, keep using it meanwhile
+            if not self._lock.acquire(blocking=False):
+                return current[0]
+        else:
+            self._lock.acquire()
+
+        try:
+            # another thread may have refreshed while this one waited
+            current = self._current
+            if current is None or not self._is_fresh(current[1]):
+                current = self._current = self._refresh()
+            return current[0]
+        finally:
+            self._lock.release()
+
+    def invalidate(self, access_token: str) -> None:
+        """
+        Report that the API rejected ``access_token``. The next ``get_token`` returns another one.
+        """
+        with self._lock:
+            current = self._current
+            if current is not None and current[0] == access_token:
+                with self._stats_lock:
+                    self._rejected += 1
+                self._rejected_token = access_token
+                self._current = (access_token, 0.0)
+
+    def _is_fresh(self, expires_at: float) -> bool:
+        return time.time() < expires_at - self.refresh_margin
+
+    def _refresh(self) -> typing.Tuple[str, float]:
+        with self._file_lock():
+            shared = self._read_file()
+            if shared is not None:
+                self._refresh_token = shared.get('refresh_token') or self._refresh_token
+                access_token, expires_at = shared.get('access_token'), float(shared.get('expires_at') or 0.0)
+                if access_token and access_token != self._rejected_token and self._is_fresh(expires_at):
+                    with self._stats_lock:
+                        self._shared += 1
+                    return access_token, expires_at
+
+            data = helpers.request_access_token(
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+                refresh_token=self._refresh_token
+            )
+            with self._stats_lock:
+                self._refreshes += 1
+            self._refresh_token = data.get('refresh_token') or self._refresh_token
+            current = (data['access_token'], time.time() + float(data.get('expires_in', 1800)))
+
+            self._write_file({'access_token': current[0], 'expires_at': current[1], 'refresh_token': self._refresh_token})
+            return current
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> typing.Iterator[None]:
+        if self.token_file is None or fcntl is None:
+            yield
+            return
+
+        fd = os.open(self.token_file + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # closing the descriptor releases the lock
+            os.close(fd)
+
+    def _read_file(self) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        if self.token_file is None:
+            return None
+        try:
+            with open(self.token_file, 'r') as f:
+                return typing.cast(typing.Dict[str, typing.Any], json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def _write_file(self, data: typing.Dict[str, typing.Any]) -> None:
+        if self.token_file is None:
+            return
+        # written aside and renamed over, so readers never see a partial file
+        tmp_path = f'{self.token_file}.{os.getpid()}.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.token_file)
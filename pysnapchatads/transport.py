@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+import typing
+
+import requests
+import requests.adapters
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+Timeout = typing.Union[None, float, typing.Tuple[typing.Optional[float], typing.Optional[float]]]
+
+class TransportStats(typing.NamedTuple):
+    """
+    Connection pool counters of a TransportAdapter.
+    """
+
+    checkouts: int
+    """Connections taken from a pool, one per request."""
+    pool_hits: int
+    """Checkouts that reused an open keep-alive connection."""
+    new_connections: int
+    """Checkouts that had to open a new connection (TCP + TLS handshake)."""
+    discarded: int
+    """Connections closed on return because the pool was already full."""
+    pool_wait_seconds: float
+    """Total time spent waiting for a connection from a pool."""
+
+
+class _PoolMetrics(object):
+    def __init__(self) -> None:
+        self.checkouts: int = 0
+        self.pool_hits: int = 0
+        self.new_connections: int = 0
+        self.discarded: int = 0
+        self.pool_wait_seconds: float = 0.0
+        self.lock = threading.Lock()
+
+    def snapshot(self) -> TransportStats:
+        with self.lock:
+            return TransportStats(
+                checkouts=self.checkouts,
+                pool_hits=self.pool_hits,
+                new_connections=self.new_connections,
+                discarded=self.discarded,
+                pool_wait_seconds=self.pool_wait_seconds
+            )
+
+
+def _instrumented_pool(
+        base: typing.Type[HTTPConnectionPool],
+        metrics: _PoolMetrics
+) -> typing.Type[HTTPConnectionPool]:
+    """
+    Subclass a urllib3 connection pool so checkouts and returns are recorded in ``metrics``.
+    """
+
+    class InstrumentedPool(base): # type: ignore
+        def _get_conn(self, timeout: typing.Optional[float] = None) -> typing.Any:
+            started = time.perf_counter()
+            conn = super(InstrumentedPool, self)._get_conn(timeout=timeout)
+            waited = time.perf_counter() - started
+
+            # fresh and dropped connections have no socket until they (re)connect
+            reused = getattr(conn, 'sock', None) is not None
+            with metrics.lock:
+                metrics.checkouts += 1
+                metrics.pool_wait_seconds += waited
+                if reused:
+                    metrics.pool_hits += 1
+                else:
+                    metrics.new_connections += 1
+
+            return conn
+
+        def _put_conn(self, conn: typing.Any) -> None:
+            if self.pool is not None and self.pool.full():
+                with metrics.lock:
+                    metrics.discarded += 1
+
+            super(InstrumentedPool, self)._put_conn(conn)
+
+    InstrumentedPool.__name__ = f'Instrumented{base.__name__}'
+    return InstrumentedPool
+
+
+class TransportAdapter(requests.adapters.HTTPAdapter):
+    """
+    HTTP adapter with tunable pool sizing, default timeouts, keep-alive control
+    and connection pool metrics.
+
+    :param pool_connections: Number of per-host pools to cache.
+    :param pool_maxsize: Connections kept open per host; size it to the client's concurrency.
+    :param pool_block: Wait for a free connection instead of opening (and later discarding) extra ones.
+    :param connect_timeout: Default connect timeout in seconds, used when a request does not set one.
+    :param read_timeout: Default read timeout in seconds, used when a request does not set one.
+    :param keep_alive: Reuse connections between requests. When False every request asks for ``Connection: close``.
+    :param tcp_keepalive: Enable TCP keep-alive probes so idle pooled connections are not silently dropped.
+    """
+
+    __attrs__ = requests.adapters.HTTPAdapter.__attrs__ + ['connect_timeout', 'read_timeout', 'keep_alive', 'tcp_keepalive']
+
+    def __init__(
+            self,
+            pool_connections: int = requests.adapters.DEFAULT_POOLSIZE,
+            pool_maxsize: int = requests.adapters.DEFAULT_POOLSIZE,
+            pool_block: bool = False,
+            connect_timeout: typing.Optional[float] = None,
+            read_timeout: typing.Optional[float] = None,
+            keep_alive: bool = True,
+            tcp_keepalive: bool = False,
+            max_retries: int = 0
+    ) -> None:
+        self.connect_timeout: typing.Optional[float] = connect_timeout
+        self.read_timeout: typing.Optional[float] = read_timeout
+        self.keep_alive: bool = keep_alive
+        self.tcp_keepalive: bool = tcp_keepalive
+        self._metrics = _PoolMetrics()
+
+        super(TransportAdapter, self).__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries
+        )
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        self._metrics = _PoolMetrics()
+        super(TransportAdapter, self).__setstate__(state)
+
+    @property
+    def stats(self) -> TransportStats:
+        return self._metrics.snapshot()
+
+    @property
+    def default_timeout(self) -> Timeout:
+        if self.connect_timeout is None and self.read_timeout is None:
+            return None
+        return (self.connect_timeout, self.read_timeout)
+
+    def init_poolmanager(
+            self,
+            connections: int,
+            maxsize: int,
+            block: bool = requests.adapters.DEFAULT_POOLBLOCK,
+            **pool_kwargs: typing.Any
+    ) -> None:
+        if self.tcp_keepalive:
+            pool_kwargs.setdefault(
+                'socket_options',
+                HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            )
+
+        super(TransportAdapter, self).init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _instrumented_pool(HTTPConnectionPool, self._metrics),
+            'https': _instrumented_pool(HTTPSConnectionPool, self._metrics)
+        }
+
+    def send(
+            self,
+            request: requests.PreparedRequest,
+            stream: bool = False,
+            timeout: Timeout = None,
+            **kwargs: typing.Any
+    ) -> requests.Response:
+        if timeout is None:
+            timeout = self.default_timeout
+        if not self.keep_alive:
+            request.headers['Connection'] = 'close'
+
+        return super(TransportAdapter, self).send(request, stream=stream, timeout=timeout, **kwargs)
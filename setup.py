@@ -33,6 +33,13 @@ with open('README.rst') as f:
     readme = f.read()
 
 extras_require = {
+    'columnar': [
+        'numpy'
+    ],
+    'parquet': [
+        'numpy',
+        'pyarrow'
+    ],
     'docs': [
         'sphinx==4.4.0',
         'sphinxcontrib_trio',
@@ -46,8 +53,10 @@ extras_require = {
         'pytest-cov',
         'typing-extensions>=4.3.0',
         'requests_mock',
+        'aioresponses',
         'typeguard',
-        'python-dateutil'
+        'python-dateutil',
+        'numpy'
     ]
 }
 
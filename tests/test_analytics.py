@@ -0,0 +1,135 @@
+import time
+import numpy as np
+import pytest
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.errors import StatsError
+from pysnapchatads.objects.campaigns import Campaign
+from pysnapchatads.objects.ads import Ad
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+# Tests that daily stats with an ad squad breakdown decode into timestamp and metric arrays.
+def test_get_stats_daily_breakdown(requests_mock: requests_mock.Mocker) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    campaign = Campaign(api_client=client, id='c1')
+
+    def day(date: str, impressions: int, spend: int) -> dict:
+        return {'start_time': f'{date}T00:00:00.000-08:00', 'end_time': f'{date}T23:59:59.000-08:00', 'stats': {'impressions': impressions, 'spend': spend}}
+
+    requests_mock.get(f'{BASE}/campaigns/c1/stats', json={'request_status': 'SUCCESS', 'timeseries_stats': [{
+        'sub_request_status': 'SUCCESS',
+        'timeseries_stat': {
+            'id': 'c1', 'type': 'CAMPAIGN', 'granularity': 'DAY',
+            'timeseries': [day('2023-01-01', 10, 100), day('2023-01-02', 20, 250)],
+            'breakdown_stats': {'adsquad': [
+                {'id': 's1', 'type': 'AD_SQUAD', 'granularity': 'DAY', 'timeseries': [day('2023-01-01', 10, 100), {'start_time': '2023-01-02T00:00:00.000-08:00', 'stats': {'impressions': 20}}]}
+            ]}
+        }
+    }]})
+
+    stats = campaign.get_stats(fields=['impressions', 'spend'], granularity='day', start_time='2023-01-01', end_time='2023-01-03', breakdown='adsquad')
+
+    url = requests_mock.last_request.url
+    assert 'granularity=DAY' in url
+    assert 'fields=impressions%2Cspend' in url
+    assert 'breakdown=adsquad' in url
+
+    series = stats.series
+    assert (series.id, series.granularity, len(series)) == ('c1', 'DAY', 2)
+    assert series['impressions'].dtype == np.int64
+    assert series['spend'].tolist() == [100, 250]
+    assert str(series.start_time[0]) == '2023-01-01T08:00:00.000000'
+
+    squad = stats.breakdown['s1']
+    assert squad['spend'].mask.tolist() == [False, True]
+    assert squad['impressions'].sum() == 30
+
+
+# Tests that totals decode to a single interval and that failures and invalid options raise.
+def test_get_stats_total_and_errors(requests_mock: requests_mock.Mocker) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    ad = Ad(api_client=client, id='ad1')
+
+    requests_mock.get(f'{BASE}/ads/ad1/stats', json={'total_stats': [{
+        'sub_request_status': 'SUCCESS',
+        'total_stat': {'id': 'ad1', 'type': 'AD', 'granularity': 'TOTAL', 'start_time': '2023-01-01T00:00:00.000Z', 'end_time': '2023-01-02T00:00:00.000Z', 'stats': {'impressions': 5, 'screen_time_millis': 1.5}}
+    }]})
+    total = ad.get_stats(fields=['impressions', 'screen_time_millis']).series
+    assert len(total) == 1
+    assert total['screen_time_millis'].dtype == np.float64
+
+    with pytest.raises(ValueError):
+        ad.get_stats(breakdown='adsquad')
+    with pytest.raises(ValueError):
+        ad.get_stats(granularity='WEEK')
+
+    requests_mock.get(f'{BASE}/ads/ad1/stats', json={'total_stats': [{'sub_request_status': 'ERROR', 'sub_request_error_reason': 'bad field'}]})
+    with pytest.raises(StatsError, match='bad field'):
+        ad.get_stats()
+
+    requests_mock.get(f'{BASE}/ads/ad1/stats', json={'request_status': 'SUCCESS', 'total_stats': []})
+    with pytest.raises(StatsError, match='no stats returned'):
+        ad.get_stats()
+
+
+# Tests that long ranges split into aligned windows in the account timezone, fetched and stitched in order.
+def test_get_stats_windows_long_ranges(requests_mock: requests_mock.Mocker) -> None:
+    import datetime as dt
+    from urllib.parse import parse_qs, urlparse
+    from dateutil import parser as dateparser
+    from pysnapchatads.objects.ad_accounts import AdAccount
+    from pysnapchatads.reporting.analytics import stats_windows
+
+    hourly = stats_windows('2023-01-01', '2024-02-01', 'HOUR', 'America/Los_Angeles')
+    assert len(hourly) == 57
+    assert all(a[1] == b[0] for a, b in zip(hourly, hourly[1:]))
+    # windows start at local midnight on both sides of the March DST change
+    assert {w[0].isoformat()[10:] for w in hourly} == {'T00:00:00-08:00', 'T00:00:00-07:00'}
+    assert stats_windows('2023-01-01T10:30:00Z', '2023-01-02T00:10:00Z', 'DAY', 'UTC') == [
+        (dt.datetime(2023, 1, 1, tzinfo=dt.timezone.utc), dt.datetime(2023, 1, 3, tzinfo=dt.timezone.utc))
+    ]
+    assert stats_windows('2023-01-01', '2023-01-02', 'DAY') == stats_windows('2023-01-01', '2023-01-02', 'DAY', dt.timezone.utc)
+    # a misspelt timezone is an error, not silently UTC
+    with pytest.raises(ValueError, match='America/Los_Angles is not a known timezone'):
+        stats_windows('2023-01-01', '2023-01-02', 'DAY', 'America/Los_Angles')
+
+    client = SnapchatMarketing(access_token='test_token')
+    account = AdAccount(api_client=client, id='a1', timezone='America/Los_Angeles')
+
+    def stats(request, context) -> dict:
+        query = parse_qs(urlparse(request.url).query)
+        start = dateparser.parse(query['start_time'][0])
+        days = [start + dt.timedelta(days=i) for i in range(2)]
+        return {'timeseries_stats': [{'sub_request_status': 'SUCCESS', 'timeseries_stat': {
+            'id': 'a1', 'granularity': 'DAY',
+            'timeseries': [{'start_time': d.isoformat(), 'end_time': (d + dt.timedelta(days=1)).isoformat(), 'stats': {'spend': d.day}} for d in days]
+        }}]}
+
+    in_flight, overlapped = [0], [False]
+
+    def sequential_stats(request, context) -> dict:
+        in_flight[0] += 1
+        overlapped[0] |= in_flight[0] > 1
+        time.sleep(0.01)
+        in_flight[0] -= 1
+        return stats(request, context)
+
+    requests_mock.get(f'{BASE}/adaccounts/a1/stats', json=sequential_stats)
+    result = account.get_stats(fields=['spend'], granularity='DAY', start_time='2023-01-01', end_time='2023-04-01').series
+
+    assert requests_mock.call_count == 3
+    # without a scheduler on the client the windows are fetched one at a time
+    assert not overlapped[0]
+    assert all('T00%3A00%3A00-0' in r.url for r in requests_mock.request_history)
+    assert len(result) == 6
+    assert (np.diff(result.start_time.astype('int64')) > 0).all()
+    assert result['spend'].tolist() == [1, 2, 1, 2, 4, 5]  # windows start Jan 1, Feb 1 and Mar 4
+
+    # with a scheduler, windows are fetched concurrently up to its concurrency limit
+    from pysnapchatads.scheduler import RequestScheduler
+    requests_mock.get(f'{BASE}/adaccounts/a1/stats', json=stats)
+    scheduled = AdAccount(api_client=SnapchatMarketing(access_token='test_token', scheduler=RequestScheduler(initial_concurrency=2)), id='a1', timezone='America/Los_Angeles')
+    assert scheduled.get_stats(fields=['spend'], granularity='DAY', start_time='2023-01-01', end_time='2023-04-01').series['spend'].tolist() == [1, 2, 1, 2, 4, 5]
@@ -5,6 +5,7 @@ import requests
 
 from pysnapchatads.snapchat import SnapchatMarketing
 from pysnapchatads.objects.user import User
+import pysnapchatads.errors as errors
 import typing
 
 # Tests that the method returns a User object. 
@@ -39,4 +40,47 @@ def test_list_organizations(request_mock: requests_mock.Mocker) -> None:
     # Happy path test
     api_client = SnapchatMarketing(access_token='test_token')
 
-    mock_data = {}
\ No newline at end of file
+    mock_data = {}
+
+# Tests that entities are streamed page by page and pagination errors surface mid-stream.
+def test_iter_many_entities_streams_pages(requests_mock: requests_mock.Mocker) -> None:
+    api_client = SnapchatMarketing(access_token='test_token')
+    requests_mock.get(
+        'https://adsapi.snapchat.com/v1/adaccounts/a1/campaigns',
+        json={'campaigns': [{'sub_request_status': 'SUCCESS', 'campaign': {'id': 'c1'}}, {'sub_request_status': 'SUCCESS', 'campaign': {'id': 'c2'}}], 'paging': {'next_link': 'https://adsapi.snapchat.com/v1/page2'}}
+    )
+    requests_mock.get('https://adsapi.snapchat.com/v1/page2', status_code=500)
+
+    stream = api_client._iter_many_entities('adaccounts', 'a1', 'campaigns', limit=2)
+
+    assert next(stream)['id'] == 'c1'
+    assert next(stream)['id'] == 'c2'
+    # the second page has not been requested yet
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.qs == {'limit': ['2']}
+
+    with pytest.raises(errors.PaginationError):
+        next(stream)
+
+
+# Tests that read-ahead pagination yields every page in order and still raises PaginationError.
+def test_iter_pages_with_prefetch(requests_mock: requests_mock.Mocker) -> None:
+    api_client = SnapchatMarketing(access_token='test_token', prefetch_pages=2)
+    requests_mock.get(
+        'https://adsapi.snapchat.com/v1/campaigns/c1/adsquads',
+        json={'adsquads': [{'sub_request_status': 'SUCCESS', 'adsquad': {'id': 's1'}}], 'paging': {'next_link': 'https://adsapi.snapchat.com/v1/page2'}}
+    )
+    requests_mock.get(
+        'https://adsapi.snapchat.com/v1/page2',
+        json={'adsquads': [{'sub_request_status': 'SUCCESS', 'adsquad': {'id': 's2'}}], 'paging': {'next_link': 'https://adsapi.snapchat.com/v1/page3'}}
+    )
+    requests_mock.get('https://adsapi.snapchat.com/v1/page3', json={'adsquads': [{'sub_request_status': 'SUCCESS', 'adsquad': {'id': 's3'}}], 'paging': {}})
+
+    pages = list(api_client._iter_pages('campaigns', 'c1', 'adsquads'))
+
+    assert [[x['id'] for x in page] for page in pages] == [['s1'], ['s2'], ['s3']]
+
+    requests_mock.get('https://adsapi.snapchat.com/v1/page3', status_code=503)
+
+    with pytest.raises(errors.PaginationError):
+        list(api_client._iter_pages('campaigns', 'c1', 'adsquads', prefetch=1))
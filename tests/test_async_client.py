@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+from aioresponses import aioresponses
+
+from pysnapchatads.async_snapchat import AsyncSnapchatMarketing
+from pysnapchatads.objects.ad_accounts import AdAccount
+from pysnapchatads.objects.campaigns import Campaign
+import pysnapchatads.errors as errors
+
+
+def test_get_authenticated_user_async() -> None:
+    mock_response = {
+        'me':
+                {
+                    'id': '123',
+                    'updated_at': '2022-01-01T00:00:00.000Z',
+                    'created_at': '2022-01-01T00:00:00.000Z',
+                    'email': 'test@test.com',
+                    'organization_id': '456',
+                    'display_name': 'Test User',
+                    'member_status': 'ACTIVE'
+                }
+        }
+
+    async def run():
+        with aioresponses() as m:
+            m.get('https://adsapi.snapchat.com/v1/me', payload=mock_response)
+            async with AsyncSnapchatMarketing(access_token='test_token') as api_client:
+                return await api_client.get_authenticated_user()
+
+    user = asyncio.run(run())
+
+    assert user.id == '123'
+    assert user.email == 'test@test.com'
+
+
+def test_list_campaigns_async_concurrently() -> None:
+    async def run():
+        with aioresponses() as m:
+            for account_id in ('a1', 'a2'):
+                m.get(
+                    f'https://adsapi.snapchat.com/v1/adaccounts/{account_id}/campaigns?read_deleted_entities=true',
+                    payload={'campaigns': [{'sub_request_status': 'SUCCESS', 'campaign': {'id': f'{account_id}-c1', 'ad_account_id': account_id, 'name': 'c'}}]}
+                )
+            async with AsyncSnapchatMarketing(access_token='test_token', max_concurrency=2) as api_client:
+                accounts = [AdAccount(api_client=api_client, id=a) for a in ('a1', 'a2')] # type: ignore
+                return await asyncio.gather(*(a.list_campaigns_async() for a in accounts))
+
+    results = asyncio.run(run())
+
+    assert [[c.id for c in r] for r in results] == [['a1-c1'], ['a2-c1']]
+    assert all(isinstance(c, Campaign) for r in results for c in r)
+
+
+def test_async_paginator_raises_pagination_error() -> None:
+    async def run():
+        with aioresponses() as m:
+            m.get(
+                'https://adsapi.snapchat.com/v1/adaccounts/a1/campaigns?limit=1',
+                payload={'campaigns': [{'sub_request_status': 'SUCCESS', 'campaign': {'id': 'c1'}}], 'paging': {'next_link': 'https://adsapi.snapchat.com/v1/page2'}}
+            )
+            m.get('https://adsapi.snapchat.com/v1/page2', status=500)
+            async with AsyncSnapchatMarketing(access_token='test_token') as api_client:
+                return await api_client._get_many_entities('adaccounts', 'a1', 'campaigns', limit=1)
+
+    with pytest.raises(errors.PaginationError):
+        asyncio.run(run())
+
+
+# Tests that a listing failing mid-stream keeps the link to resume from and the entities fetched so far.
+def test_async_paginator_error_keeps_partial_results() -> None:
+    async def run():
+        with aioresponses() as m:
+            m.get(
+                'https://adsapi.snapchat.com/v1/adaccounts/a1/campaigns?limit=1',
+                payload={'campaigns': [{'sub_request_status': 'SUCCESS', 'campaign': {'id': 'c1'}}], 'paging': {'next_link': 'https://adsapi.snapchat.com/v1/page2'}}
+            )
+            m.get(
+                'https://adsapi.snapchat.com/v1/page2',
+                payload={'campaigns': [{'id': 'c2'}], 'paging': {'next_link': 'https://adsapi.snapchat.com/v1/page3'}}
+            )
+            m.get('https://adsapi.snapchat.com/v1/page3', status=503)
+            async with AsyncSnapchatMarketing(access_token='test_token') as api_client:
+                return await api_client._get_many_entities('adaccounts', 'a1', 'campaigns', limit=1)
+
+    with pytest.raises(errors.PaginationError) as raised:
+        asyncio.run(run())
+
+    assert raised.value.status_code == 503
+    assert raised.value.next_link == 'https://adsapi.snapchat.com/v1/page3'
+    assert raised.value.results == [{'id': 'c1'}, {'id': 'c2'}]
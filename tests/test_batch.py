@@ -0,0 +1,72 @@
+import json
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.objects.ad_squads import AdSquad
+from pysnapchatads.objects.campaigns import Campaign
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+def squad(client: SnapchatMarketing, id: str, campaign_id: str) -> AdSquad:
+    return AdSquad.from_json(client, {'id': id, 'campaign_id': campaign_id, 'name': id, 'bid_micro': 100, 'status': 'ACTIVE'})
+
+
+# Tests that changes made in a batch are sent as one minimal bulk request per parent, dropping no-ops.
+def test_batch_groups_minimal_updates_by_parent(requests_mock: requests_mock.Mocker) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    requests_mock.put(f'{BASE}/campaigns/c1/adsquads', json={'adsquads': []})
+    requests_mock.put(f'{BASE}/campaigns/c2/adsquads', json={'adsquads': []})
+    requests_mock.delete(f'{BASE}/adsquads/s5', json={})
+
+    squads = [squad(client, f's{i}', 'c1' if i < 3 else 'c2') for i in range(6)]
+
+    with client.batch() as b:
+        for s in squads[:4]:
+            s.bid_micro = 200
+        squads[1].bid_micro = 100  # back to the original value: no-op
+        squads[4].update(name='renamed')
+        squads[5].bid_micro = 300
+        client._delete_entity('adsquads', 's5')
+        assert requests_mock.call_count == 0
+
+    bodies = {r.url: json.loads(r.body) for r in requests_mock.request_history if r.method == 'PUT'}
+    assert bodies[f'{BASE}/campaigns/c1/adsquads'] == [
+        {'id': 's0', 'campaign_id': 'c1', 'bid_micro': 200},
+        {'id': 's2', 'campaign_id': 'c1', 'bid_micro': 200}
+    ]
+    assert bodies[f'{BASE}/campaigns/c2/adsquads'] == [
+        {'id': 's3', 'campaign_id': 'c2', 'bid_micro': 200},
+        {'id': 's4', 'campaign_id': 'c2', 'name': 'renamed'}
+    ]
+    assert [r.method for r in requests_mock.request_history].count('DELETE') == 1
+    assert requests_mock.call_count == 3
+
+    # flushed entities are clean again
+    with client.batch():
+        pass
+    assert requests_mock.call_count == 3
+
+
+def test_batch_creates_and_discards_on_error(requests_mock: requests_mock.Mocker) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    requests_mock.post(f'{BASE}/adaccounts/a1/campaigns', json=lambda request, context: {
+        'campaigns': [{'sub_request_status': 'SUCCESS', 'campaign': {'id': f'c{i}', **item}} for i, item in enumerate(json.loads(request.body))]
+    })
+
+    campaign = Campaign.from_json(client, {'id': 'c9', 'ad_account_id': 'a1', 'name': 'old'})
+    try:
+        with client.batch():
+            campaign.name = 'new'
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert requests_mock.call_count == 0
+
+    with client.batch() as b:
+        first = b.create('adaccounts', 'a1', 'campaigns', {'name': 'x'})
+        second = b.create('adaccounts', 'a1', 'campaigns', {'name': 'y'})
+
+    assert requests_mock.call_count == 1
+    assert b.created[first]['campaign']['name'] == 'x'
+    assert b.created[second]['campaign']['id'] == 'c1'
@@ -0,0 +1,83 @@
+import collections
+import json
+import pytest
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.errors import BulkCreateError
+from pysnapchatads.objects.campaigns import Campaign
+from pysnapchatads.objects.ad_squads import AdSquad
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+def echo(fail_names=(), failures=1):
+    """Respond to a bulk create like the API: one sub request per item, failing items in fail_names ``failures`` times."""
+    failed = collections.Counter()
+
+    def callback(request, context):
+        items = []
+        for item in json.loads(request.body):
+            if item['name'] in fail_names and failed[item['name']] < failures:
+                failed[item['name']] += 1
+                items.append({'sub_request_status': 'ERROR', 'sub_request_error_reason': 'try again', 'adsquad': item})
+            else:
+                items.append({'sub_request_status': 'SUCCESS', 'adsquad': {'id': f"id-{item['name']}", **item}})
+        if any(item['sub_request_status'] == 'ERROR' for item in items):
+            context.status_code = 400
+        return {'request_status': 'PARTIAL', 'adsquads': items}
+
+    return callback
+
+
+# Tests that large lists are chunked per parent, results come back in input order and only failed items are retried.
+def test_bulk_create_chunks_and_retries_failed_items(requests_mock: requests_mock.Mocker) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    requests_mock.post(f'{BASE}/campaigns/c1/adsquads', json=echo(fail_names={'s3'}))
+    requests_mock.post(f'{BASE}/campaigns/c2/adsquads', json=echo())
+
+    data = [{'name': f's{i}', 'campaign_id': 'c1' if i % 2 else 'c2'} for i in range(10)]
+    created = client._bulk_create_entities('campaigns', 'adsquads', data, batch_size=2)
+
+    assert [c['adsquad']['name'] for c in created] == [d['name'] for d in data]
+    # 3 batches per parent, then one retry of the failed item
+    assert requests_mock.call_count == 7
+    assert json.loads(requests_mock.last_request.body) == [{'name': 's3', 'campaign_id': 'c1'}]
+
+
+def test_bulk_create_reports_items_that_keep_failing(requests_mock: requests_mock.Mocker) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    requests_mock.post(f'{BASE}/campaigns/c1/adsquads', json=echo(fail_names={'bad'}, failures=2))
+
+    campaign = Campaign(api_client=client, id='c1')
+    with pytest.raises(BulkCreateError) as e:
+        campaign.create_ad_squads([{'name': 'ok'}, {'name': 'bad'}])
+
+    assert [(f.index, f.reason) for f in e.value.failures] == [(1, 'try again')]
+    assert e.value.results[0]['adsquad']['id'] == 'id-ok'
+    assert e.value.results[1] is None
+    assert requests_mock.call_count == 2
+
+    requests_mock.post(f'{BASE}/campaigns/c1/adsquads', json=echo())
+    squads = campaign.create_ad_squads([{'name': 'a'}, {'name': 'b'}])
+    assert [s.id for s in squads] == ['id-a', 'id-b']
+    assert isinstance(squads[0], AdSquad)
+
+
+# Tests that ad accounts created in bulk come back out of their sub request envelopes.
+def test_create_ad_accounts_unwraps_results(requests_mock: requests_mock.Mocker) -> None:
+    from pysnapchatads.objects.organizations import Organization
+
+    client = SnapchatMarketing(access_token='test_token')
+    requests_mock.post(f'{BASE}/organizations/o1/adaccounts', json={
+        'request_status': 'SUCCESS',
+        'adaccounts': [{'sub_request_status': 'SUCCESS', 'adaccount': {'id': 'a1', 'name': 'A', 'type': 'PARTNER'}}]
+    })
+    organization = Organization.from_json(client, {'organization': {
+        'id': 'o1', 'updated_at': None, 'created_at': None, 'name': 'O', 'address_line_1': '', 'locality': '',
+        'administration_district_level_1': '', 'country': 'US', 'postal_code': '', 'type': 'ENTERPRISE'
+    }})
+
+    accounts = organization.create_ad_accounts(json_lists=[{'name': 'A', 'type': 'PARTNER'}])
+
+    assert [(a.id, a.name, a.account_type) for a in accounts] == [('a1', 'A', 'PARTNER')]
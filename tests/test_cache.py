@@ -0,0 +1,89 @@
+import time
+import pytest
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.cache import EntityCache, entity_ids
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+# Tests that repeated reads are served from the cache until an update invalidates them.
+def test_single_entity_reads_are_cached_and_invalidated(requests_mock: requests_mock.Mocker) -> None:
+    api_client = SnapchatMarketing(access_token='test_token', cache=EntityCache(ttl=60))
+    requests_mock.get(f'{BASE}/campaigns/c1', json={'campaigns': [{'id': 'c1', 'name': 'old'}]})
+    requests_mock.put(f'{BASE}/adaccounts/a1/campaigns', json={'campaigns': [{'id': 'c1', 'name': 'new'}]})
+
+    first = api_client._get_single_entity('campaigns', 'c1')
+    first[0]['name'] = 'mutated by caller'
+    hit = api_client._get_single_entity('campaigns', 'c1')
+    assert hit == [{'id': 'c1', 'name': 'old'}]
+    hit[0]['name'] = 'mutated by caller'
+    assert api_client._get_single_entity('campaigns', 'c1') == [{'id': 'c1', 'name': 'old'}]
+    assert requests_mock.call_count == 1
+
+    api_client._update_entities('adaccounts', 'a1', 'campaigns', data=[{'id': 'c1', 'name': 'new'}])
+    api_client._get_single_entity('campaigns', 'c1')
+
+    stats = api_client.cache.stats
+    assert (stats.hits, stats.misses, stats.invalidations) == (2, 2, 1)
+
+
+def test_lru_eviction() -> None:
+    cache = EntityCache(max_size=2)
+    for entity_id in ('1', '2', '3'):
+        cache.get_or_load(('adaccounts', entity_id), lambda: {'id': entity_id})
+
+    assert cache.stats.evictions == 1
+    assert cache.get_or_load(('adaccounts', '1'), lambda: 'reloaded') == 'reloaded'
+
+
+def test_stale_while_revalidate_refreshes_in_background() -> None:
+    cache = EntityCache(ttl=0, stale_while_revalidate=60)
+    cache.get_or_load(('organizations', 'o1'), lambda: 'v1')
+
+    assert cache.get_or_load(('organizations', 'o1'), lambda: 'v2') == 'v1'
+
+    deadline = time.monotonic() + 2
+    while cache.stats.refreshes and cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get_or_load(('organizations', 'o1'), lambda: 'v3') == 'v2'
+    assert cache.stats.stale_hits == 2
+
+
+def test_invalidation_discards_racing_load() -> None:
+    cache = EntityCache()
+
+    def loader():
+        cache.invalidate(('campaigns', 'c1'))
+        return 'loaded before the write'
+
+    cache.get_or_load(('campaigns', 'c1'), loader)
+    assert cache.stats.size == 0
+
+
+# Tests that writes to ids that are not cached, failed loads and evictions leave no bookkeeping behind.
+def test_generations_stay_bounded() -> None:
+    cache = EntityCache(max_size=10)
+    for i in range(10_000):
+        cache.invalidate(('campaigns', str(i)))
+    assert len(cache._generations) == 0
+
+    for i in range(1_000):
+        cache.get_or_load(('campaigns', str(i)), lambda: {'id': str(i)})
+        cache.put(('ads', str(i)), {'id': str(i)})
+    assert cache.stats.size == 10
+    assert len(cache._generations) == 10 and not cache._loading
+
+    def fail():
+        raise ConnectionError
+    with pytest.raises(ConnectionError):
+        cache.get_or_load(('campaigns', 'missing'), fail)
+    assert len(cache._generations) == 10 and not cache._loading
+
+    cache.clear()
+    assert len(cache._generations) == 0
+
+
+def test_entity_ids_unwraps_items() -> None:
+    assert entity_ids([{'id': 'a'}, {'sub_request_status': 'SUCCESS', 'campaign': {'id': 'b'}}, {'sub_request_status': 'ERROR'}, 'x']) == ['a', 'b']
@@ -0,0 +1,63 @@
+import asyncio
+import threading
+import time
+from aioresponses import aioresponses
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.async_snapchat import AsyncSnapchatMarketing
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+# Tests that threads reading the same listing while it is in flight share one request and its result.
+def test_concurrent_identical_gets_share_one_request(requests_mock) -> None:
+    client = SnapchatMarketing(access_token='test_token', coalesce_requests=True)
+    started, release = threading.Event(), threading.Event()
+
+    def respond(request, context):
+        started.set()
+        release.wait(5)
+        return {'campaigns': [{'id': 'c1'}]}
+
+    listing = requests_mock.get(f'{BASE}/adaccounts/a1/campaigns', json=respond)
+    results = []
+
+    def read() -> None:
+        results.append(client._get_many_entities('adaccounts', 'a1', 'campaigns', read_deleted_entities=True))
+
+    threads = [threading.Thread(target=read)]
+    threads[0].start()
+    started.wait(5)
+    threads += [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads[1:]:
+        thread.start()
+    while client.single_flight.stats.coalesced < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert listing.call_count == 1
+    assert all(r is results[0] for r in results) and results[0] == [{'id': 'c1'}]
+    assert client.single_flight.stats == (5, 4, 0)
+
+    # nothing is kept once the request is done, and other params are another request
+    client._get_many_entities('adaccounts', 'a1', 'campaigns', read_deleted_entities=True)
+    client._get_many_entities('adaccounts', 'a1', 'campaigns', read_deleted_entities=False)
+    assert listing.call_count == 3
+
+
+# Tests that concurrent tasks reading the same entity share one request.
+def test_async_concurrent_identical_gets_share_one_request() -> None:
+    async def run():
+        with aioresponses() as m:
+            # registered once: a second request would fail
+            m.get(f'{BASE}/adaccounts/a1', payload={'adaccounts': [{'adaccount': {'id': 'a1', 'name': 'x'}}]})
+            async with AsyncSnapchatMarketing(access_token='test_token', coalesce_requests=True) as api_client:
+                accounts = await asyncio.gather(*(api_client.get_single_ad_account('a1') for _ in range(3)))
+                return accounts, api_client.single_flight.stats
+
+    accounts, stats = asyncio.run(run())
+
+    assert [a.name for a in accounts] == ['x'] * 3
+    assert stats.coalesced == 2 and stats.in_flight == 0
@@ -0,0 +1,47 @@
+import datetime as dt
+import types
+import pytest
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads import codec as codecs
+
+
+@pytest.mark.parametrize('name', sorted(codecs.CODECS))
+def test_codec_round_trip(name: str) -> None:
+    json_codec = codecs.get_codec(name)
+    body = {
+        'start_time': dt.datetime(2023, 1, 2, 3, 4, 5),
+        'regulations': types.MappingProxyType({'restricted_delivery_signals': True}),
+        'name': 'café'
+    }
+
+    assert json_codec.loads(json_codec.dumps(body)) == {
+        'start_time': '2023-01-02T03:04:05',
+        'regulations': {'restricted_delivery_signals': True},
+        'name': 'café'
+    }
+
+
+# Tests that the default codec is orjson or the standard library, with ujson available only by name.
+def test_get_codec_prefers_fastest_and_rejects_unknown() -> None:
+    assert codecs.get_codec().name == ('orjson' if 'orjson' in codecs.CODECS else 'json')
+    if 'ujson' in codecs.CODECS:
+        assert codecs.get_codec('ujson').name == 'ujson'
+    with pytest.raises(ValueError):
+        codecs.get_codec('simplejson')
+
+
+# Tests that bulk bodies are encoded and responses decoded through the client's codec.
+def test_client_uses_codec(requests_mock: requests_mock.Mocker) -> None:
+    api_client = SnapchatMarketing(access_token='test_token', codec=codecs.get_codec('json'))
+    requests_mock.put(
+        'https://adsapi.snapchat.com/v1/adaccounts/a1/campaigns',
+        json={'campaigns': [{'id': 'c1'}]}
+    )
+
+    result = api_client._update_entities('adaccounts', 'a1', 'campaigns', data=[{'id': 'c1', 'end_time': dt.date(2023, 1, 1)}])
+
+    assert result == [{'id': 'c1'}]
+    assert requests_mock.last_request.body == b'[{"id":"c1","end_time":"2023-01-01"}]'
+    assert requests_mock.last_request.headers['Content-Type'] == 'application/json'
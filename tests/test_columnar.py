@@ -0,0 +1,68 @@
+import numpy as np
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.objects.ad_accounts import AdAccount
+from pysnapchatads.objects.ad_squads import AdSquad
+from pysnapchatads.objects.campaigns import Campaign
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+# Tests that a paged ad squad listing becomes typed, masked columns with category codes stable across pages.
+def test_list_ad_squads_columnar(requests_mock: requests_mock.Mocker) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    account = AdAccount(api_client=client, id='a1')
+
+    requests_mock.get(f'{BASE}/adaccounts/a1/adsquads', json={'adsquads': [
+        {'sub_request_status': 'SUCCESS', 'adsquad': {'id': 's1', 'status': 'ACTIVE', 'bid_micro': 1000000, 'daily_budget_micro': 5000000, 'type': 'SNAP_ADS', 'start_time': '2023-01-01T00:00:00.000Z'}},
+        {'sub_request_status': 'SUCCESS', 'adsquad': {'id': 's2', 'status': 'PAUSED', 'bid_micro': '2000000', 'lifetime_budget_micro': 9000000}}
+    ], 'paging': {'next_link': f'{BASE}/page2'}})
+    requests_mock.get(f'{BASE}/page2', json={'adsquads': [
+        {'id': 's3', 'status': 'ACTIVE', 'bid_micro': 3000000, 'deleted': True, 'start_time': '2023-01-02T01:00:00-01:00'}
+    ], 'paging': {}})
+
+    columns = account.list_ad_squads_columnar(fields=['id', 'status', 'bid_micro', 'daily_budget_micro', 'adsquad_type', 'start_time', 'deleted'])
+
+    assert len(columns) == 3
+    assert columns['id'].tolist() == ['s1', 's2', 's3']
+    assert columns['bid_micro'].dtype == np.int64
+    assert columns['bid_micro'].sum() == 6000000
+    assert columns['daily_budget_micro'].mask.tolist() == [False, True, True]
+    assert columns['status'].tolist() == [0, 1, 0]
+    assert columns.categories['status'] == ['ACTIVE', 'PAUSED']
+    assert columns.decode('adsquad_type').tolist() == ['SNAP_ADS', None, None]
+    assert columns['start_time'].dtype == np.dtype('datetime64[us]')
+    assert columns['start_time'].mask.tolist() == [False, True, False]
+    assert str(columns['start_time'][2]) == '2023-01-02T02:00:00.000000'
+    assert columns['deleted'].tolist() == [None, None, True]
+
+    pages = list(account.iter_ad_squads_columnar(fields=['status']))
+    assert [len(page) for page in pages] == [2, 1]
+    assert pages[1]['status'].tolist() == [0]
+
+
+# Tests that listings under a campaign and an ad squad are read into columns through the same builder.
+def test_child_listings_columnar(requests_mock: requests_mock.Mocker) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    campaign = Campaign.from_json(client, {'id': 'c1'})
+    squad = AdSquad.from_json(client, {'id': 's1'})
+
+    requests_mock.get(f'{BASE}/campaigns/c1/adsquads', json={'adsquads': [
+        {'sub_request_status': 'SUCCESS', 'adsquad': {'id': 's1', 'status': 'ACTIVE', 'bid_micro': 1000000}},
+        {'sub_request_status': 'SUCCESS', 'adsquad': {'id': 's2', 'status': 'PAUSED'}}
+    ]})
+    requests_mock.get(f'{BASE}/adsquads/s1/ads', json={'ads': [
+        {'sub_request_status': 'SUCCESS', 'ad': {'id': 'ad1', 'status': 'ACTIVE'}}
+    ]})
+
+    squads = campaign.list_ad_squads_columnar(fields=['id', 'status', 'bid_micro'])
+    assert squads['id'].tolist() == ['s1', 's2']
+    assert squads['bid_micro'].mask.tolist() == [False, True]
+    assert requests_mock.request_history[0].qs['limit'] == ['1000']
+    assert [len(page) for page in campaign.iter_ad_squads_columnar(fields=['status'])] == [2]
+
+    ads = squad.list_ads_columnar(fields=['id', 'status'])
+    assert ads['id'].tolist() == ['ad1']
+    assert ads.decode('status').tolist() == ['ACTIVE']
+    assert [len(page) for page in squad.iter_ads_columnar(fields=['id'])] == [1]
@@ -0,0 +1,66 @@
+import pytest
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.crawler import HierarchyCrawler
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+ORGANIZATION = {
+    'id': 'o1',
+    'updated_at': '2022-01-01T00:00:00.000Z',
+    'created_at': '2022-01-01T00:00:00.000Z',
+    'name': 'Org',
+    'address_line_1': '1 Street',
+    'locality': 'LA',
+    'administration_district_level_1': 'CA',
+    'country': 'US',
+    'postal_code': '90000',
+    'type': 'ENTERPRISE',
+    'ad_accounts': [
+        {'id': 'a1', 'organization_id': 'o1', 'name': 'A1', 'type': 'PARTNER'},
+        {'id': 'a2', 'organization_id': 'o1', 'name': 'A2', 'type': 'PARTNER'}
+    ]
+}
+
+
+# Tests that the crawler links every level using one listing per ad account.
+def test_crawl_links_hierarchy(requests_mock: requests_mock.Mocker) -> None:
+    api_client = SnapchatMarketing(access_token='test_token')
+    requests_mock.get(f'{BASE}/me/organizations', json={'organizations': [{'organization': ORGANIZATION}]})
+    for account in ('a1', 'a2'):
+        requests_mock.get(f'{BASE}/adaccounts/{account}/campaigns', json={'campaigns': [{'sub_request_status': 'SUCCESS', 'campaign': {'id': f'{account}-c', 'ad_account_id': account}}]})
+        requests_mock.get(f'{BASE}/adaccounts/{account}/adsquads', json={'adsquads': [{'sub_request_status': 'SUCCESS', 'adsquad': {'id': f'{account}-s', 'campaign_id': f'{account}-c'}}]})
+        requests_mock.get(f'{BASE}/adaccounts/{account}/ads', json={'ads': [{'sub_request_status': 'SUCCESS', 'ad': {'id': f'{account}-ad', 'ad_squad_id': f'{account}-s'}}]})
+
+    progress = []
+    snapshot = HierarchyCrawler(api_client, max_workers=4, on_progress=lambda *args: progress.append(args)).crawl()
+
+    assert [a.id for a in snapshot.ad_accounts_of('o1')] == ['a1', 'a2']
+    assert [c.id for c in snapshot.campaigns_of('a2')] == ['a2-c']
+    assert [s.id for s in snapshot.ad_squads_of('a1-c')] == ['a1-s']
+    assert [ad.id for ad in snapshot.ads_of('a1-s')] == ['a1-ad']
+    assert not snapshot.errors
+    assert set(snapshot.timings) == set(HierarchyCrawler.LEVELS)
+    assert ('ads', 2, 2) in progress
+    # 1 organization listing + 3 levels x 2 accounts
+    assert requests_mock.call_count == 7
+
+
+# Tests that levels below ad accounts are crawled even when ad accounts are not part of the snapshot.
+def test_crawl_without_ad_accounts_level(requests_mock: requests_mock.Mocker) -> None:
+    api_client = SnapchatMarketing(access_token='test_token')
+    requests_mock.get(f'{BASE}/me/organizations', json={'organizations': [{'organization': ORGANIZATION}]})
+    for account in ('a1', 'a2'):
+        requests_mock.get(f'{BASE}/adaccounts/{account}/campaigns', json={'campaigns': [{'sub_request_status': 'SUCCESS', 'campaign': {'id': f'{account}-c', 'ad_account_id': account}}]})
+
+    snapshot = HierarchyCrawler(api_client, levels=('organizations', 'campaigns')).crawl()
+
+    assert not snapshot.ad_accounts
+    assert sorted(snapshot.campaigns) == ['a1-c', 'a2-c']
+    assert [c.id for c in snapshot.campaigns_of('a1')] == ['a1-c']
+
+
+def test_crawler_rejects_unknown_level() -> None:
+    with pytest.raises(ValueError):
+        HierarchyCrawler(SnapchatMarketing(access_token='test_token'), levels=['keywords'])
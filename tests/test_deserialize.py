@@ -0,0 +1,66 @@
+import copy
+import typing
+import pytest
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.base import SnapchatMarketingBase
+from pysnapchatads.objects.ad_accounts import AdAccount
+from pysnapchatads.objects.ad_squads import AdSquad
+
+ROW = {
+    'id': '00000000-0000-0000-0000-000000000000',
+    'updated_at': '2023-01-01T00:00:00.000Z',
+    'created_at': '2023-01-01T00:00:00.000Z',
+    'name': 'Ad Squad',
+    'status': 'ACTIVE',
+    'campaign_id': '11111111-1111-1111-1111-111111111111',
+    'type': 'SNAP_ADS',
+    'targeting': {'geos': [{'country_code': 'us'}]},
+    'placement_v2': {'config': 'AUTOMATIC'},
+    'billing_event': 'IMPRESSION',
+    'bid_micro': 1000000,
+    'daily_budget_micro': 50000000,
+    'optimization_goal': 'IMPRESSIONS',
+    'bid_strategy': 'AUTO_BID',
+    'delivery_constraint': 'DAILY_BUDGET',
+    'pacing_type': 'STANDARD',
+    'start_time': '2023-01-01T00:00:00.000Z'
+}
+
+
+def legacy_from_json(cls: typing.Any, api_client: typing.Any, json_data: typing.Dict[str, typing.Any]) -> typing.Any:
+    """The constructor loop entity classes used before deserializers were compiled."""
+    json_data = dict(json_data)
+    json_data['adsquad_type'] = json_data.pop('type')
+    entity = cls.__new__(cls)
+    SnapchatMarketingBase.__init__(entity)
+    entity.api_client = api_client
+    for k, v in json_data.items():
+        if k not in entity.__class__.__annotations__.keys():
+            raise AttributeError(f'{k} is not a valid attribute for {entity.__class__.__name__}')
+        object.__setattr__(entity, k, v)
+    return entity
+
+
+def test_from_json_does_not_mutate_input() -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    json_data = {'id': 'a1', 'type': 'PARTNER', 'name': 'Account'}
+    original = copy.deepcopy(json_data)
+
+    account = AdAccount.from_json(client, json_data)
+
+    assert json_data == original
+    assert account.account_type == 'PARTNER'
+    with pytest.raises(AttributeError, match='not_a_field is not a valid attribute for AdAccount'):
+        AdAccount.from_json(client, {'id': 'a1', 'not_a_field': 1})
+
+
+# Tests that batch deserialization builds the same entities as the previous per-key setattr loop.
+def test_from_json_many_matches_legacy_constructor() -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    rows = [dict(ROW, id=str(i)) for i in range(100)]
+
+    squads = AdSquad.from_json_many(client, rows)
+    assert [s.id for s in squads[:2]] == ['0', '1']
+    assert squads[0].adsquad_type == 'SNAP_ADS'
+    assert [s.__dict__() for s in squads] == [legacy_from_json(AdSquad, client, row).__dict__() for row in rows]
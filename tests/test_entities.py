@@ -0,0 +1,43 @@
+import json
+import pytest
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.objects.ad_squads import AdSquad
+from pysnapchatads.objects.campaigns import Campaign
+
+
+# Tests that entities are slotted from their annotations and share repeated string values.
+def test_entities_are_compact() -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    rows = json.loads('[{"id": "s1", "campaign_id": "c1", "status": "ACTIVE", "name": "a"}, {"id": "s2", "campaign_id": "c1", "status": "ACTIVE", "name": "b"}]')
+
+    first, second = [AdSquad.from_json(client, row) for row in rows]
+
+    assert 'bid_micro' in AdSquad.__slots__
+    with pytest.raises(AttributeError):
+        first.not_a_field = 1
+    assert first.campaign_id is second.campaign_id
+    assert first.status is second.status
+
+    assert first.__dict__() == {'id': 's1', 'campaign_id': 'c1', 'status': 'ACTIVE', 'name': 'a'}
+    assert hash(first) == hash(AdSquad.from_json(client, {'id': 's1'}))
+    assert hash(first) != hash(Campaign.from_json(client, {'id': 's1'}))
+
+# Tests that timestamps stay raw until read and parse to the same value as dateutil.
+def test_timestamps_parse_lazily() -> None:
+    import datetime as dt
+    from dateutil import parser as dateparser
+    from pysnapchatads.helpers import parse_timestamp
+
+    client = SnapchatMarketing(access_token='test_token')
+    campaign = Campaign.from_json(client, {'id': 'c1', 'created_at': '2023-01-01T00:00:00.123Z', 'start_time': 'Jan 5 2023 10:00 UTC'})
+
+    assert object.__getattribute__(campaign, '_raw_created_at') == '2023-01-01T00:00:00.123Z'
+    assert campaign.created_at == dt.datetime(2023, 1, 1, 0, 0, 0, 123000, tzinfo=dt.timezone.utc)
+    assert object.__getattribute__(campaign, '_raw_created_at') is campaign.created_at
+    assert campaign.start_time == dateparser.parse('Jan 5 2023 10:00 UTC')
+    assert not hasattr(campaign, 'end_time')
+    assert parse_timestamp('2023-06-01T12:30:00.000-07:00') == dateparser.parse('2023-06-01T12:30:00.000-07:00')
+
+    campaign.end_time = '2023-02-01T00:00:00.000Z'
+    assert campaign._dirty_fields() == {'end_time': dt.datetime(2023, 2, 1, tzinfo=dt.timezone.utc)}
@@ -0,0 +1,84 @@
+import csv
+import gzip
+import json
+import pathlib
+
+import pytest
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.export import export_entities, export_stats
+from pysnapchatads.reporting.analytics import Stats, decode_series
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+def mock_listing(requests_mock: requests_mock.Mocker) -> None:
+    requests_mock.get(f'{BASE}/campaigns/c1/adsquads', json={'adsquads': [
+        {'sub_request_status': 'SUCCESS', 'adsquad': {'id': 's1', 'status': 'ACTIVE', 'type': 'SNAP_ADS', 'bid_micro': 1000000, 'targeting': {'geos': [{'country_code': 'us'}]}, 'start_time': '2023-01-01T00:00:00.000Z'}},
+        {'id': 's2', 'status': 'PAUSED', 'bid_micro': 2000000}
+    ], 'paging': {'next_link': f'{BASE}/page2'}})
+    requests_mock.get(f'{BASE}/page2', json={'adsquads': [{'id': 's3', 'status': 'ACTIVE', 'daily_budget_micro': 5000000}], 'paging': {}})
+
+
+def campaign_stats() -> Stats:
+    def series(id: str, spend: list) -> object:
+        return decode_series({'id': id, 'timeseries': [
+            {'start_time': f'2023-01-0{i + 1}T00:00:00.000Z', 'end_time': f'2023-01-0{i + 2}T00:00:00.000Z', 'stats': {'spend': v}}
+            for i, v in enumerate(spend)
+        ]})
+
+    return Stats(series('c1', [3, 4]), {'s1': series('s1', [3, 4])})
+
+
+# Tests that a paged listing streams into gzipped NDJSON and CSV with field-named columns.
+def test_export_entities(requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    fields = ['id', 'status', 'adsquad_type', 'bid_micro', 'daily_budget_micro', 'targeting', 'start_time']
+
+    mock_listing(requests_mock)
+    assert export_entities(client, 'campaigns', 'c1', 'adsquads', tmp_path / 'squads.ndjson.gz', fields=fields, chunk_size=2) == 3
+    with gzip.open(tmp_path / 'squads.ndjson.gz') as f:
+        rows = [json.loads(line) for line in f]
+    assert rows[0] == {'id': 's1', 'status': 'ACTIVE', 'adsquad_type': 'SNAP_ADS', 'bid_micro': 1000000, 'targeting': {'geos': [{'country_code': 'us'}]}, 'start_time': '2023-01-01T00:00:00.000Z'}
+    assert rows[2] == {'id': 's3', 'status': 'ACTIVE', 'daily_budget_micro': 5000000}
+
+    assert export_entities(client, 'campaigns', 'c1', 'adsquads', tmp_path / 'squads.csv', fields=fields) == 3
+    with open(tmp_path / 'squads.csv', newline='') as f:
+        table = list(csv.reader(f))
+    assert table[0] == fields
+    assert table[1][5] == '{"geos":[{"country_code":"us"}]}'
+    assert table[3] == ['s3', 'ACTIVE', '', '', '5000000', '', '']
+
+
+# Tests that a paged listing streams into Parquet, one row group per chunk.
+def test_export_entities_parquet(requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    pq = pytest.importorskip('pyarrow.parquet')
+    client = SnapchatMarketing(access_token='test_token')
+    fields = ['id', 'status', 'adsquad_type', 'bid_micro', 'daily_budget_micro', 'targeting', 'start_time']
+
+    mock_listing(requests_mock)
+    assert export_entities(client, 'campaigns', 'c1', 'adsquads', tmp_path / 'squads.parquet', fields=fields, chunk_size=2) == 3
+    parquet = pq.ParquetFile(tmp_path / 'squads.parquet')
+    assert parquet.metadata.num_row_groups == 2
+    data = parquet.read().to_pydict()
+    assert data['adsquad_type'] == ['SNAP_ADS', None, None]
+    assert data['bid_micro'] == [1000000, 2000000, None]
+    assert str(data['start_time'][0]) == '2023-01-01 00:00:00+00:00'
+
+
+# Tests that stats export one row per entity and interval, including breakdown series.
+def test_export_stats(tmp_path: pathlib.Path) -> None:
+    assert export_stats(iter([campaign_stats()]), tmp_path / 'stats.csv') == 4
+    with open(tmp_path / 'stats.csv', newline='') as f:
+        table = list(csv.reader(f))
+    assert table[0] == ['id', 'start_time', 'end_time', 'spend']
+    assert table[1] == ['c1', '2023-01-01T00:00:00.000000Z', '2023-01-02T00:00:00.000000Z', '3']
+    assert table[4][0] == 's1'
+
+
+# Tests that stats export to Parquet with numeric metric columns.
+def test_export_stats_parquet(tmp_path: pathlib.Path) -> None:
+    pq = pytest.importorskip('pyarrow.parquet')
+    assert export_stats([campaign_stats()], tmp_path / 'stats.parquet', compression='zstd') == 4
+    assert pq.read_table(tmp_path / 'stats.parquet').column('spend').to_pylist() == [3.0, 4.0, 3.0, 4.0]
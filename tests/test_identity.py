@@ -0,0 +1,44 @@
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.objects.ad_squads import AdSquad
+from pysnapchatads.objects.campaigns import Campaign
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+# Tests that reads of the same id share one object, refreshed in place without losing unsaved edits.
+def test_same_id_is_same_object() -> None:
+    client = SnapchatMarketing(access_token='test_token', identity_map=True)
+
+    first = Campaign.from_json(client, {'id': 'c1', 'name': 'a', 'status': 'ACTIVE'})
+    first.name = 'edited'
+    second, = Campaign.from_json_many(client, [{'id': 'c1', 'name': 'b', 'status': 'PAUSED'}])
+
+    assert second is first
+    assert first.name == 'edited'
+    assert first.status == 'PAUSED'
+    assert Campaign.from_json(SnapchatMarketing(access_token='test_token', identity_map=True), {'id': 'c1'}) is not first
+    assert Campaign.from_json(SnapchatMarketing(access_token='test_token'), {'id': 'c1'}).id == 'c1'
+
+
+# Tests that relationships load once, are cached, and resolve to already-loaded objects.
+def test_relationships_are_cached(requests_mock) -> None:
+    client = SnapchatMarketing(access_token='test_token', identity_map=True)
+    listing = requests_mock.get(
+        f'{BASE}/campaigns/c1/adsquads',
+        json={'adsquads': [{'id': 's1', 'campaign_id': 'c1'}, {'id': 's2', 'campaign_id': 'c1'}]}
+    )
+    single = requests_mock.get(f'{BASE}/campaigns/c1', json={'campaigns': [{'campaign': {'id': 'c1', 'name': 'a'}}]})
+
+    squad = AdSquad.from_json(client, {'id': 's1', 'campaign_id': 'c1'})
+    campaign = squad.campaign
+    assert campaign.id == 'c1' and squad.campaign is campaign
+    assert single.call_count == 1
+
+    squads = campaign.ad_squads
+    assert squads[0] is squad and campaign.ad_squads is squads
+    assert squads[1].campaign is campaign
+    assert listing.call_count == 1 and single.call_count == 1
+
+    del campaign.ad_squads
+    campaign.ad_squads
+    assert listing.call_count == 2
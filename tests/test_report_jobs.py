@@ -0,0 +1,79 @@
+import json
+import pathlib
+
+import pytest
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.errors import StatsError
+from pysnapchatads.objects.ad_accounts import AdAccount
+from pysnapchatads.objects.ads import Ad
+from pysnapchatads.reporting.jobs import ReportJobManager, iter_stat_items
+
+BASE = 'https://adsapi.snapchat.com/v1'
+RESULT_URL = 'https://storage.example.com/report.json?signature=abc'
+
+
+def stat(id: str, spend: int) -> dict:
+    return {'sub_request_status': 'SUCCESS', 'timeseries_stat': {'id': id, 'granularity': 'DAY', 'timeseries': [
+        {'start_time': '2023-01-01T00:00:00.000Z', 'end_time': '2023-01-02T00:00:00.000Z', 'stats': {'spend': spend}}
+    ]}}
+
+
+# Tests that stats items decode one by one however the body is split into chunks.
+def test_iter_stat_items_chunks() -> None:
+    body = json.dumps({'request_status': 'SUCCESS', 'timeseries_stats': [stat('a1', 1), stat('a2', 2)]}).encode()
+    for size in (1, 7, len(body)):
+        items = list(iter_stat_items(body[i:i + size] for i in range(0, len(body), size)))
+        assert [item['timeseries_stat']['id'] for _, item in items] == ['a1', 'a2']
+        assert {key for key, _ in items} == {'timeseries_stats'}
+    assert list(iter_stat_items([b'{"request_status": "SUCCESS", "total_stats": []}'])) == []
+
+
+# Tests that jobs are polled until complete, resumed from the journal, and streamed once.
+def test_report_jobs_poll_resume_and_download(requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    account = AdAccount(api_client=client, id='a1')
+    journal = tmp_path / 'jobs.db'
+
+    requests_mock.get(f'{BASE}/adaccounts/a1/stats', json={'request_status': 'SUCCESS', 'async_stats_reports': [{'report_run_id': 'r1', 'async_status': 'STARTED'}]})
+    job = ReportJobManager(client, journal, min_interval=0).submit(account, fields=['spend'], start_time='2023-01-01', end_time='2023-01-02')
+    assert 'async=true' in requests_mock.last_request.url
+    assert job.params['fields'] == 'spend'
+
+    # a new process picks the job up from the journal
+    manager = ReportJobManager(client, journal, min_interval=0)
+    assert [j.report_run_id for j in manager.jobs] == ['r1']
+
+    requests_mock.get(f'{BASE}/adaccounts/a1/stats_report', [
+        {'json': {'async_stats_reports': [{'report_run_id': 'r1', 'async_status': 'RUNNING'}]}},
+        {'json': {'async_stats_reports': [{'report_run_id': 'r1', 'async_status': 'COMPLETED', 'result': RESULT_URL}]}}
+    ])
+    requests_mock.get(RESULT_URL, content=json.dumps({'timeseries_stats': [stat('a1', 5)]}).encode())
+
+    finished = list(manager.wait(timeout=5))
+    assert [j.status for j in finished] == ['COMPLETED']
+
+    stats = list(manager.iter_results(finished[0]))
+    assert 'Authorization' not in requests_mock.last_request.headers
+    assert stats[0].series['spend'].tolist() == [5]
+    assert manager.jobs == []
+    assert ReportJobManager(client, journal).jobs == []
+
+
+# Tests that failed jobs raise and that ad-level jobs need an account to poll under.
+def test_report_jobs_failures(requests_mock: requests_mock.Mocker) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    manager = ReportJobManager(client, min_interval=0)
+
+    with pytest.raises(ValueError):
+        manager.submit(Ad(api_client=client, id='ad1'))
+
+    requests_mock.get(f'{BASE}/ads/ad1/stats', json={'async_stats_reports': [{'report_run_id': 'r2', 'async_status': 'STARTED'}]})
+    requests_mock.get(f'{BASE}/adaccounts/a1/stats_report', json={'async_stats_reports': [{'report_run_id': 'r2', 'async_status': 'FAILED'}]})
+    manager.submit(Ad(api_client=client, id='ad1'), ad_account_id='a1')
+
+    job, = manager.wait(timeout=5)
+    with pytest.raises(StatsError):
+        list(manager.iter_results(job))
+    assert manager.jobs == []
@@ -0,0 +1,85 @@
+import pytest
+import requests
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.retry import RetryPolicy
+import pysnapchatads.errors as errors
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+def make_client(**kwargs) -> SnapchatMarketing:
+    return SnapchatMarketing(access_token='test_token', retry_policy=RetryPolicy(backoff_base=0, **kwargs))
+
+
+# Tests that a transient 5xx on a later page is retried without losing earlier pages.
+def test_paginator_retries_transient_errors(requests_mock: requests_mock.Mocker) -> None:
+    api_client = make_client()
+    requests_mock.get(
+        f'{BASE}/adaccounts/a1/campaigns',
+        json={'campaigns': [{'id': 'c1'}], 'paging': {'next_link': f'{BASE}/page2'}}
+    )
+    requests_mock.get(f'{BASE}/page2', [
+        {'status_code': 503},
+        {'exc': requests.ConnectionError},
+        {'exc': requests.exceptions.ChunkedEncodingError},
+        {'json': {'campaigns': [{'id': 'c2'}], 'paging': {}}}
+    ])
+
+    results = api_client._get_many_entities('adaccounts', 'a1', 'campaigns', limit=1)
+
+    assert [r['id'] for r in results] == ['c1', 'c2']
+    assert api_client.retry_policy.stats.retries == 3
+
+
+# Tests that an exhausted page keeps partial results and can be resumed from its link.
+def test_pagination_resumes_from_failed_link(requests_mock: requests_mock.Mocker) -> None:
+    api_client = make_client(max_attempts=2)
+    requests_mock.get(
+        f'{BASE}/adaccounts/a1/campaigns',
+        json={'campaigns': [{'id': 'c1'}], 'paging': {'next_link': f'{BASE}/page2'}}
+    )
+    requests_mock.get(f'{BASE}/page2', status_code=502)
+
+    with pytest.raises(errors.PaginationError) as info:
+        api_client._get_many_entities('adaccounts', 'a1', 'campaigns', limit=1)
+
+    assert info.value.status_code == 502
+    assert info.value.next_link == f'{BASE}/page2'
+    assert [r['id'] for r in info.value.results] == ['c1']
+    assert api_client.retry_policy.stats.exhausted == 1
+
+    requests_mock.get(f'{BASE}/page2', json={'campaigns': [{'id': 'c2'}], 'paging': {}})
+    pages = list(api_client._resume_paginator(info.value.next_link, 'campaigns'))
+
+    assert [[r['id'] for r in page] for page in pages] == [['c2']]
+
+
+# Tests that creates are only retried when POST retries are enabled.
+def test_post_is_not_retried_by_default(requests_mock: requests_mock.Mocker) -> None:
+    requests_mock.post(f'{BASE}/adaccounts/a1/campaigns', status_code=500)
+
+    api_client = make_client()
+    with pytest.raises(requests.HTTPError):
+        api_client._create_entities('adaccounts', 'a1', 'campaigns', data=[{'name': 'c'}])
+    assert requests_mock.call_count == 1
+
+    api_client = make_client(retry_post=True, max_attempts=3)
+    with pytest.raises(requests.HTTPError):
+        api_client._create_entities('adaccounts', 'a1', 'campaigns', data=[{'name': 'c'}])
+    assert requests_mock.call_count == 4
+
+
+def test_retry_budget_limits_retries() -> None:
+    policy = RetryPolicy(backoff_base=0, max_attempts=10, budget_max=2, budget_ratio=0)
+
+    class Response(object):
+        status_code = 503
+
+        def close(self) -> None:
+            pass
+
+    assert policy.execute('GET', Response).status_code == 503
+    assert policy.stats.retries == 2
+    assert policy.stats.budget_denied == 1
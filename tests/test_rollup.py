@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.objects.ads import Ad
+from pysnapchatads.objects.ad_squads import AdSquad
+from pysnapchatads.objects.campaigns import Campaign
+from pysnapchatads.reporting.analytics import decode_series
+from pysnapchatads.reporting.rollup import rollup
+
+
+def series(ad_id: str, days: dict) -> object:
+    return decode_series({'id': ad_id, 'timeseries': [
+        {'start_time': f'2023-01-0{day}T00:00:00.000Z', 'stats': stats} for day, stats in days.items()
+    ]})
+
+
+# Tests that ad stats sum up every level through the parent links and that ratios follow the sums.
+def test_rollup_levels_and_ratios() -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    ads = [Ad(client, id=f'ad{i}', ad_squad_id=squad) for i, squad in enumerate(['s1', 's1', 's2', 's3'])]
+    squads = [AdSquad(client, id='s1', campaign_id='c1'), AdSquad(client, id='s2', campaign_id='c1'), AdSquad(client, id='s3', campaign_id='c2')]
+    campaigns = [Campaign(client, id='c1', ad_account_id='a1'), Campaign(client, id='c2', ad_account_id='a1')]
+
+    result = rollup({
+        'ad0': series('ad0', {1: {'impressions': 1000, 'swipes': 10, 'spend': 2000000}, 2: {'impressions': 500, 'swipes': 5, 'spend': 1000000}}),
+        'ad1': series('ad1', {2: {'impressions': 500, 'swipes': 20, 'spend': 1000000, 'conversion_purchases': 2}}),
+        'ad2': series('ad2', {1: {'impressions': 0, 'swipes': 0, 'spend': 0}}),
+    }, ads, squads, campaigns)
+
+    assert result['ad'].ids == ['ad0', 'ad1', 'ad2', 'ad3']
+    assert result['ad']['impressions'].tolist() == [[1000, 500], [0, 500], [0, 0], [0, 0]]
+    assert result['adsquad'].ids == ['s1', 's2', 's3']
+    assert result['adsquad']['spend'].tolist() == [[2000000, 2000000], [0, 0], [0, 0]]
+    assert result['campaign']['impressions'].tolist() == [[1000, 1000], [0, 0]]
+    assert result['adaccount'].ids == ['a1']
+    assert result['adaccount'].total('swipes').tolist() == [35]
+
+    squads_level = result['adsquad']
+    assert squads_level.cpm()[squads_level.row('s1')].tolist() == [2000000.0, 2000000.0]  # 2 currency units per thousand, in micros
+    assert np.isnan(squads_level.ctr(total=True)[squads_level.row('s2')])
+    assert result['adaccount'].ctr(total=True).tolist() == [35 / 2000]
+    assert result['campaign'].ecpa(total=True)[0] == 2000000.0
+
+    with pytest.raises(ValueError):
+        rollup({'ad9': series('ad9', {1: {'spend': 1}})}, ads, squads, campaigns)
+    with pytest.raises(ValueError):
+        rollup({}, ads, squads[:1], campaigns)
@@ -0,0 +1,78 @@
+import threading
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.scheduler import RequestScheduler, TokenBucket
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+# Tests that a throttled page is re-sent after Retry-After instead of failing the listing.
+def test_throttled_page_is_retried(requests_mock: requests_mock.Mocker) -> None:
+    scheduler = RequestScheduler(requests_per_second=1000, initial_concurrency=4, decrease_cooldown=0)
+    api_client = SnapchatMarketing(access_token='test_token', scheduler=scheduler)
+    requests_mock.get(
+        f'{BASE}/adaccounts/a1/campaigns',
+        json={'campaigns': [{'id': 'c1'}], 'paging': {'next_link': f'{BASE}/page2'}}
+    )
+    requests_mock.get(f'{BASE}/page2', [
+        {'status_code': 429, 'headers': {'Retry-After': '0'}},
+        {'json': {'campaigns': [{'id': 'c2'}], 'paging': {}}}
+    ])
+
+    results = api_client._get_many_entities('adaccounts', 'a1', 'campaigns', limit=1)
+
+    assert [r['id'] for r in results] == ['c1', 'c2']
+    stats = scheduler.stats
+    assert stats.throttle_events == 1
+    assert stats.requests == 3
+    assert stats.queue_depth == 0
+    assert stats.in_flight == 0
+    # multiplicative decrease on throttle, then additive increase on the success that followed
+    assert 2 <= scheduler.concurrency_limit < 4
+
+
+def test_concurrency_limit_is_respected() -> None:
+    scheduler = RequestScheduler(requests_per_second=1000, initial_concurrency=2, max_concurrency=2)
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    class Response(object):
+        status_code = 200
+
+    def send():
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        threading.Event().wait(0.01)
+        with lock:
+            in_flight.pop()
+        return Response()
+
+    threads = [threading.Thread(target=scheduler.execute, args=('token', send)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert max(peak) <= 2
+    assert scheduler.stats.requests == 8
+
+
+def test_token_bucket_pause_blocks_tokens() -> None:
+    bucket = TokenBucket(rate=1000, capacity=1)
+    bucket.pause(0.05)
+    assert bucket.acquire() >= 0.04
+
+
+# Tests that server errors shrink the concurrency limit instead of counting as successes.
+def test_server_errors_decrease_concurrency() -> None:
+    scheduler = RequestScheduler(requests_per_second=1000, initial_concurrency=8, decrease_cooldown=0)
+
+    class Response(object):
+        status_code = 503
+
+    assert scheduler.execute('token', Response).status_code == 503
+    assert scheduler.concurrency_limit == 4
+    assert scheduler.stats.throttle_events == 0
@@ -0,0 +1,79 @@
+import pathlib
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.store import SQLiteEntityStore
+from pysnapchatads.objects.campaigns import Campaign
+
+BASE = 'https://adsapi.snapchat.com/v1'
+
+
+# Tests that a second client sharing the store file starts warm, without the network.
+def test_listing_is_served_from_store_across_clients(requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'entities.sqlite'
+    requests_mock.get(
+        f'{BASE}/adaccounts/a1/campaigns',
+        json={'campaigns': [{'id': 'c1', 'ad_account_id': 'a1', 'updated_at': '2023-01-01T00:00:00Z'}]}
+    )
+
+    first = SnapchatMarketing(access_token='test_token', store=SQLiteEntityStore(path))
+    assert [c['id'] for c in first._get_many_entities('adaccounts', 'a1', 'campaigns', read_deleted_entities=True)] == ['c1']
+
+    second = SnapchatMarketing(access_token='test_token', store=SQLiteEntityStore(path))
+    assert [c['id'] for c in second._get_many_entities('adaccounts', 'a1', 'campaigns', read_deleted_entities=True)] == ['c1']
+    assert requests_mock.call_count == 1
+
+    campaigns = second.load_stored('campaigns', 'adaccounts', 'a1')
+    assert isinstance(campaigns[0], Campaign)
+    assert campaigns[0].ad_account_id == 'a1'
+
+    # different listing parameters are a different listing
+    second._get_many_entities('adaccounts', 'a1', 'campaigns', read_deleted_entities=False)
+    assert requests_mock.call_count == 2
+
+
+# Tests that entities stored from wrapped API responses load back without the network.
+def test_wrapped_reads_round_trip_through_store(requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    requests_mock.get(
+        f'{BASE}/adaccounts/a1',
+        json={'adaccounts': [{'sub_request_status': 'SUCCESS', 'adaccount': {'id': 'a1', 'name': 'A', 'type': 'PARTNER'}}]}
+    )
+    client = SnapchatMarketing(access_token='test_token', store=SQLiteEntityStore(tmp_path / 'entities.sqlite'))
+
+    # the network and the store give the same shape
+    fetched = client._get_single_entity('adaccounts', 'a1')
+    assert fetched == [{'id': 'a1', 'name': 'A', 'type': 'PARTNER'}]
+    assert client._get_single_entity('adaccounts', 'a1') == fetched
+
+    assert client.get_single_ad_account('a1').name == 'A'
+    assert client.get_single_ad_account('a1').account_type == 'PARTNER'
+    assert requests_mock.call_count == 1
+
+    accounts = client.load_stored('adaccounts')
+    assert [(a.id, a.name) for a in accounts] == [('a1', 'A')]
+
+
+def test_stale_entries_go_back_to_the_network(tmp_path: pathlib.Path) -> None:
+    store = SQLiteEntityStore(tmp_path / 'entities.sqlite', max_age={'adaccounts': 0, 'organizations': None})
+    store.put_many('adaccounts', [{'id': 'a1'}])
+    store.put_many('organizations', [{'sub_request_status': 'SUCCESS', 'organization': {'id': 'o1'}}])
+
+    assert store.get('adaccounts', 'a1') is None
+    assert store.get('organizations', 'o1') == {'id': 'o1'}
+
+
+def test_older_versions_do_not_replace_newer_ones(tmp_path: pathlib.Path) -> None:
+    store = SQLiteEntityStore(tmp_path / 'entities.sqlite', max_age=None)
+    store.put_many('campaigns', [{'id': 'c1', 'name': 'new', 'updated_at': '2023-02-01T00:00:00Z'}])
+    store.put_many('campaigns', [{'id': 'c1', 'name': 'old', 'updated_at': '2023-01-01T00:00:00Z'}])
+
+    assert store.get('campaigns', 'c1')['name'] == 'new'
+
+
+def test_relisting_replaces_members(tmp_path: pathlib.Path) -> None:
+    store = SQLiteEntityStore(tmp_path / 'entities.sqlite', max_age=None)
+    store.put_listing('campaigns', 'c1', 'adsquads', [{'id': 's1'}, {'id': 's2'}])
+    store.put_listing('campaigns', 'c1', 'adsquads', [{'id': 's2'}])
+
+    assert store.get_listing('campaigns', 'c1', 'adsquads') == [{'id': 's2'}]
+    assert store.get_listing('adaccounts', 'a1', 'adsquads') is None
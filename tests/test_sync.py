@@ -0,0 +1,67 @@
+import pathlib
+import requests_mock
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.store import SQLiteEntityStore
+from pysnapchatads.sync import IncrementalSync, SyncState
+from pysnapchatads.objects.campaigns import Campaign
+
+BASE = 'https://adsapi.snapchat.com/v1'
+URL = f'{BASE}/adaccounts/a1/campaigns'
+
+
+def campaign(id: str, updated_at: str, **kwargs) -> dict:
+    return {'sub_request_status': 'SUCCESS', 'campaign': {'id': id, 'ad_account_id': 'a1', 'updated_at': updated_at, **kwargs}}
+
+
+# Tests that only created, updated and deleted campaigns are emitted after the first sync.
+def test_sync_emits_only_changes(requests_mock: requests_mock.Mocker) -> None:
+    client = SnapchatMarketing(access_token='test_token')
+    sync = IncrementalSync(client)
+
+    requests_mock.get(URL, json={'campaigns': [
+        campaign('c1', '2023-01-01T00:00:00Z'),
+        campaign('c2', '2023-01-02T00:00:00Z'),
+        campaign('c3', '2023-01-03T00:00:00Z')
+    ]})
+    first = sync.sync('adaccounts', 'a1', 'campaigns')
+    assert sorted(c.id for c in first.created) == ['c1', 'c2', 'c3']
+    assert isinstance(first.created[0], Campaign)
+    assert first.watermark == '2023-01-03T00:00:00Z'
+
+    requests_mock.get(URL, json={'campaigns': [
+        campaign('c1', '2023-01-01T00:00:00Z'),
+        campaign('c2', '2023-01-05T00:00:00Z', name='renamed'),
+        campaign('c3', '2023-01-04T00:00:00Z', deleted=True),
+        campaign('c5', '2023-01-06T00:00:00Z')
+    ]})
+    second = sync.sync('adaccounts', 'a1', 'campaigns')
+    assert [c.id for c in second.created] == ['c5']
+    assert [c.id for c in second.updated] == ['c2']
+    assert second.updated[0].name == 'renamed'
+    assert second.deleted == ['c3']
+    assert second.scanned == 4
+
+    # a campaign missing from the listing was removed outright
+    requests_mock.get(URL, json={'campaigns': [
+        campaign('c2', '2023-01-05T00:00:00Z'),
+        campaign('c5', '2023-01-06T00:00:00Z')
+    ]})
+    third = sync.sync('adaccounts', 'a1', 'campaigns')
+    assert not third.created and not third.updated
+    assert third.deleted == ['c1']
+
+    assert requests_mock.last_request.qs['read_deleted_entities'] == ['true']
+
+
+def test_state_persists_and_changes_reach_the_store(requests_mock: requests_mock.Mocker, tmp_path: pathlib.Path) -> None:
+    requests_mock.get(URL, json={'campaigns': [campaign('c1', '2023-01-01T00:00:00Z')]})
+
+    store = SQLiteEntityStore(tmp_path / 'entities.sqlite', max_age=None)
+    client = SnapchatMarketing(access_token='test_token', store=store)
+    assert len(IncrementalSync(client, state=SyncState(tmp_path / 'sync.sqlite')).sync('adaccounts', 'a1', 'campaigns')) == 1
+    assert store.get('campaigns', 'c1')['updated_at'] == '2023-01-01T00:00:00Z'
+
+    # a new process picks up from the persisted watermark
+    resumed = IncrementalSync(client, state=SyncState(tmp_path / 'sync.sqlite'))
+    assert not resumed.sync('adaccounts', 'a1', 'campaigns')
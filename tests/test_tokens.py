@@ -0,0 +1,79 @@
+import concurrent.futures
+import json
+import threading
+import time
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.tokens import TokenManager
+
+BASE = 'https://adsapi.snapchat.com/v1'
+OAUTH = 'https://accounts.snapchat.com/login/oauth2/access_token'
+
+
+# Tests that a request rejected with a 401 is sent once more with a refreshed token.
+def test_request_racing_expiry_is_retried_with_new_token(requests_mock) -> None:
+    oauth = requests_mock.post(OAUTH, json={'access_token': 'new', 'expires_in': 1800, 'refresh_token': 'r2'})
+
+    def respond(request, context):
+        if request.headers['Authorization'] != 'Bearer new':
+            context.status_code = 401
+            return {}
+        return {'campaigns': [{'campaign': {'id': 'c1'}}]}
+
+    api = requests_mock.get(f'{BASE}/campaigns/c1', json=respond)
+    manager = TokenManager('id', 'secret', 'r1', access_token='old')
+    client = SnapchatMarketing(access_token='old', token_manager=manager)
+
+    assert client._get_single_entity('campaigns', 'c1') == [{'id': 'c1'}]
+    assert api.call_count == 2 and oauth.call_count == 1
+    assert 'refresh_token=r1' in oauth.last_request.text
+    assert client.session.headers['Authorization'] == 'Bearer new'
+    assert manager.stats == (1, 0, 1)
+
+
+# Tests that tokens are refreshed once before expiry and shared with other processes through the token file.
+def test_token_refreshed_before_expiry_and_shared(requests_mock, tmp_path) -> None:
+    oauth = requests_mock.post(OAUTH, json={'access_token': 'new', 'expires_in': 1800})
+    token_file = str(tmp_path / 'token.json')
+
+    manager = TokenManager('id', 'secret', 'r1', access_token='old', expires_at=time.time() + 60, token_file=token_file)
+    assert manager.is_expiring()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        # threads arriving during the refresh keep the old token, which is still valid
+        assert set(pool.map(lambda _: manager.get_token(), range(32))) <= {'old', 'new'}
+    assert manager.get_token() == 'new'
+    assert oauth.call_count == 1
+
+    with open(token_file) as f:
+        assert json.load(f)['refresh_token'] == 'r1'
+
+    # another process starting up picks the fresh token from the file
+    other = TokenManager('id', 'secret', 'r1', token_file=token_file)
+    assert other.get_token() == 'new'
+    assert oauth.call_count == 1 and other.stats.shared == 1
+
+
+# Tests that while one thread refreshes a still valid token, other callers and stats do not wait for it.
+def test_refresh_does_not_block_other_callers(requests_mock) -> None:
+    started, release = threading.Event(), threading.Event()
+
+    def respond(request, context):
+        started.set()
+        release.wait(5)
+        return {'access_token': 'new', 'expires_in': 1800}
+
+    requests_mock.post(OAUTH, json=respond)
+    manager = TokenManager('id', 'secret', 'r1', access_token='old', expires_at=time.time() + 60)
+
+    refresher = threading.Thread(target=manager.get_token)
+    refresher.start()
+    assert started.wait(5)
+    try:
+        assert manager.get_token() == 'old'
+        assert manager.stats == (0, 0, 0)
+    finally:
+        release.set()
+        refresher.join()
+
+    assert manager.get_token() == 'new'
+    assert manager.stats.refreshes == 1
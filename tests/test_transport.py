@@ -0,0 +1,62 @@
+import http.server
+import json
+import threading
+import typing
+import pytest
+
+from pysnapchatads.snapchat import SnapchatMarketing
+from pysnapchatads.transport import TransportAdapter
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        body = json.dumps({'campaigns': [{'id': 'c1'}]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: typing.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> typing.Iterator[str]:
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/v1'
+    server.shutdown()
+    server.server_close()
+
+
+# Tests that keep-alive connections are reused and counted as pool hits.
+def test_pool_metrics_count_reused_connections(server_url: str) -> None:
+    api_client = SnapchatMarketing(access_token='test_token', transport=TransportAdapter(pool_maxsize=2, read_timeout=5))
+    api_client.BASE_URL = server_url
+
+    for _ in range(3):
+        assert api_client._get_many_entities('adaccounts', 'a1', 'campaigns') == [{'id': 'c1'}]
+
+    stats = api_client.transport.stats
+    assert stats.checkouts == 3
+    assert stats.new_connections == 1
+    assert stats.pool_hits == 2
+
+
+def test_keep_alive_disabled_opens_new_connections(server_url: str) -> None:
+    api_client = SnapchatMarketing(access_token='test_token', transport=TransportAdapter(keep_alive=False))
+    api_client.BASE_URL = server_url
+
+    for _ in range(2):
+        api_client._get_many_entities('adaccounts', 'a1', 'campaigns')
+
+    assert api_client.transport.stats.new_connections == 2
+
+
+def test_default_timeout() -> None:
+    assert TransportAdapter().default_timeout is None
+    assert TransportAdapter(connect_timeout=3, read_timeout=30).default_timeout == (3, 30)